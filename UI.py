@@ -1,5 +1,4 @@
 from colorama import init, Fore, Style
-from tqdm import tqdm
 
 init(autoreset=True)
 
@@ -22,11 +21,16 @@ def pedir_texto():
     print(Fore.GREEN + "\nPor favor, ingresa el texto, ruta de archivo o URL para convertir:")
     return input(Fore.WHITE + Style.NORMAL + "> ")
 
+def pedir_paginas():
+    print(Fore.GREEN + "\nPáginas a convertir (p.ej. 40-55 o 1,3,10-12; vacío para todas):")
+    return input(Fore.WHITE + Style.NORMAL + "> ")
+
 def mensaje_procesando():
     print(Fore.BLUE + "\nProcesando texto...\n")
 
 def mostrar_progreso(iterable, desc="Progreso"):
     # Usa tqdm sobre el iterable real de tu pipeline (bloques, frases, etc)
+    from tqdm import tqdm  # Solo se importa si se muestra una barra
     return tqdm(iterable, desc=desc, colour="magenta")
 
 def resultado_final(ruta):
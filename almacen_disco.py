@@ -0,0 +1,126 @@
+"""
+Almacén en disco con expulsión LRU, compartido por las cachés persistentes.
+
+CacheFragmentos (audio sintetizado) y CacheExtraccion (texto extraído) solo se diferencian en
+cómo serializan cada entrada; la disposición de los archivos, la escritura atómica y la
+expulsión viven aquí.
+"""
+import os
+import tempfile
+import threading
+
+class AlmacenLRU:
+    """
+    Directorio de entradas direccionadas por una clave hexadecimal, con un presupuesto de bytes.
+
+    Cada entrada es un archivo <directorio>/<clave[:2]>/<clave><extension>. Las escrituras son
+    atómicas (archivo temporal + os.replace), así que varios procesos pueden compartir el
+    directorio y un lector nunca ve una entrada a medias. La política de expulsión es LRU según
+    la fecha de modificación, que el lector actualiza con usar() en cada acierto.
+    """
+    def __init__(self, directorio, extension, limite_bytes, nombre="Caché", logger=None):
+        """
+        Inicializa el almacén.
+        Args:
+            directorio (str): Directorio donde se guardan las entradas.
+            extension (str): Extensión de los archivos de entrada (p.ej. ".wav").
+            limite_bytes (int): Tamaño máximo aproximado del almacén en disco.
+            nombre (str): Nombre de la caché en los mensajes de log.
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        self.directorio = directorio
+        self.extension = extension
+        self.limite_bytes = limite_bytes
+        self.nombre = nombre
+        self.logger = logger
+        self._lock = threading.Lock()
+        os.makedirs(directorio, exist_ok=True)
+        self._bytes = sum(tamano for _, tamano, _ in self._entradas())
+
+    def ruta(self, clave) -> str:
+        """
+        Ruta del archivo de la entrada (exista o no).
+        """
+        return os.path.join(self.directorio, clave[:2], clave + self.extension)
+
+    @staticmethod
+    def usar(ruta) -> None:
+        """
+        Marca la entrada como usada recientemente.
+        """
+        os.utime(ruta)
+
+    def escribir(self, clave, serializar, binario=True) -> bool:
+        """
+        Escribe una entrada de forma atómica y aplica el presupuesto de bytes.
+        Args:
+            clave (str): Clave de la entrada.
+            serializar (callable): Recibe el archivo abierto y escribe el contenido.
+            binario (bool): Si el archivo se abre en modo binario o como texto UTF-8.
+        Returns:
+            bool: True si la entrada se ha guardado.
+        """
+        ruta = self.ruta(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+        try:
+            with (os.fdopen(descriptor, "wb") if binario
+                  else os.fdopen(descriptor, "w", encoding="utf-8")) as salida:
+                serializar(salida)
+            tamano = os.path.getsize(temporal)
+            try:
+                anterior = os.path.getsize(ruta)  # Al sobrescribir una clave, su tamaño deja de contar
+            except FileNotFoundError:
+                anterior = 0
+            os.replace(temporal, ruta)
+        except Exception as e:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            if self.logger:
+                self.logger.error(f"{self.nombre}: no se pudo guardar {clave[:12]}: {e}")
+            return False
+
+        with self._lock:
+            self._bytes += tamano - anterior
+            if self._bytes > self.limite_bytes:
+                self._expulsar()
+        return True
+
+    def _entradas(self):
+        """
+        Lista las entradas del almacén como tuplas (ruta, tamaño, fecha de último uso).
+        """
+        entradas = []
+        for raiz, _, archivos in os.walk(self.directorio):
+            for nombre in archivos:
+                if not nombre.endswith(self.extension):
+                    continue
+                ruta = os.path.join(raiz, nombre)
+                try:
+                    estado = os.stat(ruta)
+                except FileNotFoundError:
+                    continue
+                entradas.append((ruta, estado.st_size, estado.st_mtime))
+        return entradas
+
+    def _expulsar(self):
+        """
+        Elimina las entradas usadas hace más tiempo hasta bajar del 90% del límite.
+        Se vuelve a leer el directorio porque otros procesos pueden haberlo modificado.
+        """
+        entradas = sorted(self._entradas(), key=lambda entrada: entrada[2])
+        total = sum(tamano for _, tamano, _ in entradas)
+        objetivo = self.limite_bytes * 0.9
+        eliminadas = 0
+        for ruta, tamano, _ in entradas:
+            if total <= objetivo:
+                break
+            try:
+                os.remove(ruta)
+                eliminadas += 1
+            except FileNotFoundError:
+                pass
+            total -= tamano
+        self._bytes = total
+        if self.logger:
+            self.logger.info(f"{self.nombre}: {eliminadas} entradas expulsadas, {total} bytes en uso.")
@@ -0,0 +1,70 @@
+"""
+Benchmark de arranque: tiempo de importación de cada fase del programa.
+
+Importa cada módulo en un intérprete nuevo con `python -X importtime` y resume el informe:
+tiempo total de importación (mediana de varias repeticiones), tiempo de pared del proceso
+y los módulos que más tardan en cargarse. Las dependencias pesadas (nltk, newspaper, bs4,
+PyPDF2, gTTS...) solo deberían aparecer al usarlas, no al importar las fases.
+
+Uso:
+    python benchmarks/bench_arranque.py [repeticiones] [modulos ...]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FASES_DEFAULT = (
+    ("extracción", "extraccion_validacion.gestionador"),
+    ("procesado", "procesado_datos.gestionador"),
+    ("audio", "convertor_audio.gestionador"),
+    ("programa", "main"),
+)
+REPETICIONES_DEFAULT = 5
+MODULOS_MOSTRADOS = 5
+PROPIOS = {"extraccion_validacion", "procesado_datos", "convertor_audio", "main", "UI", "Logger", "carga_perezosa"}
+
+def medir_importacion(modulo):
+    """
+    Importa el módulo en un proceso nuevo con -X importtime (None: solo el arranque del intérprete).
+    Returns: (tiempo de pared en s, {módulo: tiempo acumulado en us}) de la importación
+    """
+    comando = [sys.executable, "-X", "importtime", "-c", f"import {modulo}" if modulo else "pass"]
+    inicio = time.perf_counter()
+    proceso = subprocess.run(comando, cwd=RAIZ, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                             text=True, check=True)
+    pared = time.perf_counter() - inicio
+
+    acumulados = {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        _, _, acumulado, nombre = (campo.strip() for campo in linea.replace(":", "|", 1).split("|"))
+        acumulados[nombre] = max(acumulados.get(nombre, 0), int(acumulado))
+    return pared, acumulados
+
+def main(repeticiones, fases):
+    # Lo que el intérprete ya importa al arrancar (site, .pth...) no se atribuye a ninguna fase
+    _, arranque = medir_importacion(None)
+    print(f"{'fase':>10} | {'módulo':<34} | {'import (ms)':>11} | {'proceso (ms)':>12}")
+    print("-" * 78)
+    for fase, modulo in fases:
+        medidas = [medir_importacion(modulo) for _ in range(repeticiones)]
+        importacion = statistics.median(acumulados.get(modulo, 0) for _, acumulados in medidas) / 1000
+        pared = statistics.median(pared for pared, _ in medidas) * 1000
+        print(f"{fase:>10} | {modulo:<34} | {importacion:>11.1f} | {pared:>12.1f}")
+
+        # Paquetes externos más lentos de la última repetición (solo paquetes raíz, sin submódulos)
+        _, acumulados = medidas[-1]
+        ajenos = sorted(((tiempo, nombre) for nombre, tiempo in acumulados.items()
+                         if "." not in nombre and nombre not in PROPIOS and nombre not in arranque), reverse=True)
+        for tiempo, nombre in ajenos[:MODULOS_MOSTRADOS]:
+            print(f"{'':>10} |   {nombre:<32} | {tiempo / 1000:>11.1f} |")
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    repeticiones = int(argumentos.pop(0)) if argumentos and argumentos[0].isdigit() else REPETICIONES_DEFAULT
+    main(repeticiones, [(modulo.split(".")[0], modulo) for modulo in argumentos] or FASES_DEFAULT)
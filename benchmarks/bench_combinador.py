@@ -0,0 +1,57 @@
+"""
+Benchmark de CombinadorAudio: tiempo de combinación frente al número de fragmentos.
+
+Compara la concatenación acumulativa con += (comportamiento anterior, cuadrático)
+con la combinación en bloque de CombinadorAudio.combinar (lineal).
+
+Uso:
+    python benchmarks/bench_combinador.py [n1 n2 ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydub import AudioSegment
+from convertor_audio.combinador import CombinadorAudio
+
+CANTIDADES_DEFAULT = (100, 500, 1000, 2000, 4000)
+
+def crear_fragmentos(cantidad):
+    """
+    Alterna fragmentos de "voz" (24 kHz, como gTTS) y silencios (11025 Hz, como AudioSegment.silent).
+    """
+    voz = AudioSegment.silent(duration=800, frame_rate=24000)
+    archivos = []
+    for i in range(cantidad):
+        if i % 2:
+            archivos.append((AudioSegment.silent(duration=300), "silencio_300ms"))
+        else:
+            archivos.append((voz, f"fragmento_{i}.mp3"))
+    return archivos
+
+def combinar_acumulativo(archivos):
+    audio_final = AudioSegment.empty()
+    for audio, _ in archivos:
+        audio_final += audio
+    return audio_final
+
+def medir(funcion, archivos):
+    inicio = time.perf_counter()
+    resultado = funcion(archivos)
+    return time.perf_counter() - inicio, resultado
+
+def main(cantidades):
+    combinador = CombinadorAudio()
+    print(f"{'fragmentos':>10} | {'+= (s)':>10} | {'bloque (s)':>10} | {'mejora':>8}")
+    print("-" * 48)
+    for cantidad in cantidades:
+        archivos = crear_fragmentos(cantidad)
+        t_acumulativo, esperado = medir(combinar_acumulativo, archivos)
+        t_bloque, obtenido = medir(combinador.combinar, archivos)
+        assert len(obtenido) == len(esperado), "La combinación en bloque cambió la duración"
+        print(f"{cantidad:>10} | {t_acumulativo:>10.3f} | {t_bloque:>10.3f} | {t_acumulativo / t_bloque:>7.1f}x")
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or CANTIDADES_DEFAULT)
@@ -0,0 +1,50 @@
+"""
+Benchmark de decodificación de fragmentos mp3: fragmentos decodificados por segundo.
+
+Compara la ruta actual (una invocación de ffmpeg por fragmento, AudioSegment.from_file)
+con DecodificadorLotes (una sola invocación de ffmpeg para todo el lote).
+Los fragmentos se generan con ffmpeg con los mismos parámetros que devuelve gTTS
+(MPEG-2 Layer III, 24 kHz, mono, 32 kbps).
+
+Uso:
+    python benchmarks/bench_decodificador.py [n1 n2 ...]
+"""
+import os
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydub.utils import get_encoder_name
+from convertor_audio.decodificador import DecodificadorIndividual, DecodificadorLotes
+
+CANTIDADES_DEFAULT = (10, 50, 200)
+
+def crear_fragmento(duracion):
+    comando = [get_encoder_name(), "-loglevel", "error", "-f", "lavfi",
+               "-i", f"sine=frequency={random.randint(200, 800)}:duration={duracion}",
+               "-ar", "24000", "-ac", "1", "-b:a", "32k", "-f", "mp3", "pipe:1"]
+    return subprocess.run(comando, stdout=subprocess.PIPE, check=True).stdout
+
+def medir(decodificador, fragmentos):
+    inicio = time.perf_counter()
+    audios = decodificador.decodificar(fragmentos)
+    return time.perf_counter() - inicio, audios
+
+def main(cantidades):
+    random.seed(0)
+    individual, lotes = DecodificadorIndividual(), DecodificadorLotes()
+    print(f"{'fragmentos':>10} | {'individual (frag/s)':>19} | {'lote (frag/s)':>13} | {'mejora':>7}")
+    print("-" * 60)
+    for cantidad in cantidades:
+        fragmentos = [crear_fragmento(round(random.uniform(0.5, 3.0), 2)) for _ in range(cantidad)]
+        t_individual, esperados = medir(individual, fragmentos)
+        t_lote, obtenidos = medir(lotes, fragmentos)
+        desviacion = max(abs(len(a) - len(b)) for a, b in zip(esperados, obtenidos))
+        print(f"{cantidad:>10} | {cantidad / t_individual:>19.1f} | {cantidad / t_lote:>13.1f} | "
+              f"{t_individual / t_lote:>6.1f}x  (desviación máx. {desviacion} ms)")
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or CANTIDADES_DEFAULT)
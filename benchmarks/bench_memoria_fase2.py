@@ -0,0 +1,58 @@
+"""
+Benchmark de memoria de la fase 2 (procesado_datos.Gestionador.procesado_datos).
+
+Procesa un texto largo (por defecto texto.txt repetido hasta el tamaño de un libro) y mide con
+tracemalloc el pico de memoria del procesado, la memoria que ocupa el resultado y el número de
+bloques de memoria vivos que lo forman (sys.getallocatedblocks), además del tiempo.
+
+Necesita los datos de NLTK (stopwords, punkt_tab) o el paquete de recursos NLP.
+
+Uso:
+    python benchmarks/bench_memoria_fase2.py [caracteres] [archivo de texto]
+"""
+import gc
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from procesado_datos.gestionador import Gestionador
+
+ARCHIVO_DEFAULT = os.path.join(RAIZ, "texto.txt")
+CARACTERES_DEFAULT = 500_000  # Del orden de un libro corto
+
+def main(caracteres, archivo):
+    with open(archivo, encoding="utf-8") as entrada:
+        base = entrada.read()
+    texto = (base * (caracteres // max(len(base), 1) + 1))[:caracteres]
+    gestionador = Gestionador(logger=logging.getLogger("bench_memoria_fase2"), motor_tokens='regex')
+    gestionador.procesado_datos(base)  # carga de modelos y cachés fuera de la medida
+
+    gc.collect()
+    bloques = sys.getallocatedblocks()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = gestionador.procesado_datos(texto)
+    segundos = time.perf_counter() - inicio
+    gc.collect()
+    retenida, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    bloques = sys.getallocatedblocks() - bloques
+    if resultado is None:
+        sys.exit("El procesado ha fallado (¿faltan los datos de NLTK?)")
+
+    tokens = sum(len(segmento['tokens_idioma']) for segmento in resultado)
+    print(f"Texto: {len(texto)} caracteres, {len(resultado)} líneas, {tokens} tokens")
+    print(f"Tiempo (con tracemalloc): {segundos:.2f} s")
+    print(f"Pico de memoria:          {pico / 2 ** 20:.1f} MiB")
+    print(f"Memoria del resultado:    {retenida / 2 ** 20:.1f} MiB ({retenida / tokens:.0f} B/token)")
+    print(f"Bloques vivos:            {bloques} ({bloques / tokens:.1f} por token)")
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    caracteres = int(argumentos.pop(0)) if argumentos and argumentos[0].isdigit() else CARACTERES_DEFAULT
+    main(caracteres, argumentos[0] if argumentos else ARCHIVO_DEFAULT)
@@ -0,0 +1,83 @@
+"""
+Benchmark de los motores de tokenización de la fase 2 (ObtenerTokens).
+
+Antes de medir comprueba, con el corpus de referencia (benchmarks/corpus_tokenizador.txt, en
+español e inglés, con comillas, abreviaturas, contracciones y puntuación variada), que el motor
+'regex' produce exactamente las mismas oraciones y tokens que el motor 'nltk' y que las
+posiciones que guarda corresponden al texto. Después mide tokens por segundo de cada motor sobre
+el corpus repetido.
+
+Necesita los datos de Punkt de NLTK o el paquete de recursos NLP (procesado_datos/recursos_nlp.py).
+
+Uso:
+    python benchmarks/bench_tokenizador.py [repeticiones] [archivos de texto ...]
+"""
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from procesado_datos.procesar_texto import ObtenerTokens
+
+CORPUS_DEFAULT = os.path.join(RAIZ, "benchmarks", "corpus_tokenizador.txt")
+REPETICIONES_DEFAULT = 50
+MOTORES = ('nltk', 'regex')
+COMILLAS = {'``': ('"', "''", '``'), "''": ('"', "''")}
+
+def comprobar(textos):
+    """
+    Compara la salida de los dos motores párrafo a párrafo.
+    Returns: Número de diferencias encontradas (se muestran las primeras)
+    """
+    referencia, rapido = ObtenerTokens(motor='nltk'), ObtenerTokens(motor='regex')
+    diferencias = 0
+    for texto in textos:
+        esperado = [(segmento['linea'], segmento['tokens']) for segmento in referencia.procesar(texto)]
+        obtenido = rapido.procesar(texto)
+        if esperado != [(segmento['linea'], segmento['tokens']) for segmento in obtenido]:
+            diferencias += 1
+            if diferencias <= 5:
+                print(f"  distinto: {texto[:70]!r}...")
+            continue
+        plano = texto.replace('\n', ' ')
+        for segmento in obtenido:
+            posiciones = segmento['posiciones']
+            for token, inicio, fin in zip(segmento['tokens'], posiciones[::2], posiciones[1::2]):
+                if plano[inicio:fin] != token and plano[inicio:fin] not in COMILLAS.get(token, ()):
+                    diferencias += 1
+                    print(f"  posición incorrecta de {token!r}: {plano[inicio:fin]!r}")
+    return diferencias
+
+def medir(motor, texto):
+    """
+    Returns: (segundos, tokens) de tokenizar el texto con el motor
+    """
+    tokenizador = ObtenerTokens(motor=motor)
+    tokenizador.procesar("Calentamiento. Primera llamada.")  # carga de NLTK y de los modelos
+    inicio = time.perf_counter()
+    segmentos = tokenizador.procesar(texto)
+    return time.perf_counter() - inicio, sum(len(segmento['tokens']) for segmento in segmentos)
+
+def main(repeticiones, archivos):
+    textos = []
+    for archivo in archivos:
+        with open(archivo, encoding="utf-8") as entrada:
+            textos.extend(parrafo for parrafo in entrada.read().split("\n") if parrafo.strip())
+
+    diferencias = comprobar(textos)
+    print(f"Comprobación con {len(textos)} párrafos: {'OK' if not diferencias else f'{diferencias} diferencias'}")
+
+    texto = " ".join(textos * repeticiones)
+    print(f"{'motor':>6} | {'tokens':>8} | {'tiempo (ms)':>11} | {'tokens/s':>10}")
+    print("-" * 46)
+    for motor in MOTORES:
+        segundos, tokens = medir(motor, texto)
+        print(f"{motor:>6} | {tokens:>8} | {segundos * 1000:>11.1f} | {tokens / segundos:>10.0f}")
+    return diferencias
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    repeticiones = int(argumentos.pop(0)) if argumentos and argumentos[0].isdigit() else REPETICIONES_DEFAULT
+    sys.exit(1 if main(repeticiones, argumentos or [CORPUS_DEFAULT]) else 0)
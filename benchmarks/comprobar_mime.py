@@ -0,0 +1,69 @@
+"""
+Comprobación de la detección de tipo MIME de la fase 1.
+
+Genera archivos de prueba (TXT y JSON pequeños, y JSON de más de 1 MiB cuyo inicio no basta
+para distinguirlo de texto plano) y comprueba que:
+    - ClasificadorTipoEntrada.describir() (sobre el archivo mapeado en memoria) y
+      detectar_mime_archivo() dan el mismo tipo que magic.from_file(ruta);
+    - la fase 1 (Gestionador.extraccion_y_validacion) valida y extrae el JSON grande completo.
+
+Uso:
+    python benchmarks/comprobar_mime.py
+"""
+import json
+import logging
+import os
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import magic
+
+from extraccion_validacion.gestionador import Gestionador
+from extraccion_validacion.tipo_datos import ClasificadorTipoEntrada, detectar_mime_archivo
+
+def generar_archivos(directorio):
+    """
+    Returns: {nombre: (ruta, caracteres de texto esperados en la extracción o None)}
+    """
+    archivos = {}
+    def escribir(nombre, contenido, esperados=None):
+        ruta = os.path.join(directorio, nombre)
+        with open(ruta, "w", encoding="utf-8") as salida:
+            salida.write(contenido)
+        archivos[nombre] = (ruta, esperados)
+
+    escribir("texto.txt", "Hola mundo.\nSegunda línea del texto.\n" * 100)
+    escribir("pequeno.json", json.dumps({"titulo": "Hola", "parrafos": ["uno", "dos"]}))
+    # Más de 1 MiB: 2.080.000 caracteres en cadenas, en una lista con sangría
+    parrafos = ["x" * 1000 for _ in range(2080)]
+    escribir("grande.json", json.dumps({"parrafos": parrafos}, indent=1), esperados=2080 * 1000)
+    escribir("grande_compacto.json", json.dumps(parrafos), esperados=2080 * 1000)
+    return archivos
+
+def main():
+    logger = logging.getLogger("comprobar_mime")
+    clasificador = ClasificadorTipoEntrada(logger=None)
+    gestionador = Gestionador(logger=logger)
+    fallos = 0
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre, (ruta, esperados) in generar_archivos(directorio).items():
+            referencia = magic.from_file(ruta, mime=True)
+            with clasificador.describir(ruta) as descriptor:
+                descrito = descriptor.mime
+            por_ruta = detectar_mime_archivo(ruta)
+            correcto = descrito == por_ruta == referencia
+            linea = f"{nombre:<22} {os.path.getsize(ruta):>9} B  from_file={referencia:<18} describir={descrito}"
+            if esperados is not None:
+                texto = gestionador.extraccion_y_validacion(ruta)
+                extraidos = len(texto) if texto else 0
+                correcto = correcto and extraidos >= esperados
+                linea += f"  extraídos={extraidos}"
+            print(("OK    " if correcto else "FALLO ") + linea)
+            fallos += not correcto
+    return fallos
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
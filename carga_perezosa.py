@@ -0,0 +1,41 @@
+"""
+Importación diferida de dependencias pesadas.
+
+Las librerías de extracción (PyPDF2, lxml, bs4, newspaper, requests), de procesado (nltk, langid)
+y de audio (gTTS, pyttsx3, pydub) tardan cientos de milisegundos en importarse. Con
+ModuloPerezoso el módulo se importa la primera vez que se usa uno de sus atributos, así que un
+texto pegado no paga la importación de las librerías que solo usan los archivos o las URLs.
+"""
+import importlib
+
+class ModuloPerezoso:
+    """
+    Sustituto de un módulo que lo importa en el primer acceso a un atributo.
+
+    Uso:
+        requests = ModuloPerezoso("requests")
+        requests.get(...)  # aquí se importa requests
+    """
+    def __init__(self, nombre: str):
+        """
+        Args:
+            nombre: Nombre completo del módulo (p.ej. "lxml.html")
+        """
+        self.__dict__['_nombre'] = nombre
+        self.__dict__['_modulo'] = None
+
+    def _cargar(self):
+        # importlib ya serializa la importación de un mismo módulo entre hilos
+        if self._modulo is None:
+            self.__dict__['_modulo'] = importlib.import_module(self._nombre)
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self._cargar(), atributo)
+
+    def __setattr__(self, atributo, valor):
+        setattr(self._cargar(), atributo, valor)
+
+    def __repr__(self):
+        estado = "cargado" if self._modulo is not None else "sin cargar"
+        return f"<ModuloPerezoso {self._nombre} ({estado})>"
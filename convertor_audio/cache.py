@@ -0,0 +1,97 @@
+import hashlib
+import json
+import unicodedata
+import wave
+from abc import ABC, abstractmethod
+from pydub import AudioSegment
+
+from almacen_disco import AlmacenLRU
+
+class ICacheFragmentos(ABC):
+    """
+    Interfaz para cachés de fragmentos de audio ya sintetizados.
+    """
+    @abstractmethod
+    def clave(self, motor, idioma, texto, parametros=None) -> str:
+        """
+        Calcula la clave de un fragmento.
+        Args:
+            motor (str): Nombre del motor TTS.
+            idioma (str): Idioma del fragmento.
+            texto (str): Texto que se envía al motor.
+            parametros (dict, optional): Parámetros de voz del motor.
+        Returns:
+            str: Clave hexadecimal del fragmento.
+        """
+        pass
+
+    @abstractmethod
+    def obtener(self, clave):
+        """
+        Devuelve el AudioSegment guardado para la clave o None si no está en caché.
+        """
+        pass
+
+    @abstractmethod
+    def guardar(self, clave, audio) -> None:
+        """
+        Guarda el AudioSegment decodificado bajo la clave.
+        """
+        pass
+
+class CacheFragmentos(ICacheFragmentos):
+    """
+    Caché persistente en disco de fragmentos sintetizados, direccionada por contenido.
+
+    La clave es un SHA-256 de (motor, idioma, texto normalizado, parámetros de voz) y el valor
+    es el audio ya decodificado en WAV, de modo que un acierto evita tanto la llamada al motor
+    como la decodificación del mp3. Los WAV se guardan en un AlmacenLRU: escritura atómica y
+    expulsión LRU según la fecha de último uso bajo un presupuesto de bytes configurable.
+
+    Varios procesos pueden compartir el mismo directorio: cualquier archivo desaparecido se trata
+    como un fallo de caché.
+    """
+    EXTENSION = ".wav"
+
+    def __init__(self, directorio, limite_bytes=512 * 1024 * 1024, logger=None):
+        """
+        Inicializa la caché.
+        Args:
+            directorio (str): Directorio donde se guardan los fragmentos.
+            limite_bytes (int): Tamaño máximo aproximado de la caché en disco.
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        self.logger = logger
+        self._almacen = AlmacenLRU(directorio, self.EXTENSION, limite_bytes, "Caché de fragmentos", logger)
+
+    def clave(self, motor, idioma, texto, parametros=None) -> str:
+        texto_normalizado = " ".join(unicodedata.normalize("NFC", texto).split())
+        contenido = json.dumps([motor, idioma, texto_normalizado, parametros or {}],
+                               sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
+
+    def obtener(self, clave):
+        ruta = self._almacen.ruta(clave)
+        try:
+            with wave.open(ruta, "rb") as archivo:
+                audio = AudioSegment(data=archivo.readframes(archivo.getnframes()),
+                                     sample_width=archivo.getsampwidth(),
+                                     frame_rate=archivo.getframerate(),
+                                     channels=archivo.getnchannels())
+            self._almacen.usar(ruta)  # Marca la entrada como usada recientemente
+        except (FileNotFoundError, EOFError, wave.Error):
+            return None
+        if self.logger:
+            self.logger.debug(f"Caché de fragmentos: acierto {clave[:12]}")
+        return audio
+
+    def guardar(self, clave, audio) -> None:
+        self._almacen.escribir(clave, lambda salida: self._escribir_wav(salida, audio))
+
+    @staticmethod
+    def _escribir_wav(salida, audio):
+        with wave.open(salida, "wb") as archivo:
+            archivo.setnchannels(audio.channels)
+            archivo.setsampwidth(audio.sample_width)
+            archivo.setframerate(audio.frame_rate)
+            archivo.writeframes(audio.raw_data)
@@ -1,5 +1,6 @@
 from pydub import AudioSegment
 from abc import ABC, abstractmethod
+from . import mp3
 
 class ICombinador(ABC):
     """
@@ -22,7 +23,9 @@ class ICombinador(ABC):
 
 class CombinadorAudio(ICombinador):
     """
-    Realiza la combinación secuencial de fragmentos de audio (voz y silencios) usando pydub.
+    Realiza la combinación de fragmentos de audio (voz y silencios) usando pydub.
+    Unifica una sola vez los parámetros de todos los fragmentos y copia su PCM en un único
+    buffer, en lugar de concatenar con += (que recopia el audio acumulado en cada paso).
     Puede loguear el proceso de combinación si se provee un logger.
     No exporta el archivo físico; la responsabilidad queda en el exportador.
     """
@@ -36,7 +39,7 @@ class CombinadorAudio(ICombinador):
 
     def combinar(self, archivos) -> AudioSegment:
         """
-        Concatena todos los fragmentos de audio en el orden original.
+        Concatena todos los fragmentos de audio en el orden original en tiempo lineal.
         Filtra fragmentos None y distingue silencios en los logs.
         Args:
             archivos (list): Lista de tuplas (AudioSegment, nombre_fragmento).
@@ -48,7 +51,7 @@ class CombinadorAudio(ICombinador):
         if not archivos:
             raise ValueError("No hay archivos para combinar.")
 
-        audio_final = AudioSegment.empty()
+        fragmentos = []
         for idx, (audio, nombre_fragmento) in enumerate(archivos):
             if audio is None:
                 if self.logger:
@@ -60,8 +63,101 @@ class CombinadorAudio(ICombinador):
             else:
                 if self.logger:
                     self.logger.debug(f"Agregando fragmento: {nombre_fragmento}")
-            audio_final += audio
+            fragmentos.append(audio)
+
+        if not fragmentos:
+            return AudioSegment.empty()
+
+        frame_rate, sample_width, channels = self.parametros_comunes(fragmentos)
+        datos = [self.normalizar(audio, frame_rate, sample_width, channels).raw_data for audio in fragmentos]
+        if self.logger:
+            self.logger.debug(f"Combinando {len(datos)} fragmentos, {sum(map(len, datos))} bytes PCM "
+                              f"({frame_rate} Hz, {sample_width * 8} bits, {channels} canales).")
+        # bytes.join calcula el tamaño total y copia cada fragmento una única vez en el buffer final
+        audio_final = AudioSegment(data=b"".join(datos), sample_width=sample_width,
+                                   frame_rate=frame_rate, channels=channels)
 
         if self.logger:
             self.logger.info("Combinación de audio completada exitosamente.")
-        return audio_final
\ No newline at end of file
+        return audio_final
+
+    @staticmethod
+    def parametros_comunes(fragmentos):
+        """
+        Elige los parámetros de salida: la mayor frecuencia, ancho de muestra y número de canales,
+        igual que haría pydub al sumar los fragmentos de dos en dos.
+        Args:
+            fragmentos (list[AudioSegment]): Fragmentos a combinar.
+        Returns:
+            tuple: (frame_rate, sample_width, channels)
+        """
+        return (max(audio.frame_rate for audio in fragmentos),
+                max(audio.sample_width for audio in fragmentos),
+                max(audio.channels for audio in fragmentos))
+
+    @staticmethod
+    def normalizar(audio, frame_rate, sample_width, channels) -> AudioSegment:
+        """
+        Convierte un fragmento a los parámetros dados (sin copia si ya coinciden).
+        """
+        return audio.set_frame_rate(frame_rate).set_sample_width(sample_width).set_channels(channels)
+
+class CombinadorMP3:
+    """
+    Combina fragmentos mp3 en el dominio comprimido: une directamente sus tramas e inserta
+    tramas silenciosas precalculadas para las pausas, sin decodificar ni recodificar nada
+    (más rápido y sin una generación extra de pérdida de calidad). Las cabeceras Xing/Info de
+    los fragmentos se descartan y el resultado lleva una nueva con la duración total.
+    Solo es aplicable si todos los fragmentos comparten versión MPEG, frecuencia y canales;
+    en otro caso combinar() devuelve None y el llamador debe usar la ruta PCM.
+    """
+    def __init__(self, logger=None):
+        """
+        Args:
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        self.logger = logger
+
+    def combinar(self, fragmentos):
+        """
+        Args:
+            fragmentos (list[bytes | int]): En orden, el mp3 de cada fragmento de voz
+                o la duración en ms de cada pausa.
+        Returns:
+            bytes | None: El mp3 combinado, o None si los fragmentos no son compatibles.
+        """
+        flujos = {}
+        referencia = None
+        for indice, fragmento in enumerate(fragmentos):
+            if isinstance(fragmento, int):
+                continue
+            flujo = mp3.analizar(fragmento)
+            if flujo is None:
+                return self._incompatible(f"fragmento {indice} sin tramas mp3 válidas")
+            parametros = (flujo.version, flujo.frecuencia, flujo.canales)
+            if referencia is None:
+                referencia = parametros
+                cabecera = mp3.leer_cabecera(flujo.datos)
+            elif parametros != referencia:
+                return self._incompatible(f"fragmento {indice} con parámetros {parametros} distintos de {referencia}")
+            flujos[indice] = flujo
+        if referencia is None:
+            return self._incompatible("no hay fragmentos de voz")
+
+        silencio = mp3.trama_silencio(cabecera)
+        muestras_por_milisegundo = cabecera.frecuencia / 1000
+        partes = []
+        for indice, fragmento in enumerate(fragmentos):
+            if isinstance(fragmento, int):
+                tramas = round(fragmento * muestras_por_milisegundo / cabecera.muestras)
+                partes.append(silencio * tramas)
+            else:
+                partes.append(flujos[indice].datos)
+        if self.logger:
+            self.logger.info(f"Combinación mp3 directa de {len(flujos)} fragmentos completada.")
+        return mp3.anadir_cabecera_xing(b"".join(partes), cabecera)
+
+    def _incompatible(self, motivo):
+        if self.logger:
+            self.logger.info(f"Combinación mp3 directa no aplicable ({motivo}); se usa la ruta PCM.")
+        return None
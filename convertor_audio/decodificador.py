@@ -0,0 +1,101 @@
+import io
+import subprocess
+from abc import ABC, abstractmethod
+from pydub import AudioSegment
+from pydub.utils import get_encoder_name
+from . import mp3
+
+class IDecodificador(ABC):
+    """
+    Interfaz para decodificadores de fragmentos mp3 a AudioSegment.
+    """
+    @abstractmethod
+    def decodificar(self, fragmentos) -> list:
+        """
+        Decodifica una lista de fragmentos mp3.
+        Args:
+            fragmentos (list[bytes]): Contenido mp3 de cada fragmento.
+        Returns:
+            list[AudioSegment | None]: Audio de cada fragmento, en el mismo orden (None si falla).
+        """
+        pass
+
+class DecodificadorIndividual(IDecodificador):
+    """
+    Decodifica cada fragmento con su propia invocación de ffmpeg (comportamiento de pydub).
+    """
+    def __init__(self, logger=None):
+        self.logger = logger
+
+    def decodificar(self, fragmentos) -> list:
+        audios = []
+        for datos in fragmentos:
+            try:
+                audios.append(AudioSegment.from_file(io.BytesIO(datos), format="mp3"))
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error al decodificar fragmento mp3: {e}")
+                audios.append(None)
+        return audios
+
+class DecodificadorLotes(IDecodificador):
+    """
+    Decodifica muchos fragmentos mp3 con una sola invocación de ffmpeg.
+
+    Las tramas de todos los fragmentos se concatenan en un único flujo mp3 que se envía a ffmpeg
+    por su entrada estándar; el PCM resultante se reparte después entre los fragmentos según el
+    número de muestras conocido de cada uno (tramas x muestras por trama).
+    Requiere que todos los fragmentos compartan frecuencia y canales; si no es así, o si el lote
+    falla, se recurre a la decodificación individual.
+    """
+    def __init__(self, logger=None, sample_width=2):
+        """
+        Args:
+            logger (object, optional): Logger para auditoría y debugging.
+            sample_width (int): Bytes por muestra del PCM decodificado.
+        """
+        self.logger = logger
+        self.sample_width = sample_width
+        self.individual = DecodificadorIndividual(logger)
+
+    def decodificar(self, fragmentos) -> list:
+        if not fragmentos:
+            return []
+        flujos = [mp3.analizar(datos) for datos in fragmentos]
+        parametros = {(flujo.frecuencia, flujo.canales) for flujo in flujos if flujo}
+        if None in flujos or len(parametros) != 1:
+            if self.logger:
+                self.logger.debug("Decodificación en lote no aplicable (parámetros distintos); se decodifica uno a uno.")
+            return self.individual.decodificar(fragmentos)
+
+        frecuencia, canales = parametros.pop()
+        try:
+            pcm = self._decodificar_flujo(b"".join(flujo.datos for flujo in flujos), frecuencia, canales)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error en la decodificación en lote: {e}; se decodifica uno a uno.")
+            return self.individual.decodificar(fragmentos)
+
+        ancho_trama = self.sample_width * canales
+        audios = []
+        inicio = 0
+        for indice, flujo in enumerate(flujos):
+            # El último fragmento se queda con el resto, por si el decodificador añade o quita muestras
+            fin = len(pcm) if indice == len(flujos) - 1 else min(len(pcm), inicio + flujo.muestras * ancho_trama)
+            audios.append(AudioSegment(data=pcm[inicio:fin], sample_width=self.sample_width,
+                                       frame_rate=frecuencia, channels=canales))
+            inicio = fin
+        if self.logger:
+            self.logger.debug(f"Decodificados {len(flujos)} fragmentos mp3 en una invocación de ffmpeg.")
+        return audios
+
+    def _decodificar_flujo(self, datos, frecuencia, canales) -> bytes:
+        """
+        Decodifica un flujo mp3 completo a PCM crudo con una sola invocación de ffmpeg.
+        """
+        comando = [get_encoder_name(), "-loglevel", "error", "-f", "mp3", "-i", "pipe:0",
+                   "-f", f"s{self.sample_width * 8}le", "-ar", str(frecuencia), "-ac", str(canales), "pipe:1"]
+        proceso = subprocess.run(comando, input=datos, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if proceso.returncode != 0:
+            raise RuntimeError(proceso.stderr.decode(errors="replace").strip())
+        return proceso.stdout
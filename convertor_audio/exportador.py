@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+import subprocess
+import tempfile
+import wave
 from pydub import AudioSegment
+from pydub.utils import get_encoder_name
+from .combinador import CombinadorAudio
 
 class IExportador(ABC):
     """
@@ -53,4 +58,111 @@ class Exportador(IExportador):
             if self.logger:
                 self.logger.error(f"Error al exportar archivo {ruta_final}: {e}")
             raise
-        
\ No newline at end of file
+
+class ExportadorStreaming:
+    """
+    Exportador incremental: recibe los fragmentos a medida que se generan y los escribe
+    directamente en el archivo de salida, sin construir nunca el audio completo en memoria.
+
+    Para 'wav' escribe el PCM con el módulo wave; para cualquier otro formato (mp3, ogg, ...)
+    alimenta por una tubería el PCM crudo a un proceso ffmpeg que codifica sobre la marcha.
+    Todos los fragmentos se convierten a unos parámetros de salida fijos antes de escribirse.
+    """
+    def __init__(self, logger=None, frame_rate=24000, sample_width=2, channels=1):
+        """
+        Inicializa el exportador.
+        Args:
+            logger (object, optional): Logger para auditoría y debugging.
+            frame_rate (int): Frecuencia de muestreo de la salida (24 kHz es la nativa de gTTS).
+            sample_width (int): Bytes por muestra de la salida.
+            channels (int): Canales de la salida.
+        """
+        self.logger = logger
+        self.frame_rate = frame_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self.ruta = None
+        self._wav = None
+        self._proceso = None
+        self._errores = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        if self.ruta:
+            self.cerrar()
+
+    def abrir(self, nombre: str, formato: str = "mp3") -> str:
+        """
+        Abre el archivo de salida.
+        Args:
+            nombre (str): Nombre del archivo final (sin extensión).
+            formato (str): Formato del archivo ('wav', 'mp3', 'ogg', ...).
+        Returns:
+            str: Ruta del archivo que se está escribiendo.
+        """
+        if self.ruta:
+            raise RuntimeError(f"Ya hay una exportación abierta: {self.ruta}")
+        ruta = f"{nombre}.{formato}"
+        if formato == "wav":
+            self._wav = wave.open(ruta, "wb")
+            self._wav.setnchannels(self.channels)
+            self._wav.setsampwidth(self.sample_width)
+            self._wav.setframerate(self.frame_rate)
+        else:
+            comando = [get_encoder_name(), "-y", "-loglevel", "error",
+                       "-f", f"s{self.sample_width * 8}le", "-ar", str(self.frame_rate),
+                       "-ac", str(self.channels), "-i", "pipe:0", "-f", formato, ruta]
+            # Los mensajes de ffmpeg van a un archivo temporal: una tubería que nadie lee mientras se
+            # escribe el PCM se llenaría en un job largo con avisos y bloquearía a ffmpeg y al escritor
+            self._errores = tempfile.TemporaryFile()
+            self._proceso = subprocess.Popen(comando, stdin=subprocess.PIPE,
+                                             stdout=subprocess.DEVNULL, stderr=self._errores)
+        self.ruta = ruta
+        if self.logger:
+            self.logger.debug(f"Exportación en streaming abierta: {ruta}")
+        return ruta
+
+    def escribir(self, audio: AudioSegment) -> None:
+        """
+        Escribe un fragmento en la salida. El llamador puede soltar el fragmento en cuanto vuelve.
+        Args:
+            audio (AudioSegment): Fragmento de voz o silencio. Los None se ignoran.
+        """
+        if audio is None:
+            return
+        if not self.ruta:
+            raise RuntimeError("No hay ninguna exportación abierta.")
+        datos = CombinadorAudio.normalizar(audio, self.frame_rate, self.sample_width, self.channels).raw_data
+        if self._wav:
+            self._wav.writeframes(datos)
+        else:
+            self._proceso.stdin.write(datos)
+
+    def cerrar(self) -> str:
+        """
+        Cierra la salida (finaliza la cabecera WAV o espera a que el codificador termine).
+        Returns:
+            str: Ruta del archivo final exportado.
+        Raises:
+            RuntimeError: Si el codificador termina con error.
+        """
+        ruta, self.ruta = self.ruta, None
+        if self._wav:
+            self._wav.close()
+            self._wav = None
+        elif self._proceso:
+            proceso, self._proceso = self._proceso, None
+            archivo_errores, self._errores = self._errores, None
+            proceso.stdin.close()
+            with archivo_errores:
+                if proceso.wait() != 0:
+                    archivo_errores.seek(0)
+                    errores = archivo_errores.read()
+                    if self.logger:
+                        self.logger.error(f"Error al exportar archivo {ruta}: {errores.decode(errors='replace')}")
+                    raise RuntimeError(f"El codificador terminó con código {proceso.returncode} al exportar {ruta}")
+        if self.logger:
+            self.logger.debug(f"Archivo exportado: {ruta}")
+        return ruta
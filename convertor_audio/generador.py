@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from gtts import gTTS
-import pyttsx3
 from pydub import AudioSegment
+import io
 import re
+import threading
+from .trabajadores import PoolPyttsx3
+from .planificador import restaurar_pausas
 
 class IGenerador(ABC):
     @abstractmethod
@@ -22,12 +24,47 @@ class Generador(IGenerador, ABC):
     Clase base abstracta para generación de audio por bloques y silencios.
     Procesa los tokens, separa fragmentos de voz y pausas, y delega a subclases
     la creación de cada fragmento concreto.
+    Si se provee una caché, los fragmentos ya sintetizados se reutilizan sin llamar al motor.
+    Si se provee un planificador, los fragmentos se agrupan hasta limite_caracteres por petición.
     """
-    def __init__(self, logger=None):
+    motor = None
+    limite_caracteres = 100
+
+    def __init__(self, logger=None, cache=None, planificador=None):
         self.logger = logger
+        self.cache = cache
+        self.planificador = planificador
 
     def generar(self, bloques_tokens, nombrador):
         archivos = []
+        plan = self.planificar(bloques_tokens)
+        self.precargar(plan, nombrador)
+        for item in plan:
+            archivos.extend(self.sintetizar_item(item, nombrador))
+        return archivos
+
+    def precargar(self, plan, nombrador):
+        """
+        Permite a un motor sintetizar de una vez todos los fragmentos de voz de un plan antes
+        de recorrerlo. El audio precargado se deja en item['audio'] / item['nombre'] y
+        sintetizar_item() lo usa en lugar de volver a llamar al motor. Por defecto no hace nada.
+        """
+        pass
+
+    def planificar(self, bloques_tokens, optimizar=True):
+        """
+        Separa los tokens de un bloque en fragmentos de voz y pausas, sin sintetizar nada.
+        Un fragmento de voz termina en cada silencio y en cada cambio de idioma.
+        Args:
+            bloques_tokens (list[dict]): Tokens expandidos del bloque.
+            optimizar (bool): Si se aplica el planificador (cuando lo hay) al plan resultante.
+        Returns:
+            list[dict]: Items en orden de documento:
+                {'tipo': 'voz', 'palabras': list[str], 'idioma': str}
+                {'tipo': 'silencio', 'duracion': int, 'token': str}
+                Con planificador, los items de voz agrupados llevan además 'pausas' y 'partes'.
+        """
+        plan = []
         bloque_palabras = []
         idioma_actual = None
 
@@ -38,26 +75,91 @@ class Generador(IGenerador, ABC):
             # Silencio / pausa
             if idioma is None and tiempo_silencio:
                 if bloque_palabras:
-                    audio, nombre = self._generar_fragmento_audio(bloque_palabras, idioma_actual, nombrador)
-                    if audio:
-                        archivos.append((audio, nombre))
+                    plan.append({'tipo': 'voz', 'palabras': bloque_palabras, 'idioma': idioma_actual})
                     bloque_palabras = []
-                archivos.append((AudioSegment.silent(duration=tiempo_silencio), f"silencio_{tiempo_silencio}ms"))
+                plan.append({'tipo': 'silencio', 'duracion': tiempo_silencio, 'token': token})
             else:
                 if idioma_actual and idioma != idioma_actual and bloque_palabras:
-                    audio, nombre = self._generar_fragmento_audio(bloque_palabras, idioma_actual, nombrador)
-                    if audio:
-                        archivos.append((audio, nombre))
+                    plan.append({'tipo': 'voz', 'palabras': bloque_palabras, 'idioma': idioma_actual})
                     bloque_palabras = []
                 bloque_palabras.append(token)
                 idioma_actual = idioma
 
         # Último bloque
         if bloque_palabras:
-            audio, nombre = self._generar_fragmento_audio(bloque_palabras, idioma_actual, nombrador)
+            plan.append({'tipo': 'voz', 'palabras': bloque_palabras, 'idioma': idioma_actual})
+        if optimizar and self.planificador:
+            plan = self.planificador.optimizar(plan, self.limite_caracteres)
+        return plan
+
+    def sintetizar_item(self, item, nombrador):
+        """
+        Sintetiza un único item del plan.
+        Args:
+            item (dict): Item producido por planificar().
+            nombrador: Objeto para generar filename temporal.
+        Returns:
+            list[tuple]: [(AudioSegment, nombre)] o lista vacía si el motor falla.
+        """
+        if item['tipo'] == 'silencio':
+            duracion = item['duracion']
+            return [(AudioSegment.silent(duration=duracion), f"silencio_{duracion}ms")]
+        if item.get('audio'):
+            audio, nombre = item.pop('audio'), item.pop('nombre', None)
+        else:
+            audio, nombre = self._sintetizar_voz(item['palabras'], item['idioma'], nombrador)
+        if not audio:
+            return []
+        if not item.get('pausas'):
+            return [(audio, nombre)]
+
+        # Item agrupado: se restauran las pausas exactas o, si no se puede, se sintetizan las partes
+        trozos = restaurar_pausas(audio, item['pausas'])
+        if trozos is None:
+            if self.logger:
+                self.logger.debug(f"No se pudieron restaurar {len(item['pausas'])} pausas; se sintetizan las partes por separado.")
+            archivos = []
+            for parte in item['partes']:
+                archivos.extend(self.sintetizar_item(parte, nombrador))
+            return archivos
+        return [(trozo, nombre if i % 2 == 0 else f"silencio_{len(trozo)}ms") for i, trozo in enumerate(trozos)]
+
+    def _sintetizar_voz(self, palabras, idioma, nombrador):
+        """
+        Sintetiza un fragmento de voz consultando antes la caché, si la hay.
+        Returns:
+            tuple: (AudioSegment, str) o (None, None) si falla.
+        """
+        clave = self._clave_cache(palabras, idioma)
+        if clave:
+            audio = self.cache.obtener(clave)
             if audio:
-                archivos.append((audio, nombre))
-        return archivos
+                return audio, f"cache_{clave[:12]}"
+        audio, nombre = self._generar_fragmento_audio(palabras, idioma, nombrador)
+        if audio and clave:
+            self.cache.guardar(clave, audio)
+        return audio, nombre
+
+    def _clave_cache(self, palabras, idioma):
+        """
+        Clave de caché del fragmento, o None si no hay caché.
+        """
+        if not self.cache:
+            return None
+        return self.cache.clave(self.motor, idioma, self._preparar_texto(palabras), self.parametros_voz())
+
+    @staticmethod
+    def _preparar_texto(palabras):
+        """
+        Une las palabras del fragmento y elimina comillas que el motor leería en voz alta.
+        """
+        return re.sub(r'["\']', '', " ".join(palabras))
+
+    def parametros_voz(self) -> dict:
+        """
+        Parámetros del motor que cambian el audio resultante (forman parte de la clave de caché).
+        """
+        return {}
 
     @abstractmethod
     def _generar_fragmento_audio(self, palabras, idioma, nombrador):
@@ -75,56 +177,160 @@ class Generador(IGenerador, ABC):
 class GTTS(Generador):
     """
     Generador de fragmentos de audio usando Google Text-to-Speech (gTTS).
-    Convierte bloques de texto y pausas en segmentos de audio,
-    asignando nombres únicos a cada archivo temporal mediante el nombrador.
+    Convierte bloques de texto y pausas en segmentos de audio.
+    El mp3 se recibe y decodifica en memoria; el nombrador solo se usa para etiquetar cada fragmento.
     """
-    def __init__(self, logger=None):
-        super().__init__(logger)
+    motor = "gtts"
+    limite_caracteres = 100  # gTTS divide en varias peticiones los textos de más de 100 caracteres
+
+    def __init__(self, logger=None, cache=None, tld="com", lento=False, planificador=None, decodificador=None):
+        super().__init__(logger, cache, planificador)
+        self.tld = tld
+        self.lento = lento
+        self.decodificador = decodificador
+
+    def parametros_voz(self) -> dict:
+        return {"tld": self.tld, "slow": self.lento}
+
+    def precargar(self, plan, nombrador):
+        """
+        Con un decodificador por lotes, descarga el mp3 de todos los fragmentos de voz del plan
+        que no estén en caché y los decodifica juntos con una sola invocación de ffmpeg.
+        """
+        if not self.decodificador:
+            return
+        pendientes = []
+        for item in plan:
+            if item['tipo'] != 'voz':
+                continue
+            clave = self._clave_cache(item['palabras'], item['idioma'])
+            audio = self.cache.obtener(clave) if clave else None
+            if audio:
+                item['audio'], item['nombre'] = audio, f"cache_{clave[:12]}"
+                continue
+            datos = self.obtener_mp3(item['palabras'], item['idioma'])
+            if datos:
+                pendientes.append((item, datos, clave))
+
+        audios = self.decodificador.decodificar([datos for _, datos, _ in pendientes])
+        for (item, _, clave), audio in zip(pendientes, audios):
+            if audio:
+                item['audio'], item['nombre'] = audio, nombrador.generar_nombre(item['palabras'], item['idioma'])
+                if clave:
+                    self.cache.guardar(clave, audio)
 
     def _generar_fragmento_audio(self, palabras, idioma, nombrador):
+        datos = self.obtener_mp3(palabras, idioma)
+        if not datos:
+            return None, None
+        try:
+            seg = AudioSegment.from_file(io.BytesIO(datos), format="mp3")
+            return seg, nombrador.generar_nombre(palabras, idioma)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error al generar audio gTTS: {e}")
+            return None, None
+
+    def obtener_mp3(self, palabras, idioma):
+        """
+        Sintetiza las palabras con gTTS y devuelve el mp3 sin decodificar.
+        Returns:
+            bytes | None: Audio mp3, o None si el idioma no está soportado o la petición falla.
+        """
         codigo_idioma = {"español": "es", "ingles": "en"}.get(idioma, None)
         if not codigo_idioma:
             if self.logger:
                 self.logger.warning(f"Idioma no soportado por gTTS: {idioma}")
-            return None, None
-        texto = " ".join(palabras)
-        texto = " ".join(palabras)
-        texto = re.sub(r'["\']', '', texto)
+            return None
         try:
-            tts = gTTS(text=texto, lang=codigo_idioma)
-            nombre_archivo = nombrador.generar_nombre(palabras, idioma)
-            tts.save(nombre_archivo)
-            seg = AudioSegment.from_file(nombre_archivo)
-            return seg, nombre_archivo
+            return self._sintetizar_mp3(self._preparar_texto(palabras), codigo_idioma)
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error al generar audio gTTS: {e}")
-            return None, None
+            return None
+
+    def _sintetizar_mp3(self, texto, codigo_idioma) -> bytes:
+        """
+        Sintetiza el texto con gTTS directamente en memoria, sin escribir archivos temporales.
+        Args:
+            texto (str): Texto ya preparado.
+            codigo_idioma (str): Código de idioma de gTTS ('es', 'en').
+        Returns:
+            bytes: Audio mp3 devuelto por el servicio.
+        """
+        from gtts import gTTS  # Se importa al sintetizar el primer fragmento (arrastra requests)
+        tts = gTTS(text=texto, lang=codigo_idioma, tld=self.tld, slow=self.lento)
+        buffer = io.BytesIO()
+        tts.write_to_fp(buffer)
+        return buffer.getvalue()
 
 class Pyttsx3(Generador):
     """
     Generador de fragmentos de audio usando pyttsx3.
     Convierte bloques de texto y pausas en segmentos de audio,
-    asignando nombres únicos a cada archivo temporal mediante el nombrador.
+    asignando nombres únicos a cada archivo temporal mediante el nombrador
+    (que debería apuntar al directorio de trabajo del job).
+    El motor se inicia una sola vez por instancia; como no es seguro entre hilos,
+    la síntesis se serializa con un lock.
     """
-    def __init__(self, logger=None):
-        super().__init__(logger)
+    motor = "pyttsx3"
+    limite_caracteres = 1000
+
+    def __init__(self, logger=None, cache=None, velocidad=150, volumen=1.0, planificador=None):
+        super().__init__(logger, cache, planificador)
+        self.velocidad = velocidad
+        self.volumen = volumen
+        self._lock = threading.Lock()
+        self._engine = None
+
+    def parametros_voz(self) -> dict:
+        return {"rate": self.velocidad, "volume": self.volumen}
 
     def _generar_fragmento_audio(self, palabras, idioma, nombrador):
-        texto = " ".join(palabras)
-        texto = " ".join(palabras)
-        texto = re.sub(r'["\']', '', texto)
+        with self._lock:
+            return self._sintetizar(palabras, idioma, nombrador)
+
+    def _sintetizar(self, palabras, idioma, nombrador):
+        texto = self._preparar_texto(palabras)
         try:
-            engine = pyttsx3.init()
-            engine.setProperty('rate', 150)
-            engine.setProperty('volume', 1.0)
-            engine.say(texto)
+            if self._engine is None:
+                import pyttsx3
+                self._engine = pyttsx3.init()
+                self._engine.setProperty('rate', self.velocidad)
+                self._engine.setProperty('volume', self.volumen)
             nombre_archivo = nombrador.generar_nombre(palabras, idioma)
-            engine.save_to_file(texto, nombre_archivo)
-            engine.runAndWait()
+            self._engine.save_to_file(texto, nombre_archivo)
+            self._engine.runAndWait()
             seg = AudioSegment.from_file(nombre_archivo)
             return seg, nombre_archivo
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error al generar audio pyttsx3: {e}")
-            return None, None
\ No newline at end of file
+            return None, None
+
+class Pyttsx3Procesos(Pyttsx3):
+    """
+    Variante de Pyttsx3 que delega la síntesis en un pool de procesos trabajadores de larga vida
+    (ver PoolPyttsx3). No necesita lock: varios hilos pueden enviar fragmentos a la vez
+    y cada uno lo sintetiza un proceso distinto.
+    """
+    def __init__(self, logger=None, cache=None, velocidad=150, volumen=1.0, procesos=None, planificador=None):
+        super().__init__(logger, cache, velocidad, volumen, planificador)
+        self.pool = PoolPyttsx3(procesos=procesos, velocidad=velocidad, volumen=volumen, logger=logger)
+
+    def _generar_fragmento_audio(self, palabras, idioma, nombrador):
+        texto = self._preparar_texto(palabras)
+        try:
+            nombre_archivo = self.pool.sintetizar(texto, nombrador.generar_nombre(palabras, idioma))
+            seg = AudioSegment.from_file(nombre_archivo)
+            return seg, nombre_archivo
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error al generar audio pyttsx3 (pool de procesos): {e}")
+            return None, None
+
+    def cerrar(self):
+        """
+        Detiene los procesos trabajadores del pool.
+        """
+        self.pool.cerrar()
@@ -1,11 +1,16 @@
+import os
 from .conversor import ConvertidorTextoVoz
-from .generador import GTTS, Pyttsx3
-from .combinador import CombinadorAudio
+from .generador import GTTS, Pyttsx3, Pyttsx3Procesos
+from .combinador import CombinadorAudio, CombinadorMP3
 from .nombre import NombreTemporal
 from .expandir_tokens import ExpansionToken
-from .exportador import Exportador
-from .limpiador import LimpiadorArchivos
-from tqdm import tqdm
+from .exportador import Exportador, ExportadorStreaming
+from .limpiador import DirectorioTrabajo
+from .paralelo import GeneradorParalelo
+from .cache import CacheFragmentos
+from .planificador import PlanificadorSintesis
+from .decodificador import DecodificadorLotes
+from concurrent.futures import ThreadPoolExecutor
 
 class Gestionador:
     """
@@ -14,25 +19,52 @@ class Gestionador:
     Intenta primero generar audio con gTTS. Si falla, usa pyttsx3 como fallback.
     Centraliza conversión, generación, combinación, exportación y limpieza.
     Muestra una barra de progreso con tqdm durante la generación de fragmentos.
+    Con hilos > 1 los fragmentos se sintetizan en paralelo y el fallback se aplica por fragmento.
+    Con directorio_cache los fragmentos sintetizados se guardan en disco y se reutilizan entre ejecuciones.
     """
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, hilos=1, directorio_cache=None, limite_cache=512 * 1024 * 1024,
+                 procesos_pyttsx3=0, agrupar_fragmentos=False, decodificar_en_lote=False, mp3_directo=False):
         """
         Inicializa el gestionador para la fase 3.
         
         Args:
             logger (object, optional): Logger para auditoría y debugging.
+            hilos (int): Fragmentos sintetizados a la vez. 1 mantiene la generación secuencial.
+            directorio_cache (str, optional): Directorio de la caché persistente de fragmentos.
+            limite_cache (int): Tamaño máximo en bytes de la caché de fragmentos.
+            procesos_pyttsx3 (int): Si es > 0, el fallback pyttsx3 usa ese número de procesos
+                trabajadores persistentes en lugar de un motor en el proceso principal.
+            agrupar_fragmentos (bool): Si se agrupan los fragmentos del mismo idioma a través de
+                pausas cortas para reducir el número de peticiones al motor.
+            decodificar_en_lote (bool): Si los mp3 de gTTS de cada bloque se decodifican juntos con
+                una sola invocación de ffmpeg en lugar de una por fragmento.
+            mp3_directo (bool): Si al exportar a mp3 (sin streaming) se unen directamente las tramas
+                mp3 de gTTS, sin decodificar ni recodificar, cuando todos los fragmentos son compatibles.
         """
         self.logger = logger
+        self.hilos = hilos
+        self.mp3_directo = mp3_directo
+        self.cache = CacheFragmentos(directorio_cache, limite_cache, logger) if directorio_cache else None
         self.convertidor = ConvertidorTextoVoz(logger)
-        self.generadorGTTS = GTTS(logger)
-        self.generadorPyttsx3 = Pyttsx3(logger)
+        planificador = PlanificadorSintesis(logger=logger) if agrupar_fragmentos else None
+        decodificador = DecodificadorLotes(logger) if decodificar_en_lote else None
+        self.generadorGTTS = GTTS(logger, cache=self.cache, planificador=planificador, decodificador=decodificador)
+        if procesos_pyttsx3 > 0:
+            self.generadorPyttsx3 = Pyttsx3Procesos(logger, cache=self.cache, procesos=procesos_pyttsx3,
+                                                    planificador=planificador)
+        else:
+            self.generadorPyttsx3 = Pyttsx3(logger, cache=self.cache, planificador=planificador)
         self.combinador = CombinadorAudio(logger)
+        self.combinador_mp3 = CombinadorMP3(logger)
+        self.decodificador = decodificador or DecodificadorLotes(logger)
         self.nombrador = NombreTemporal()
         self.expansion = ExpansionToken(logger)
         self.exportador = Exportador(logger)
-        self.limpiador = LimpiadorArchivos(logger)
+        self.generador_paralelo = GeneradorParalelo(self.generadorGTTS, self.generadorPyttsx3,
+                                                    hilos=hilos, logger=logger) if hilos > 1 else None
 
-    def convertir(self, segmentos, nombre_final="audio_resultado", formato="mp3", mostrar_progreso=True):
+    def convertir(self, segmentos, nombre_final="audio_resultado", formato="mp3", mostrar_progreso=True,
+                  streaming=False):
         """
         Ejecuta el flujo completo de la fase 3.
         Muestra barra de progreso (tqdm) durante generación de audio.
@@ -43,6 +75,8 @@ class Gestionador:
             nombre_final (str): Nombre base del archivo final exportado (sin extensión).
             formato (str): Formato del archivo exportado ('mp3', 'wav', etc.).
             mostrar_progreso (bool): Si se muestra la barra de progreso durante la generación.
+            streaming (bool): Si cada bloque se escribe en la salida en cuanto se genera, sin construir
+                el audio completo en memoria. Con streaming, segmentos puede ser un generador.
 
         Returns:
             str: Ruta del archivo de audio final generado.
@@ -50,46 +84,218 @@ class Gestionador:
         Raises:
             Exception: Si ocurre algún error durante el proceso principal.
         """
+        # Los archivos temporales del job (pyttsx3) van a un directorio propio que se borra entero al final
+        directorio = DirectorioTrabajo(logger=self.logger)
+        self.nombrador.directorio = directorio.crear()
         try:
-            archivos_generados = []
+            if streaming:
+                return self._convertir_streaming(segmentos, nombre_final, formato, mostrar_progreso, directorio)
 
-            # Si segmentos aún no está expandido, puedes hacerlo aquí y convertir cada uno en bloque
-            lista_de_bloques = []
-            for segmento in segmentos:
-                tokens = self.convertidor.convertir([segmento])
-                tokens_audio = self.expansion.expandir(tokens)
-                if tokens_audio:
-                    lista_de_bloques.append(tokens_audio)
+            lista_de_bloques = list(self._bloques(segmentos))
 
-            iterator = tqdm(lista_de_bloques, desc="Generando audio", unit="bloque") if mostrar_progreso else lista_de_bloques
-
-            for bloque in iterator:
-                resultado = None
-                try:
-                    resultado = self.generadorGTTS.generar(bloque, self.nombrador)
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Error generando audio gTTS para bloque. Error: {e}")
-                if not resultado or not resultado[0][0]:
+            archivos_generados = None
+            if self.mp3_directo and formato == "mp3":
+                ruta_final, archivos_generados = self._convertir_mp3_directo(lista_de_bloques, nombre_final)
+                if ruta_final:
                     if self.logger:
-                        self.logger.info("Usando fallback pyttsx3 para este bloque.")
-                    try:
-                        resultado = self.generadorPyttsx3.generar(bloque, self.nombrador)
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.error(f"Error generando audio fallback pyttsx3 para bloque. Error: {e}")
-                        resultado = [(None, None)]
-                archivos_generados.extend(resultado)
+                        self.logger.info(f"Proceso completado. Exportado a {ruta_final} sin recodificar.")
+                    return ruta_final
+
+            if archivos_generados is None:
+                if self.generador_paralelo:
+                    archivos_generados = self.generador_paralelo.generar(lista_de_bloques, self.nombrador, mostrar_progreso)
+                else:
+                    archivos_generados = self._generar_secuencial(lista_de_bloques, mostrar_progreso)
 
             audio_final = self.combinador.combinar(archivos_generados)
             ruta_final = self.exportador.exportar(audio_final, nombre_final, formato)
-            cantidad_eliminados = self.limpiador.limpiar(archivos_generados)
             if self.logger:
-                self.logger.info(
-                    f"Proceso completado. Exportado a {ruta_final}. {cantidad_eliminados} archivos temporales eliminados."
-                )
+                self.logger.info(f"Proceso completado. Exportado a {ruta_final}.")
             return ruta_final
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error en el proceso de conversión: {e}")
-            raise
\ No newline at end of file
+            raise
+        finally:
+            self.nombrador.directorio = None
+            directorio.eliminar()
+
+    def cerrar(self):
+        """
+        Libera los recursos persistentes de los generadores (p.ej. los procesos trabajadores de pyttsx3).
+        """
+        if isinstance(self.generadorPyttsx3, Pyttsx3Procesos):
+            self.generadorPyttsx3.cerrar()
+
+    def _convertir_mp3_directo(self, lista_de_bloques, nombre_final):
+        """
+        Ruta rápida para salida mp3: pide a gTTS el mp3 de cada fragmento y une sus tramas
+        directamente, con tramas silenciosas para las pausas.
+
+        Si algún fragmento falla o los parámetros no coinciden, no se escribe nada: los mp3 ya
+        descargados se decodifican (los que faltan se generan con pyttsx3) y se devuelven para
+        que el llamador siga por la ruta PCM sin repetir peticiones.
+
+        Args:
+            lista_de_bloques (list[list[dict]]): Bloques de tokens expandidos.
+            nombre_final (str): Nombre base del archivo final (sin extensión).
+
+        Returns:
+            tuple: (ruta_final, None) si la ruta directa funcionó, o (None, archivos_generados).
+        """
+        # Sin agrupar: un grupo necesita cortar el audio decodificado para restaurar sus pausas
+        plan = [item for bloque in lista_de_bloques
+                for item in self.generadorGTTS.planificar(bloque, optimizar=False)]
+        voces = [item for item in plan if item['tipo'] == 'voz']
+
+        def obtener(item):
+            return self.generadorGTTS.obtener_mp3(item['palabras'], item['idioma'])
+
+        if self.hilos > 1:
+            with ThreadPoolExecutor(max_workers=self.hilos, thread_name_prefix="tts") as pool:
+                datos = list(pool.map(obtener, voces))
+        else:
+            datos = [obtener(item) for item in voces]
+        for item, mp3 in zip(voces, datos):
+            item['mp3'] = mp3
+
+        if all(datos):
+            contenido = self.combinador_mp3.combinar(
+                [item['mp3'] if item['tipo'] == 'voz' else item['duracion'] for item in plan])
+            if contenido:
+                ruta_final = f"{nombre_final}.mp3"
+                with open(ruta_final, "wb") as archivo:
+                    archivo.write(contenido)
+                return ruta_final, None
+
+        # Fallback a la ruta PCM reutilizando lo ya descargado
+        descargados = [item for item in voces if item['mp3']]
+        for item, audio in zip(descargados, self.decodificador.decodificar([item['mp3'] for item in descargados])):
+            item['audio'], item['nombre'] = audio, self.nombrador.generar_nombre(item['palabras'], item['idioma'])
+        archivos_generados = []
+        for item in plan:
+            if item['tipo'] == 'voz' and not item.get('audio'):
+                archivos_generados.extend(self.generadorPyttsx3.sintetizar_item(item, self.nombrador) or [(None, None)])
+            else:
+                archivos_generados.extend(self.generadorGTTS.sintetizar_item(item, self.nombrador))
+        return None, archivos_generados
+
+    def _bloques(self, segmentos):
+        """
+        Convierte y expande cada segmento de la fase 2 en un bloque de tokens de audio.
+
+        Args:
+            segmentos (iterable[dict]): Segmentos de la fase 2.
+
+        Yields:
+            list[dict]: Tokens de audio de cada bloque no vacío.
+        """
+        for segmento in segmentos:
+            tokens = self.convertidor.convertir([segmento])
+            tokens_audio = self.expansion.expandir(tokens)
+            if tokens_audio:
+                yield tokens_audio
+
+    def _convertir_streaming(self, segmentos, nombre_final, formato, mostrar_progreso, directorio):
+        """
+        Genera y escribe el audio bloque a bloque. Cada fragmento se suelta, y su archivo temporal
+        (pyttsx3) se borra del directorio de trabajo, en cuanto se ha escrito, por lo que la memoria
+        no crece con la duración.
+
+        Args:
+            segmentos (iterable[dict]): Segmentos de la fase 2 (puede ser un generador).
+            nombre_final (str): Nombre base del archivo final exportado (sin extensión).
+            formato (str): Formato del archivo exportado ('mp3', 'wav', etc.).
+            mostrar_progreso (bool): Si se muestra la barra de progreso durante la generación.
+            directorio (DirectorioTrabajo): Directorio de trabajo del job.
+
+        Returns:
+            str: Ruta del archivo de audio final generado.
+
+        Raises:
+            ValueError: Si no se generó ningún fragmento de audio.
+            RuntimeError: Si el codificador termina con error.
+            En ambos casos se elimina el archivo de salida incompleto.
+        """
+        bloques = self._bloques(segmentos)
+        if self.generador_paralelo:
+            resultados = self.generador_paralelo.iterar(bloques, self.nombrador)
+        else:
+            resultados = self._iterar_secuencial(bloques)
+        if mostrar_progreso:
+            from tqdm import tqdm
+            resultados = tqdm(resultados, desc="Generando audio", unit="bloque")
+
+        escritos = 0
+        ruta_final = None
+        try:
+            with ExportadorStreaming(self.logger) as exportador:
+                ruta_final = exportador.abrir(nombre_final, formato)
+                for resultado in resultados:
+                    for audio, _ in resultado:
+                        if audio is not None:
+                            exportador.escribir(audio)
+                            escritos += 1
+                    directorio.descartar(resultado)
+                exportador.cerrar()
+
+            if not escritos:
+                raise ValueError("No hay audio para exportar.")
+        except Exception:
+            # abrir() crea la salida desde el principio: no se deja un archivo vacío o a medias
+            if ruta_final and os.path.exists(ruta_final):
+                os.remove(ruta_final)
+                if self.logger:
+                    self.logger.warning(f"Eliminada la salida incompleta {ruta_final}")
+            raise
+        if self.logger:
+            self.logger.info(f"Proceso completado. Exportado a {ruta_final}.")
+        return ruta_final
+
+    def _generar_secuencial(self, lista_de_bloques, mostrar_progreso):
+        """
+        Genera los bloques uno detrás de otro, con fallback a pyttsx3 por bloque.
+
+        Args:
+            lista_de_bloques (list[list[dict]]): Bloques de tokens expandidos.
+            mostrar_progreso (bool): Si se muestra la barra de progreso.
+
+        Returns:
+            list[tuple]: Lista ordenada de tuplas (AudioSegment, nombre).
+        """
+        archivos_generados = []
+        resultados = self._iterar_secuencial(lista_de_bloques)
+        if mostrar_progreso:
+            from tqdm import tqdm
+            resultados = tqdm(resultados, total=len(lista_de_bloques), desc="Generando audio", unit="bloque")
+        for resultado in resultados:
+            archivos_generados.extend(resultado)
+        return archivos_generados
+
+    def _iterar_secuencial(self, bloques):
+        """
+        Genera los bloques de uno en uno; primero con gTTS y, si falla, con pyttsx3.
+
+        Args:
+            bloques (iterable[list[dict]]): Bloques de tokens expandidos.
+
+        Yields:
+            list[tuple]: Tuplas (AudioSegment, nombre) de cada bloque.
+        """
+        for bloque in bloques:
+            resultado = None
+            try:
+                resultado = self.generadorGTTS.generar(bloque, self.nombrador)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error generando audio gTTS para bloque. Error: {e}")
+            if not resultado or not resultado[0][0]:
+                if self.logger:
+                    self.logger.info("Usando fallback pyttsx3 para este bloque.")
+                try:
+                    resultado = self.generadorPyttsx3.generar(bloque, self.nombrador)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"Error generando audio fallback pyttsx3 para bloque. Error: {e}")
+                    resultado = [(None, None)]
+            yield resultado
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 import os
+import shutil
+import tempfile
 
 class ILimpiador(ABC):
     """
@@ -57,4 +59,81 @@ class LimpiadorArchivos(ILimpiador):
                     self.logger.info(f"No se elimina: {nombre} (silencio virtual o no es archivo) en fragmento {idx}.")
         if self.logger:
             self.logger.info(f"{eliminados} archivos temporales eliminados exitosamente.")
-        return eliminados
\ No newline at end of file
+        return eliminados
+
+class DirectorioTrabajo:
+    """
+    Directorio temporal de un job de conversión, creado en tmpfs (/dev/shm) cuando está disponible.
+    Los motores que necesitan escribir archivos (pyttsx3) lo hacen aquí, y al terminar el job
+    el directorio entero se elimina de una sola vez, aunque la conversión haya fallado.
+    """
+    TMPFS = "/dev/shm"
+
+    def __init__(self, prefijo="tts_", logger=None):
+        """
+        Args:
+            prefijo (str): Prefijo del nombre del directorio.
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        self.prefijo = prefijo
+        self.logger = logger
+        self.ruta = None
+
+    def __enter__(self):
+        return self.crear()
+
+    def __exit__(self, tipo, valor, traza):
+        self.eliminar()
+
+    def crear(self) -> str:
+        """
+        Crea el directorio de trabajo.
+        Returns:
+            str: Ruta del directorio creado.
+        """
+        base = self.TMPFS if os.path.isdir(self.TMPFS) and os.access(self.TMPFS, os.W_OK) else None
+        self.ruta = tempfile.mkdtemp(prefix=self.prefijo, dir=base)
+        if self.logger:
+            self.logger.debug(f"Directorio de trabajo creado: {self.ruta}")
+        return self.ruta
+
+    def descartar(self, archivos) -> int:
+        """
+        Elimina los archivos de unos fragmentos ya escritos, sin esperar al final del job.
+        El directorio está en memoria (tmpfs), así que en una conversión en streaming los archivos
+        de pyttsx3 se borran bloque a bloque para que la memoria no crezca con la duración.
+        Los fragmentos sin archivo (gTTS en memoria, silencios, caché) se ignoran.
+        Args:
+            archivos (list[tuple]): Tuplas (AudioSegment, nombre_archivo) de un bloque.
+        Returns:
+            int: Número de archivos eliminados.
+        """
+        if not self.ruta:
+            return 0
+        eliminados = 0
+        for _, nombre in archivos:
+            if nombre and os.path.dirname(nombre) == self.ruta:
+                try:
+                    os.remove(nombre)
+                    eliminados += 1
+                except FileNotFoundError:
+                    pass
+        return eliminados
+
+    def eliminar(self) -> int:
+        """
+        Elimina el directorio de trabajo con todo su contenido.
+        Returns:
+            int: Número de archivos que quedaban en el directorio.
+        """
+        if not self.ruta:
+            return 0
+        ruta, self.ruta = self.ruta, None
+        try:
+            restantes = len(os.listdir(ruta))
+        except FileNotFoundError:
+            return 0
+        shutil.rmtree(ruta, ignore_errors=True)
+        if self.logger:
+            self.logger.info(f"Directorio de trabajo eliminado: {ruta} ({restantes} archivos temporales).")
+        return restantes
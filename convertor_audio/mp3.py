@@ -0,0 +1,203 @@
+"""
+Utilidades mínimas para trabajar con flujos MPEG Layer III a nivel de trama, sin decodificarlos.
+Permiten contar muestras, quitar etiquetas ID3 / cabeceras Xing, concatenar fragmentos mp3 y
+escribir la cabecera Xing/Info del resultado.
+"""
+
+# Bitrates (kbps) de Layer III por índice: MPEG1 y MPEG2/2.5
+BITRATES_MPEG1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+BITRATES_MPEG2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+
+# Frecuencias de muestreo por versión (bits de versión de la cabecera) e índice
+FRECUENCIAS = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+class CabeceraMP3:
+    """
+    Cabecera de una trama MPEG Layer III.
+    """
+    __slots__ = ('version', 'bitrate', 'frecuencia', 'canales', 'longitud', 'muestras', 'crc', 'cabecera')
+
+    def __init__(self, version, bitrate, frecuencia, canales, longitud, muestras, crc, cabecera):
+        self.version = version          # 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5
+        self.bitrate = bitrate          # kbps
+        self.frecuencia = frecuencia    # Hz
+        self.canales = canales
+        self.longitud = longitud        # bytes de la trama, cabecera incluida
+        self.muestras = muestras        # muestras por canal que produce la trama
+        self.crc = crc
+        self.cabecera = cabecera        # los 4 bytes originales
+
+    @property
+    def tamano_side_info(self) -> int:
+        if self.version == 3:
+            return 17 if self.canales == 1 else 32
+        return 9 if self.canales == 1 else 17
+
+def leer_cabecera(datos, posicion=0):
+    """
+    Interpreta la cabecera de trama que empieza en `posicion`.
+    Args:
+        datos (bytes): Flujo mp3.
+        posicion (int): Desplazamiento de la posible cabecera.
+    Returns:
+        CabeceraMP3 | None: La cabecera, o None si no hay una trama Layer III válida ahí.
+    """
+    if posicion + 4 > len(datos):
+        return None
+    b0, b1, b2, b3 = datos[posicion:posicion + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03
+    capa = (b1 >> 1) & 0x03
+    indice_bitrate = b2 >> 4
+    indice_frecuencia = (b2 >> 2) & 0x03
+    if version == 1 or capa != 1 or indice_bitrate in (0, 15) or indice_frecuencia == 3:
+        return None
+
+    bitrate = (BITRATES_MPEG1 if version == 3 else BITRATES_MPEG2)[indice_bitrate]
+    frecuencia = FRECUENCIAS[version][indice_frecuencia]
+    relleno = (b2 >> 1) & 0x01
+    canales = 1 if (b3 >> 6) == 3 else 2
+    if version == 3:
+        muestras, longitud = 1152, 144 * bitrate * 1000 // frecuencia + relleno
+    else:
+        muestras, longitud = 576, 72 * bitrate * 1000 // frecuencia + relleno
+    return CabeceraMP3(version, bitrate, frecuencia, canales, longitud, muestras,
+                       crc=not (b1 & 0x01), cabecera=bytes((b0, b1, b2, b3)))
+
+def _inicio_audio(datos) -> int:
+    """
+    Devuelve el desplazamiento tras la etiqueta ID3v2 inicial (0 si no la hay).
+    """
+    if len(datos) >= 10 and datos[:3] == b"ID3":
+        tamano = (datos[6] << 21) | (datos[7] << 14) | (datos[8] << 7) | datos[9]
+        pie = 10 if datos[5] & 0x10 else 0
+        return 10 + tamano + pie
+    return 0
+
+def es_trama_informativa(datos, posicion, cabecera) -> bool:
+    """
+    Indica si la trama es una cabecera Xing/Info/VBRI (metadatos, no audio del fragmento).
+    """
+    desplazamiento = posicion + 4 + (2 if cabecera.crc else 0) + cabecera.tamano_side_info
+    return (datos[desplazamiento:desplazamiento + 4] in (b"Xing", b"Info")
+            or datos[posicion + 36:posicion + 40] == b"VBRI")
+
+def iterar_tramas(datos):
+    """
+    Recorre las tramas de audio de un mp3, saltando etiquetas ID3 y basura entre tramas.
+    Args:
+        datos (bytes): Contenido del archivo mp3.
+    Yields:
+        tuple: (posicion, CabeceraMP3) de cada trama completa.
+    """
+    posicion = _inicio_audio(datos)
+    fin = len(datos)
+    if fin >= 128 and datos[fin - 128:fin - 125] == b"TAG":
+        fin -= 128
+    while posicion + 4 <= fin:
+        cabecera = leer_cabecera(datos, posicion)
+        if cabecera is None or posicion + cabecera.longitud > fin:
+            siguiente = datos.find(b"\xff", posicion + 1, fin)
+            if siguiente < 0:
+                break
+            posicion = siguiente
+            continue
+        yield posicion, cabecera
+        posicion += cabecera.longitud
+
+class FlujoMP3:
+    """
+    Tramas de audio de un fragmento mp3, sin etiquetas ni cabeceras Xing/Info.
+    """
+    __slots__ = ('datos', 'tramas', 'frecuencia', 'canales', 'version', 'muestras_por_trama')
+
+    def __init__(self, datos, tramas, frecuencia, canales, version, muestras_por_trama):
+        self.datos = datos
+        self.tramas = tramas
+        self.frecuencia = frecuencia
+        self.canales = canales
+        self.version = version
+        self.muestras_por_trama = muestras_por_trama
+
+    @property
+    def muestras(self) -> int:
+        return self.tramas * self.muestras_por_trama
+
+def analizar(datos):
+    """
+    Extrae las tramas de audio de un mp3 y comprueba que sus parámetros son homogéneos.
+    Args:
+        datos (bytes): Contenido del archivo mp3.
+    Returns:
+        FlujoMP3 | None: Tramas limpias, o None si no hay tramas o mezclan frecuencia/canales.
+    """
+    partes = []
+    referencia = None
+    for posicion, cabecera in iterar_tramas(datos):
+        if referencia is None and es_trama_informativa(datos, posicion, cabecera):
+            continue
+        if referencia is None:
+            referencia = cabecera
+        elif (cabecera.frecuencia, cabecera.canales, cabecera.version) != \
+                (referencia.frecuencia, referencia.canales, referencia.version):
+            return None
+        partes.append(datos[posicion:posicion + cabecera.longitud])
+    if referencia is None:
+        return None
+    return FlujoMP3(b"".join(partes), len(partes), referencia.frecuencia, referencia.canales,
+                    referencia.version, referencia.muestras)
+
+def trama_silencio(cabecera):
+    """
+    Construye una trama silenciosa con los mismos parámetros (versión, bitrate, frecuencia, canales)
+    que la cabecera dada: sin CRC, sin relleno y con side info y datos a cero, que los
+    decodificadores interpretan como silencio.
+    Args:
+        cabecera (CabeceraMP3): Cabecera de referencia.
+    Returns:
+        bytes: Una trama completa.
+    """
+    b0, b1, b2, b3 = cabecera.cabecera
+    nueva = bytes((b0, b1 | 0x01, b2 & 0xFD, b3))
+    return nueva + bytes(leer_cabecera(nueva).longitud - 4)
+
+def anadir_cabecera_xing(datos, cabecera):
+    """
+    Antepone a un flujo de tramas de audio una trama Xing (bitrate variable) o Info (constante)
+    con el número de tramas, el de bytes y la tabla de búsqueda (TOC), para que los reproductores
+    conozcan la duración y puedan buscar sin recorrer el archivo. La trama tiene los parámetros de
+    la cabecera de referencia (con el bitrate mínimo en el que caben los metadatos) y su audio es
+    silencio, como la que escribe LAME.
+    Args:
+        datos (bytes): Tramas de audio concatenadas, sin etiquetas ni cabecera Xing.
+        cabecera (CabeceraMP3): Cabecera de referencia (versión, frecuencia, canales).
+    Returns:
+        bytes: El flujo con la trama Xing/Info delante.
+    """
+    posiciones = []
+    bitrates = set()
+    for posicion, trama in iterar_tramas(datos):
+        posiciones.append(posicion)
+        bitrates.add(trama.bitrate)
+    if not posiciones:
+        return datos
+
+    b0, b1, b2, b3 = cabecera.cabecera
+    contenido_minimo = 4 + 4 + 4 + 4 + 100  # Identificador, banderas, tramas, bytes y TOC
+    for indice_bitrate in range(1, 15):
+        nueva = bytes((b0, b1 | 0x01, (b2 & 0x0D) | (indice_bitrate << 4), b3))  # Sin CRC ni relleno
+        trama = leer_cabecera(nueva)
+        if trama.longitud >= 4 + trama.tamano_side_info + contenido_minimo:
+            break
+    else:
+        return datos
+
+    tramas = len(posiciones)
+    total = trama.longitud + len(datos)
+    # Entrada i del TOC: posición (en 1/256 del archivo) de la trama en el i% de la duración
+    toc = bytes(min(255, (trama.longitud + posiciones[i * tramas // 100]) * 256 // total) for i in range(100))
+    contenido = ((b"Xing" if len(bitrates) > 1 else b"Info") + (0x07).to_bytes(4, "big")
+                 + tramas.to_bytes(4, "big") + total.to_bytes(4, "big") + toc)
+    relleno = trama.longitud - 4 - trama.tamano_side_info - len(contenido)
+    return nueva + bytes(trama.tamano_side_info) + contenido + bytes(relleno) + datos
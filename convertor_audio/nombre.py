@@ -1,3 +1,4 @@
+import os
 import uuid
 from abc import ABC, abstractmethod
 import hashlib
@@ -20,12 +21,20 @@ class INombrador(ABC):
         pass
 
 class NombreTemporal(INombrador):
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, directorio=None):
+        """
+        Args:
+            logger (object, optional): Logger para auditoría y debugging.
+            directorio (str, optional): Directorio donde se crean los archivos (por defecto, el actual).
+        """
         self.logger = logger
+        self.directorio = directorio
     
     def generar_nombre(self, palabras, idioma) -> str:
         hash_palabras = hashlib.md5(" ".join(palabras).encode()).hexdigest()[:6]
         nombre = f"audio_{uuid.uuid4().hex[:8]}_{idioma}_{hash_palabras}.mp3"
+        if self.directorio:
+            nombre = os.path.join(self.directorio, nombre)
         if self.logger:
             self.logger.debug(f"Archivo generado: {nombre} para idioma: {idioma} | palabras: {palabras[:3]}")
         return nombre
@@ -0,0 +1,141 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+class GeneradorParalelo:
+    """
+    Genera los fragmentos de voz de todos los bloques de forma concurrente.
+
+    Cada bloque se planifica con el generador principal y cada fragmento de voz se envía
+    a un pool de hilos acotado. Si el generador principal falla para un fragmento,
+    ese fragmento (y solo ese) se regenera con el generador de respaldo.
+    El resultado se reensambla siempre en el orden original del documento.
+    """
+    def __init__(self, generador, respaldo=None, hilos=4, logger=None):
+        """
+        Inicializa el generador paralelo.
+        Args:
+            generador (Generador): Motor principal (p.ej. GTTS).
+            respaldo (Generador, optional): Motor de fallback por fragmento (p.ej. Pyttsx3).
+            hilos (int): Número máximo de fragmentos sintetizándose a la vez.
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        if hilos < 1:
+            raise ValueError("El número de hilos debe ser al menos 1.")
+        self.generador = generador
+        self.respaldo = respaldo
+        self.hilos = hilos
+        self.logger = logger
+
+    def generar(self, lista_de_bloques, nombrador, mostrar_progreso=False):
+        """
+        Sintetiza todos los bloques en paralelo.
+        Args:
+            lista_de_bloques (list[list[dict]]): Bloques de tokens expandidos.
+            nombrador: Objeto para generar nombres de archivos temporales.
+            mostrar_progreso (bool): Si se muestra una barra de progreso por bloque.
+        Returns:
+            list[tuple]: Lista ordenada de tuplas (AudioSegment, nombre).
+        """
+        archivos = []
+        iterator = self.iterar(lista_de_bloques, nombrador)
+        if mostrar_progreso:
+            from tqdm import tqdm
+            iterator = tqdm(iterator, total=len(lista_de_bloques), desc="Generando audio", unit="bloque")
+        for resultado in iterator:
+            archivos.extend(resultado)
+        return archivos
+
+    def iterar(self, bloques, nombrador, ventana=None):
+        """
+        Sintetiza los bloques en paralelo y los devuelve uno a uno, en orden.
+        Solo se adelantan como máximo `ventana` fragmentos de voz, de modo que la memoria
+        ocupada por resultados pendientes no crece con la longitud del documento.
+        Args:
+            bloques (iterable[list[dict]]): Bloques de tokens expandidos (puede ser un generador).
+            nombrador: Objeto para generar nombres de archivos temporales.
+            ventana (int, optional): Fragmentos de voz en vuelo. Por defecto 4 por hilo.
+        Yields:
+            list[tuple]: Tuplas (AudioSegment, nombre) de cada bloque.
+        """
+        ventana = ventana or self.hilos * 4
+        # Si el motor decodifica por lotes, cada bloque se sintetiza entero en un hilo
+        por_lotes = getattr(self.generador, 'decodificador', None) is not None
+        pendientes = deque()
+        en_vuelo = 0
+        with ThreadPoolExecutor(max_workers=self.hilos, thread_name_prefix="tts") as pool:
+            for bloque in bloques:
+                plan = self.generador.planificar(bloque)
+                voces = sum(1 for item in plan if item['tipo'] == 'voz')
+                if por_lotes:
+                    elementos = [pool.submit(self._sintetizar_bloque, plan, nombrador)]
+                else:
+                    elementos = [pool.submit(self._sintetizar_con_respaldo, item, nombrador)
+                                 if item['tipo'] == 'voz' else item for item in plan]
+                pendientes.append((elementos, voces))
+                en_vuelo += voces
+                while en_vuelo >= ventana and pendientes:
+                    elementos, voces = pendientes.popleft()
+                    en_vuelo -= voces
+                    yield self._resolver(elementos, nombrador)
+            while pendientes:
+                elementos, _ = pendientes.popleft()
+                yield self._resolver(elementos, nombrador)
+
+    def _resolver(self, elementos, nombrador):
+        """
+        Espera a los fragmentos de voz de un bloque y genera sus silencios.
+        Returns:
+            list[tuple]: Tuplas (AudioSegment, nombre) del bloque, en orden.
+        """
+        archivos = []
+        for elemento in elementos:
+            if isinstance(elemento, dict):
+                archivos.extend(self.generador.sintetizar_item(elemento, nombrador))
+            else:
+                archivos.extend(elemento.result())
+        return archivos
+
+    def _sintetizar_bloque(self, plan, nombrador):
+        """
+        Precarga (y decodifica en lote) todo el plan de un bloque y lo sintetiza item a item,
+        con fallback por fragmento.
+        """
+        try:
+            self.generador.precargar(plan, nombrador)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error precargando bloque con {self.generador.__class__.__name__}. Error: {e}")
+        archivos = []
+        for item in plan:
+            if item['tipo'] == 'voz':
+                archivos.extend(self._sintetizar_con_respaldo(item, nombrador))
+            else:
+                archivos.extend(self.generador.sintetizar_item(item, nombrador))
+        return archivos
+
+    def _sintetizar_con_respaldo(self, item, nombrador):
+        """
+        Sintetiza un fragmento de voz con el motor principal y, si falla, con el de respaldo.
+        Args:
+            item (dict): Item de voz del plan.
+            nombrador: Objeto para generar nombres de archivos temporales.
+        Returns:
+            list[tuple]: [(AudioSegment, nombre)] o [(None, None)] si ambos motores fallan.
+        """
+        resultado = []
+        try:
+            resultado = self.generador.sintetizar_item(item, nombrador)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error generando fragmento con {self.generador.__class__.__name__}. Error: {e}")
+        if resultado or self.respaldo is None:
+            return resultado or [(None, None)]
+
+        if self.logger:
+            self.logger.info(f"Usando fallback {self.respaldo.__class__.__name__} para un fragmento.")
+        try:
+            resultado = self.respaldo.sintetizar_item(item, nombrador)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Error generando fragmento con fallback {self.respaldo.__class__.__name__}. Error: {e}")
+        return resultado or [(None, None)]
@@ -0,0 +1,150 @@
+from abc import ABC, abstractmethod
+from pydub import AudioSegment
+from pydub.silence import detect_silence
+
+class IPlanificador(ABC):
+    """
+    Interfaz para planificadores de síntesis: reescriben el plan de un bloque
+    (items de voz y silencio) para reducir el número de peticiones al motor TTS.
+    """
+    @abstractmethod
+    def optimizar(self, plan, limite_caracteres) -> list:
+        """
+        Args:
+            plan (list[dict]): Items producidos por Generador.planificar().
+            limite_caracteres (int): Máximo de caracteres por petición al motor.
+        Returns:
+            list[dict]: Plan equivalente con menos items de voz.
+        """
+        pass
+
+class PlanificadorSintesis(IPlanificador):
+    """
+    Agrupa fragmentos de voz contiguos del mismo idioma, también a través de pausas cortas,
+    hasta el límite de caracteres del motor, y fusiona silencios consecutivos en uno solo.
+
+    Un item agrupado conserva la lista de pausas que ha absorbido ('pausas') y el plan
+    original ('partes'). Tras sintetizarlo, restaurar_pausas() corta el audio devuelto
+    por los silencios naturales más largos y los sustituye por la duración exacta de cada pausa;
+    si no encuentra suficientes cortes, el generador vuelve a sintetizar las partes por separado.
+    """
+    def __init__(self, pausa_maxima=700, logger=None):
+        """
+        Args:
+            pausa_maxima (int): Pausas de hasta esta duración (ms) pueden quedar dentro de un grupo.
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        self.pausa_maxima = pausa_maxima
+        self.logger = logger
+
+    def optimizar(self, plan, limite_caracteres) -> list:
+        plan = self._fusionar_silencios(plan)
+        resultado = []
+        grupo = []  # Plan original (voz, silencio, voz, ...) del grupo en construcción
+
+        for item in plan:
+            if item['tipo'] == 'voz':
+                if grupo and self._admite(grupo, item, limite_caracteres):
+                    grupo.append(item)
+                    continue
+                resultado.extend(self._cerrar_grupo(grupo))
+                grupo = [item]
+            elif grupo and grupo[-1]['tipo'] == 'voz' and item['duracion'] <= self.pausa_maxima:
+                grupo.append(item)
+            else:
+                resultado.extend(self._cerrar_grupo(grupo))
+                grupo = []
+                resultado.append(item)
+        resultado.extend(self._cerrar_grupo(grupo))
+
+        if self.logger:
+            voces_antes = sum(1 for item in plan if item['tipo'] == 'voz')
+            voces_despues = sum(1 for item in resultado if item['tipo'] == 'voz')
+            self.logger.debug(f"Planificador: {voces_antes} fragmentos de voz agrupados en {voces_despues} peticiones.")
+        return resultado
+
+    @staticmethod
+    def _fusionar_silencios(plan):
+        """
+        Sustituye cada racha de silencios consecutivos por un único silencio con la duración total.
+        """
+        resultado = []
+        for item in plan:
+            if item['tipo'] == 'silencio' and resultado and resultado[-1]['tipo'] == 'silencio':
+                anterior = resultado[-1]
+                resultado[-1] = {**anterior, 'duracion': anterior['duracion'] + item['duracion']}
+            else:
+                resultado.append(item)
+        return resultado
+
+    @staticmethod
+    def _admite(grupo, item, limite_caracteres):
+        """
+        Comprueba si un item de voz puede añadirse al grupo sin cambiar de idioma ni pasar el límite.
+        """
+        if grupo[0]['idioma'] != item['idioma']:
+            return False
+        longitud = sum(len(" ".join(parte['palabras'])) + 1 for parte in grupo if parte['tipo'] == 'voz')
+        longitud += sum(len(parte.get('token') or ",") + 1 for parte in grupo if parte['tipo'] == 'silencio')
+        return longitud + len(" ".join(item['palabras'])) <= limite_caracteres
+
+    @staticmethod
+    def _cerrar_grupo(grupo):
+        """
+        Convierte el grupo en items del plan final: uno agrupado si contiene pausas,
+        o los items originales si no hay nada que agrupar.
+        """
+        # Un silencio al final del grupo no se absorbe: queda fuera como item normal
+        cola = []
+        while grupo and grupo[-1]['tipo'] == 'silencio':
+            cola.insert(0, grupo.pop())
+        if len(grupo) <= 1:
+            return grupo + cola
+
+        palabras = []
+        pausas = []
+        for parte in grupo:
+            if parte['tipo'] == 'voz':
+                palabras.extend(parte['palabras'])
+            else:
+                # El signo original se mantiene en el texto para que el motor haga una pausa natural
+                palabras.append(parte.get('token') or ",")
+                pausas.append(parte['duracion'])
+        agrupado = {'tipo': 'voz', 'palabras': palabras, 'idioma': grupo[0]['idioma'],
+                    'pausas': pausas, 'partes': grupo}
+        return [agrupado] + cola
+
+def restaurar_pausas(audio, pausas, duracion_minima=40, umbral_relativo=16):
+    """
+    Corta el audio de un grupo por sus silencios naturales y los sustituye por las pausas exactas.
+
+    Se eligen los len(pausas) silencios interiores más largos, que son los que el motor
+    produce en los signos de puntuación del texto agrupado.
+
+    Args:
+        audio (AudioSegment): Audio sintetizado del grupo.
+        pausas (list[int]): Duración en ms de cada pausa, en orden.
+        duracion_minima (int): Duración mínima (ms) de un silencio candidato.
+        umbral_relativo (int): dB por debajo del volumen medio que se consideran silencio.
+    Returns:
+        list[AudioSegment] | None: Trozos de voz y silencios alternados, o None si no se
+            encontraron suficientes silencios para colocar todas las pausas.
+    """
+    if not pausas:
+        return [audio]
+    candidatos = [(inicio, fin) for inicio, fin in
+                  detect_silence(audio, min_silence_len=duracion_minima,
+                                 silence_thresh=audio.dBFS - umbral_relativo, seek_step=5)
+                  if inicio > 0 and fin < len(audio)]
+    if len(candidatos) < len(pausas):
+        return None
+
+    cortes = sorted(sorted(candidatos, key=lambda corte: corte[1] - corte[0], reverse=True)[:len(pausas)])
+    trozos = []
+    posicion = 0
+    for (inicio, fin), duracion in zip(cortes, pausas):
+        trozos.append(audio[posicion:inicio])
+        trozos.append(AudioSegment.silent(duration=duracion, frame_rate=audio.frame_rate))
+        posicion = fin
+    trozos.append(audio[posicion:])
+    return trozos
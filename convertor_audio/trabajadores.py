@@ -0,0 +1,83 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import threading
+
+# Motor pyttsx3 del proceso trabajador actual (uno por proceso, creado una sola vez)
+_motor = None
+
+def _iniciar_motor(velocidad, volumen):
+    """
+    Inicializador de cada proceso trabajador: arranca el motor pyttsx3 una única vez.
+    """
+    global _motor
+    import pyttsx3
+    _motor = pyttsx3.init()
+    _motor.setProperty('rate', velocidad)
+    _motor.setProperty('volume', volumen)
+
+def _sintetizar(texto, ruta):
+    """
+    Sintetiza un texto a archivo con el motor ya iniciado del proceso trabajador.
+    """
+    _motor.save_to_file(texto, ruta)
+    _motor.runAndWait()
+    return ruta
+
+class PoolPyttsx3:
+    """
+    Pool de procesos trabajadores de larga vida para pyttsx3.
+
+    Cada proceso inicia su motor una vez y después atiende una cola de trabajos (texto, ruta de salida),
+    así que el coste de pyttsx3.init() se paga una vez por proceso y no una vez por fragmento.
+    Con varios procesos la síntesis offline escala con los núcleos disponibles.
+    El pool se crea de forma perezosa en el primer trabajo y puede usarse desde varios hilos.
+    """
+    def __init__(self, procesos=None, velocidad=150, volumen=1.0, logger=None):
+        """
+        Args:
+            procesos (int, optional): Número de procesos trabajadores (por defecto, uno por núcleo).
+            velocidad (int): Velocidad de habla del motor.
+            volumen (float): Volumen del motor (0.0 - 1.0).
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        self.procesos = procesos or os.cpu_count() or 1
+        self.velocidad = velocidad
+        self.volumen = volumen
+        self.logger = logger
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def enviar(self, texto, ruta):
+        """
+        Encola un trabajo de síntesis.
+        Args:
+            texto (str): Texto a sintetizar.
+            ruta (str): Archivo de salida.
+        Returns:
+            concurrent.futures.Future: Se resuelve con la ruta cuando el archivo está escrito.
+        """
+        # El lock evita que varios hilos creen cada uno su propio pool en el primer envío
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.procesos, initializer=_iniciar_motor,
+                                                 initargs=(self.velocidad, self.volumen))
+                if self.logger:
+                    self.logger.info(f"Pool pyttsx3 iniciado con {self.procesos} procesos.")
+            return self._pool.submit(_sintetizar, texto, ruta)
+
+    def sintetizar(self, texto, ruta):
+        """
+        Sintetiza un texto y espera al resultado.
+        Returns:
+            str: Ruta del archivo escrito.
+        """
+        return self.enviar(texto, ruta).result()
+
+    def cerrar(self):
+        """
+        Detiene los procesos trabajadores.
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
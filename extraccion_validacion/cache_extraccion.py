@@ -0,0 +1,129 @@
+"Caché persistente del texto extraído de archivos y URLs"
+
+# Librerías estándar de Python
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from almacen_disco import AlmacenLRU
+
+class ICacheExtraccion(ABC):
+    """
+    Interfaz para cachés del texto ya extraído de una entrada.
+    """
+    @abstractmethod
+    def clave_archivo(self, ruta, variante=None, estado=None, datos=None) -> Optional[str]:
+        """
+        Calcula la clave de un archivo a partir de su identidad (ruta, tamaño, mtime, hash del contenido).
+        Args:
+            ruta (str): Ruta del archivo.
+            variante (str, optional): Opciones de extracción que cambian el resultado (p.ej. páginas).
+            estado (os.stat_result, optional): Resultado de os.stat ya obtenido.
+            datos (bytes | mmap, optional): Contenido ya leído o mapeado; evita volver a leer el archivo.
+        Returns:
+            str | None: Clave hexadecimal, o None si el archivo no se puede leer.
+        """
+        pass
+
+    @abstractmethod
+    def clave_url(self, url, variante=None) -> str:
+        """
+        Calcula la clave de una URL (la validez se comprueba después con ETag/Last-Modified).
+        """
+        pass
+
+    @abstractmethod
+    def obtener(self, clave) -> Optional[dict]:
+        """
+        Devuelve la entrada guardada ({'texto', 'etag', 'last_modified'}) o None si no está en caché.
+        """
+        pass
+
+    @abstractmethod
+    def guardar(self, clave, texto, etag=None, last_modified=None) -> None:
+        """
+        Guarda el texto extraído bajo la clave, con los validadores HTTP si los hay.
+        """
+        pass
+
+class CacheExtraccion(ICacheExtraccion):
+    """
+    Caché en disco del texto extraído, para no volver a analizar los mismos PDFs ni
+    descargar las mismas páginas en cada ejecución.
+
+    Los archivos se identifican por (ruta, tamaño, mtime, SHA-256 del contenido): cualquier
+    modificación produce otra clave. Las URLs se identifican por su dirección y guardan el ETag y
+    el Last-Modified de la respuesta, que se envían en un GET condicional; un 304 permite usar el
+    texto guardado sin descargar el cuerpo.
+
+    Cada entrada es un JSON guardado en un AlmacenLRU: escritura atómica y expulsión LRU según la
+    fecha de último uso bajo un presupuesto de bytes configurable.
+    """
+    EXTENSION = ".json"
+
+    def __init__(self, directorio, limite_bytes=256 * 1024 * 1024, logger=None):
+        """
+        Inicializa la caché.
+        Args:
+            directorio (str): Directorio donde se guardan las entradas.
+            limite_bytes (int): Tamaño máximo aproximado de la caché en disco.
+            logger (object, optional): Logger para auditoría y debugging.
+        """
+        self.logger = logger
+        self._almacen = AlmacenLRU(directorio, self.EXTENSION, limite_bytes, "Caché de extracción", logger)
+
+    def clave_archivo(self, ruta, variante=None, estado=None, datos=None) -> Optional[str]:
+        try:
+            ruta = os.path.abspath(ruta)
+            estado = estado or os.stat(ruta)
+            contenido = hashlib.sha256()
+            if datos is not None:
+                contenido.update(datos)
+            else:
+                with open(ruta, "rb") as archivo:
+                    for bloque in iter(lambda: archivo.read(1024 * 1024), b""):
+                        contenido.update(bloque)
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Caché de extracción: no se pudo identificar el archivo {ruta}: {e}")
+            return None
+        return self._clave(["archivo", ruta, estado.st_size, estado.st_mtime_ns, contenido.hexdigest(), variante])
+
+    def clave_url(self, url, variante=None) -> str:
+        return self._clave(["url", url, variante])
+
+    def obtener(self, clave) -> Optional[dict]:
+        ruta = self._almacen.ruta(clave)
+        try:
+            with open(ruta, "r", encoding="utf-8") as archivo:
+                entrada = json.load(archivo)
+            self._almacen.usar(ruta)  # Marca la entrada como usada recientemente
+        except (FileNotFoundError, ValueError):
+            return None
+        if self.logger:
+            self.logger.debug(f"Caché de extracción: entrada encontrada {clave[:12]}")
+        return entrada
+
+    def guardar(self, clave, texto, etag=None, last_modified=None) -> None:
+        entrada = {'texto': texto, 'etag': etag, 'last_modified': last_modified}
+        self._almacen.escribir(clave, lambda salida: json.dump(entrada, salida, ensure_ascii=False),
+                               binario=False)
+
+    @staticmethod
+    def validadores(entrada) -> dict:
+        """
+        Cabeceras de un GET condicional a partir de una entrada de URL guardada.
+        """
+        cabeceras = {}
+        if entrada and entrada.get('etag'):
+            cabeceras['If-None-Match'] = entrada['etag']
+        if entrada and entrada.get('last_modified'):
+            cabeceras['If-Modified-Since'] = entrada['last_modified']
+        return cabeceras
+
+    @staticmethod
+    def _clave(partes) -> str:
+        contenido = json.dumps(partes, ensure_ascii=False)
+        return hashlib.sha256(contenido.encode("utf-8")).hexdigest()
@@ -2,21 +2,151 @@
 
 # Librerías estándar de Python
 import os          # Manejo de archivos y directorios
-import json        # Manejo de archivos JSON
+import io          # Lectura de archivos ya mapeados en memoria
+import re          # Expresiones regulares (alineado de oraciones)
+import codecs      # Decodificación incremental de archivos de texto
+import threading   # Creación segura de la sesión HTTP compartida
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED  # Extracción en paralelo
 
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable, Iterator
 from abc import ABC, abstractmethod
-# Librerías externas (instaladas con pip)
-import PyPDF2 as pdf  # Manipulación de archivos PDF
-import requests    # Realizar solicitudes HTTP
-import lxml.html as html  # Parseo eficiente de HTML
-from bs4 import BeautifulSoup as bs  # Parseo personalizable de HTML
-from newspaper import Article  # Extracción de noticias y artículos
-import validators  # Validación de URLs
+# Librerías externas (instaladas con pip), importadas en su primer uso para no alargar el arranque
+from carga_perezosa import ModuloPerezoso
+pdf = ModuloPerezoso("PyPDF2")  # Manipulación de archivos PDF
+requests = ModuloPerezoso("requests")  # Realizar solicitudes HTTP
+adaptadores_http = ModuloPerezoso("requests.adapters")  # Pool de conexiones HTTP
+html = ModuloPerezoso("lxml.html")  # Parseo eficiente de HTML
+etree = ModuloPerezoso("lxml.etree")  # Parseo incremental de HTML
+bs4 = ModuloPerezoso("bs4")  # Parseo personalizable de HTML
+newspaper = ModuloPerezoso("newspaper")  # Extracción de noticias y artículos
+charset_normalizer = ModuloPerezoso("charset_normalizer")  # Detección de la codificación de archivos de texto
+validators = ModuloPerezoso("validators")  # Validación de URLs
+
+from extraccion_validacion.tipo_datos import DescriptorEntrada
+from extraccion_validacion.json_flujo import iterar_cadenas
 
 time_request_limit = 10
+LIMITE_CACHE_PARTES = 32 * 1024 * 1024 # Caracteres máximos que se guardan en caché al extraer por partes
+
+# Fin de oración: signo de cierre (opcionalmente seguido de comillas/paréntesis) y espacio en blanco
+FIN_ORACION = re.compile(r'[.!?…]["\'»”)\]]*\s')
+
+def alinear_oraciones(partes: Iterable[str], minimo: int = 2000, maximo: int = 200000) -> Iterator[str]:
+    """
+    Reagrupa un flujo de trozos de texto en trozos que terminan en fin de oración.
+    Args:
+        partes: Trozos de texto en orden (páginas, bloques leídos, ...).
+        minimo: Caracteres acumulados antes de buscar un corte.
+        maximo: Si se acumulan más caracteres sin ningún fin de oración, se corta en el último
+            espacio en blanco, para que la memoria no crezca con textos sin puntuación.
+    Yields:
+        Trozos de texto que acaban en una oración completa (el último, con lo que quede).
+    """
+    pendiente = ""
+    for parte in partes:
+        pendiente += parte
+        if len(pendiente) < minimo:
+            continue
+        corte = None
+        for corte in FIN_ORACION.finditer(pendiente):
+            pass
+        if corte:
+            fin = corte.end()
+        elif len(pendiente) > maximo:
+            fin = max(pendiente.rfind(" "), pendiente.rfind("\n")) + 1 or len(pendiente)
+        else:
+            continue
+        yield pendiente[:fin]
+        pendiente = pendiente[fin:]
+    if pendiente.strip():
+        yield pendiente
+
+def parsear_rango_paginas(texto: str) -> Optional[list]:
+    """
+    Interpreta una selección de páginas escrita por el usuario, p.ej. "40-55" o "1,3,10-12".
+    Args: texto: Selección con números de página desde 1, separados por comas; admite rangos con guion
+    Returns: Lista ordenada de números de página, o None si el texto está vacío
+    Raises: ValueError si la selección no es válida
+    """
+    if not texto or not texto.strip():
+        return None
+    paginas = set()
+    for trozo in texto.split(","):
+        inicio, _, fin = trozo.strip().partition("-")
+        inicio = int(inicio)
+        fin = int(fin) if fin else inicio
+        if inicio < 1 or fin < inicio:
+            raise ValueError(f"Rango de páginas no válido: '{trozo.strip()}'")
+        paginas.update(range(inicio, fin + 1))
+    return sorted(paginas)
+
+def seleccionar_paginas(paginas, total_paginas: int) -> list:
+    """
+    Convierte una selección de páginas en los índices (desde 0) que hay que extraer.
+    Args:
+        paginas: None (todas), un iterable de números de página desde 1 o un predicado numero -> bool
+        total_paginas: Número de páginas del documento
+    Returns: Índices válidos, ordenados y sin repetir
+    """
+    if paginas is None:
+        return list(range(total_paginas))
+    if callable(paginas):
+        return [indice for indice in range(total_paginas) if paginas(indice + 1)]
+    return sorted({numero - 1 for numero in paginas if 1 <= numero <= total_paginas})
+
+def leer_bloques(entrada: str, mapa=None, tamano_bloque: int = 1024 * 1024, logger=None,
+                 tipo_archivo: str = "TXT") -> Iterator[bytes]:
+    """
+    Lee un archivo (o su mapeo en memoria) en bloques de tamaño fijo.
+    Args:
+        entrada: Ruta del archivo
+        mapa: Contenido ya mapeado en memoria (opcional)
+        tamano_bloque: Bytes por bloque
+        logger: Logger opcional para registrar errores de lectura
+        tipo_archivo: Descripción del tipo para logging (ej: "TXT", "JSON")
+    Yields: Bloques de bytes, en orden
+    """
+    try:
+        if mapa is not None:
+            for inicio in range(0, len(mapa), tamano_bloque):
+                yield mapa[inicio:inicio + tamano_bloque]
+            return
+        with open(entrada, 'rb') as archivo:
+            for bloque in iter(lambda: archivo.read(tamano_bloque), b""):
+                yield bloque
+    except FileNotFoundError:
+        if logger:
+            logger.error(f"Extracción {tipo_archivo}: Archivo no encontrado - {entrada}")
+    except PermissionError:
+        if logger:
+            logger.error(f"Extracción {tipo_archivo}: Permiso denegado - {entrada}")
+    except OSError as e:
+        if logger:
+            logger.error(f"Extracción {tipo_archivo}: Error de lectura - {entrada} - {e}")
+
+def _extraer_paginas_pdf(ruta: str, indices: list) -> list:
+    """
+    Trabajador de proceso: abre su propio lector del PDF y extrae el texto de las páginas indicadas.
+    """
+    with open(ruta, 'rb') as archivo:
+        lector_pdf = pdf.PdfReader(archivo)
+        return [lector_pdf.pages[indice].extract_text() or "" for indice in indices]
 
 class IExtraccion(ABC):
+    # Si extraer() acepta una selección de páginas (argumento paginas)
+    admite_paginas = False
+    # Si extraer() puede leer el contenido ya mapeado en memoria (argumento mapa)
+    admite_mapa = False
+    # Tipo de entrada (según ClasificadorTipoEntrada) y extensiones que trata el extractor
+    tipo_entrada: Optional[str] = None
+    extensiones: tuple = ()
+
+    def admite(self, descriptor: DescriptorEntrada) -> bool:
+        """
+        Equivalente a puede_extraer() para una entrada ya clasificada, sin volver a comprobarla.
+        """
+        return descriptor.tipo == self.tipo_entrada and (not self.extensiones or descriptor.extension in self.extensiones)
+
     @abstractmethod
     def extraer(self, entrada) -> Optional[str]:
         pass
@@ -36,7 +166,7 @@ class ManejadorArchivos:
         self.logger = logger
     
     def procesar_archivo(self, ruta: str, procesador: Callable, tipo_archivo: str, modo: str = 'r',
-                          encoding: Optional[str] = 'utf-8') -> Optional[str]:
+                          encoding: Optional[str] = 'utf-8', mapa=None) -> Optional[str]:
         """
         Template method para procesamiento genérico de archivos.
         Maneja apertura, procesamiento, cierre y errores de forma uniforme.
@@ -47,6 +177,7 @@ class ManejadorArchivos:
             tipo_archivo: Descripción del tipo para logging (ej: "TXT", "PDF")
             modo: Modo de apertura del archivo ('r' para texto, 'rb' para binario)
             encoding: Codificación del archivo (None para modo binario)
+            mapa: Contenido ya mapeado en memoria (mmap); si se indica, no se vuelve a abrir el archivo
             
         Returns: Texto extraído o None si ocurre algún error
         """
@@ -55,7 +186,7 @@ class ManejadorArchivos:
             codificado = encoding if modo != 'rb' else None
             
             # Abrir archivo con context manager (cierre automático)
-            with open(ruta, mode=modo, encoding=codificado) as archivo:
+            with self._abrir(ruta, modo, codificado, mapa) as archivo:
                 texto = procesador(archivo)
                 
                 if self.logger:
@@ -85,7 +216,35 @@ class ManejadorArchivos:
                 self.logger.error(f"Extracción {tipo_archivo}: Error inesperado - {ruta} - {e}")
             return None
 
+    @staticmethod
+    def _abrir(ruta, modo, codificado, mapa):
+        """
+        Abre el archivo, o envuelve su mapeo en memoria en un objeto de archivo equivalente.
+        """
+        if mapa is None:
+            return open(ruta, mode=modo, encoding=codificado)
+        mapa.seek(0)
+        if modo == 'rb':
+            # El mmap ya se comporta como un archivo binario (read/seek/tell); no se cierra aquí
+            return _SinCerrar(mapa)
+        return io.StringIO(str(mapa, codificado))
+
+class _SinCerrar:
+    """
+    Context manager que entrega un objeto sin cerrarlo al salir (el mapeo lo libera su descriptor).
+    """
+    def __init__(self, objeto):
+        self.objeto = objeto
+
+    def __enter__(self):
+        return self.objeto
+
+    def __exit__(self, tipo_excepcion, excepcion, traza):
+        return False
+
 class ExtraccionTextoPlano(IExtraccion):
+    tipo_entrada = "Textoplano"
+
     def __init__(self, logger=None):
         self.logger = logger
 
@@ -104,73 +263,374 @@ class ExtraccionTextoPlano(IExtraccion):
         return isinstance(entrada, str) and bool(entrada.strip()) # Verificar que la entrada sea una cadena no vacía
     
 class ExtraccionTXT(IExtraccion):
-    def __init__(self, logger=None):
+    """
+    Extractor de archivos de texto.
+
+    El archivo se lee por bloques de tamaño fijo a través de un decodificador incremental, así que
+    la memoria no depende del tamaño del archivo al extraer por partes. La codificación se detecta
+    solo con el primer bloque (UTF-8 si es válido; si no, charset_normalizer) y los bytes
+    inválidos se sustituyen en lugar de rechazar el archivo.
+    """
+    tipo_entrada = "Archivo"
+    extensiones = (".txt",)
+    admite_mapa = True
+
+    def __init__(self, logger=None, tamano_bloque=1024 * 1024):
+        """
+        Args:
+            logger: Logger opcional para registrar eventos
+            tamano_bloque: Bytes que se leen en cada bloque
+        """
         self.logger = logger
-        self.manejador = ManejadorArchivos(logger)
+        self.tamano_bloque = tamano_bloque
 
-    def extraer(self, entrada):
-        return self.manejador.procesar_archivo(ruta=entrada, procesador=lambda x: x.read(),
-                                               tipo_archivo="TXT")
-    
+    def extraer(self, entrada, mapa=None):
+        texto = "".join(self.extraer_partes(entrada, mapa=mapa))
+        if texto and self.logger:
+            self.logger.info(f"Extracción TXT: Exitosa - {entrada}")
+        return texto or None
+
+    def extraer_partes(self, entrada, mapa=None) -> Iterator[str]:
+        """
+        Versión en streaming de extraer(): produce trozos de texto alineados a oraciones.
+        Args:
+            entrada: Ruta del archivo de texto
+            mapa: Contenido ya mapeado en memoria (opcional)
+        Yields: Trozos de texto decodificado, en orden
+        """
+        bloques = leer_bloques(entrada, mapa, self.tamano_bloque, logger=self.logger, tipo_archivo="TXT")
+        return alinear_oraciones(self._decodificar(bloques, entrada))
+
+    def _decodificar(self, bloques: Iterator[bytes], entrada) -> Iterator[str]:
+        """
+        Decodifica los bloques con un decodificador incremental (los caracteres partidos entre
+        bloques se completan con el siguiente).
+        """
+        decodificador = None
+        for bloque in bloques:
+            if decodificador is None:
+                codificacion = self._detectar_codificacion(bloque, entrada)
+                decodificador = codecs.getincrementaldecoder(codificacion)(errors='replace')
+            texto = decodificador.decode(bloque)
+            if texto:
+                yield texto
+        if decodificador is not None:
+            resto = decodificador.decode(b"", final=True)
+            if resto:
+                yield resto
+
+    def _detectar_codificacion(self, bloque: bytes, entrada) -> str:
+        """
+        Detecta la codificación a partir del primer bloque.
+        """
+        if bloque.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(bloque, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        resultado = charset_normalizer.from_bytes(bloque).best()
+        codificacion = resultado.encoding if resultado else 'utf-8'
+        if self.logger:
+            self.logger.info(f"Extracción TXT: Codificación detectada {codificacion} - {entrada}")
+        return codificacion
     
     def puede_extraer(self, entrada):
         return os.path.isfile(entrada) and entrada.lower().endswith('.txt') # Verificar que la entrada sea un archivo con extension .txt
     
 class ExtraccionJSON(IExtraccion):
-    def __init__(self, logger=None):
+    """
+    Extractor de archivos JSON.
+
+    El documento se recorre como un flujo de tokens (json_flujo.iterar_cadenas) en lugar de
+    cargarlo con json.load: se extraen las cadenas de valor, a cualquier profundidad, a medida
+    que aparecen, con memoria acotada. Un selector de rutas permite quedarse solo con algunas
+    (p.ej. "articulos.*.cuerpo"). Igual que con json.load, un documento mal formado o truncado
+    se rechaza entero: extraer() devuelve None y extraer_partes() lanza ValueError.
+    """
+    tipo_entrada = "Archivo"
+    extensiones = (".json",)
+    admite_mapa = True
+
+    def __init__(self, logger=None, selector=None, tamano_bloque=1024 * 1024):
+        """
+        Args:
+            logger: Logger opcional para registrar eventos
+            selector: Ruta de claves separadas por puntos ('*' = cualquiera) o predicado ruta -> bool;
+                None extrae todas las cadenas
+            tamano_bloque: Bytes que se leen en cada bloque
+        """
         self.logger = logger
-        self.manejador = ManejadorArchivos(logger)
+        self.selector = selector
+        self.tamano_bloque = tamano_bloque
 
-    def extraer(self, entrada):
+    def extraer(self, entrada, mapa=None):
+        try:
+            texto = "".join(self.extraer_partes(entrada, mapa=mapa)).strip()
+        except ValueError:
+            return None  # Documento no válido o truncado: ya registrado en extraer_partes()
+        if texto and self.logger:
+            self.logger.info(f"Extracción JSON: Exitosa - {entrada}")
+        return texto or None
 
-        def procesar_json(archivo):
-            data = json.load(archivo)
-            if isinstance(data, dict):
-                return " ".join(str(value) for value in data.values()) # Unir los valores del diccionario en una sola cadena
-            elif isinstance(data, list):
-                return " ".join(str(item) for item in data) # Unir los elementos de la lista en una sola cadena
-            else:
-                raise ValueError(f"El archivo JSON {entrada} no tiene un formato válido.") # Lanzar una excepcion si el formato no es valido
+    def extraer_partes(self, entrada, mapa=None) -> Iterator[str]:
+        """
+        Versión en streaming de extraer(): produce trozos de texto alineados a oraciones.
+        Args:
+            entrada: Ruta del archivo JSON
+            mapa: Contenido ya mapeado en memoria (opcional)
+        Yields: Trozos con las cadenas seleccionadas, separadas por espacios
+        Raises:
+            ValueError: Si el documento no es JSON válido o está truncado (los trozos ya producidos
+                no forman una extracción completa y no deben usarse ni guardarse en caché)
+        """
+        bloques = leer_bloques(entrada, mapa, self.tamano_bloque, logger=self.logger, tipo_archivo="JSON")
+        textos = (texto + " " for _, texto in iterar_cadenas(self._decodificar(bloques), self.selector)
+                  if texto.strip())
+        try:
+            yield from alinear_oraciones(textos)
+        except ValueError as e:
+            if self.logger:
+                self.logger.error(f"Extracción JSON: El archivo {entrada} no tiene un formato válido - {e}")
+            raise
 
-        return self.manejador.procesar_archivo(ruta=entrada, procesador=procesar_json, tipo_archivo="JSON")
+    @staticmethod
+    def _decodificar(bloques: Iterator[bytes]) -> Iterator[str]:
+        """
+        Decodifica los bloques en UTF-8 (RFC 8259): se tolera el BOM y se sustituyen los bytes inválidos,
+        incluida una secuencia multibyte cortada al final del archivo.
+        """
+        decodificador = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+        for bloque in bloques:
+            yield decodificador.decode(bloque)
+        yield decodificador.decode(b"", final=True)
 
     def puede_extraer(self, entrada):
         return os.path.isfile(entrada) and entrada.lower().endswith('.json') # Verificar que la entrada sea un archivo con extension .json
     
 class ExtraccionPDF(IExtraccion):
-    def __init__(self, logger=None):
+    """
+    Extractor de archivos PDF.
+
+    Admite una selección de páginas (números desde 1 o un predicado): solo se accede a los
+    objetos de página pedidos, así que extraer un capítulo cuesta lo que sus páginas y no lo que el archivo.
+    PyPDF2 extrae el texto en Python puro, así que con procesos > 1 las selecciones grandes
+    se reparten por rangos de páginas entre un pool de procesos (cada uno con su propio lector)
+    y las páginas se vuelven a unir en orden. Las selecciones pequeñas se extraen en serie.
+    """
+    admite_paginas = True
+    admite_mapa = True
+    tipo_entrada = "Archivo"
+    extensiones = (".pdf",)
+
+    def __init__(self, logger=None, procesos=1, paginas_minimas=40):
+        """
+        Args:
+            logger: Logger opcional para registrar eventos
+            procesos: Procesos para la extracción en paralelo (1 = en serie, None = uno por núcleo)
+            paginas_minimas: Número de páginas a partir del cual se usa el pool de procesos
+        """
         self.logger = logger
         self.manejador = ManejadorArchivos(logger)
-    def extraer(self, entrada):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.paginas_minimas = paginas_minimas
+
+    def extraer(self, entrada, paginas=None, mapa=None):
+        """
+        Args:
+            entrada: Ruta del archivo PDF
+            paginas: None (todas), iterable de números de página desde 1 o predicado numero -> bool
+            mapa: Contenido del PDF ya mapeado en memoria (opcional)
+        """
         def procesar_pdf(archivo):
-            texto = ""
             lector_pdf = pdf.PdfReader(archivo)
-            for pagina in lector_pdf.pages:
-                texto += pagina.extract_text()
+            indices = seleccionar_paginas(paginas, len(lector_pdf.pages))
+            if self._en_paralelo(len(indices)):
+                texto = "".join(self._paginas_paralelo(entrada, indices))
+            else:
+                texto = "".join(lector_pdf.pages[indice].extract_text() for indice in indices)
 
             if self.logger:
-                self.logger.info("Extraccion de archivo PDF: Exitoso")
+                self.logger.info(f"Extraccion de archivo PDF: Exitoso ({len(indices)} de {len(lector_pdf.pages)} páginas)")
             return texto
         
         
-        return self.manejador.procesar_archivo(ruta=entrada, procesador=procesar_pdf, tipo_archivo="PDF", modo='rb')
+        return self.manejador.procesar_archivo(ruta=entrada, procesador=procesar_pdf, tipo_archivo="PDF", modo='rb',
+                                               mapa=mapa)
+
+    def extraer_paginas(self, entrada, paginas=None, mapa=None) -> Iterator[str]:
+        """
+        Extrae el texto página a página, a medida que se va leyendo el PDF.
+        Args:
+            entrada: Ruta del archivo PDF
+            paginas: Selección de páginas, como en extraer()
+            mapa: Contenido del PDF ya mapeado en memoria (opcional)
+        Yields: Texto de cada página seleccionada (cadena vacía si la página no tiene texto)
+        """
+        try:
+            with ManejadorArchivos._abrir(entrada, 'rb', None, mapa) as archivo:
+                lector_pdf = pdf.PdfReader(archivo)
+                indices = seleccionar_paginas(paginas, len(lector_pdf.pages))
+                if self._en_paralelo(len(indices)):
+                    yield from self._paginas_paralelo(entrada, indices)
+                    return
+                for indice in indices:
+                    texto = lector_pdf.pages[indice].extract_text() or ""
+                    if self.logger:
+                        self.logger.debug(f"Extraccion de archivo PDF: página {indice + 1} ({len(texto)} caracteres)")
+                    yield texto
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Extracción PDF: Error durante la extracción por páginas - {entrada} - {e}")
+
+    def _en_paralelo(self, total_paginas: int) -> bool:
+        return self.procesos > 1 and total_paginas >= self.paginas_minimas
+
+    def _paginas_paralelo(self, ruta: str, indices: list) -> Iterator[str]:
+        """
+        Reparte las páginas en rangos entre un pool de procesos y devuelve su texto en orden.
+        Cada rango se entrega en cuanto están listos él y todos los anteriores.
+        """
+        # Varios rangos por proceso para equilibrar páginas más costosas que otras
+        tamano = max(1, -(-len(indices) // (self.procesos * 4)))
+        rangos = [indices[inicio:inicio + tamano] for inicio in range(0, len(indices), tamano)]
+        if self.logger:
+            self.logger.info(f"Extraccion de archivo PDF: {len(indices)} páginas en {len(rangos)} rangos "
+                             f"con {self.procesos} procesos")
+
+        with ProcessPoolExecutor(max_workers=min(self.procesos, len(rangos))) as pool:
+            futuros = [pool.submit(_extraer_paginas_pdf, ruta, rango) for rango in rangos]
+            try:
+                for futuro in futuros:
+                    yield from futuro.result()
+            finally:
+                # Si el consumidor abandona el generador o falla un rango, no se esperan los demás
+                for futuro in futuros:
+                    futuro.cancel()
+
+    def extraer_partes(self, entrada, paginas=None, mapa=None) -> Iterator[str]:
+        """
+        Versión en streaming de extraer(): produce trozos de texto alineados a oraciones
+        en cuanto se han leído las páginas necesarias, sin esperar al documento completo.
+        """
+        return alinear_oraciones(self.extraer_paginas(entrada, paginas, mapa))
     
     def puede_extraer(self, entrada):
         return os.path.isfile(entrada) and entrada.lower().endswith('.pdf') # Verificar que la entrada sea un archivo con extension .pdf
     
+# Sesión HTTP compartida por todo el proceso (pool de conexiones con keep-alive)
+_sesion_http = None
+_lock_sesion = threading.Lock()
+
+def obtener_sesion(conexiones: int = 16) -> 'requests.Session':
+    """
+    Devuelve la sesión HTTP del proceso, creándola la primera vez.
+    Todas las descargas la comparten, así que las conexiones (y sus handshakes TLS) se reutilizan
+    entre estrategias y entre URLs del mismo host.
+    Args: conexiones: Conexiones que se mantienen abiertas por host
+    """
+    global _sesion_http
+    with _lock_sesion:
+        if _sesion_http is None:
+            sesion = requests.Session()
+            adaptador = adaptadores_http.HTTPAdapter(pool_connections=conexiones, pool_maxsize=conexiones)
+            sesion.mount("http://", adaptador)
+            sesion.mount("https://", adaptador)
+            _sesion_http = sesion
+        return _sesion_http
+
+class DescargadorHTTP:
+    """
+    Capa de descarga para las estrategias de URL: una sola petición por URL a través de la
+    sesión compartida; el cuerpo descargado se entrega después a cada estrategia de análisis.
+    """
+    def __init__(self, logger=None, timeout=time_request_limit, sesion=None):
+        """
+        Args:
+            logger: Logger opcional para registrar eventos
+            timeout: Timeout de cada petición en segundos
+            sesion: Sesión requests a usar (por defecto, la compartida del proceso)
+        """
+        self.logger = logger
+        self.timeout = timeout
+        self._sesion = sesion
+
+    @property
+    def sesion(self):
+        # La sesión compartida (e importar requests) se crea con la primera descarga
+        if self._sesion is None:
+            self._sesion = obtener_sesion()
+        return self._sesion
+
+    def descargar(self, entrada, cabeceras=None, flujo=False) -> Optional['requests.Response']:
+        """
+        Descarga la URL.
+        Args:
+            entrada: URL a descargar
+            cabeceras: Cabeceras adicionales; con If-None-Match / If-Modified-Since la petición es condicional
+            flujo: Si es True el cuerpo no se lee: el llamador lo recorre con iter_content() y cierra la respuesta
+        Returns: Respuesta con código 200 (contenido ya leído salvo en modo flujo), 304 si la petición
+            condicional indica que no hay cambios, o None si falla
+        """
+        try:
+            respuesta = self.sesion.get(entrada, timeout=self.timeout, headers=cabeceras, stream=flujo) # Realizar una solicitud GET a la URL con un timeout definido
+
+            if respuesta.status_code == 304 and cabeceras:
+                if self.logger:
+                    self.logger.debug(f"Extracción URL: Sin cambios (304) - {entrada}")
+                return respuesta
+
+            if respuesta.status_code != 200:
+                if self.logger:
+                    self.logger.warning(f"Extracción de URL: Código de estado HTTP no válido: {respuesta.status_code}.")
+                respuesta.close()
+                return None
+
+            if self.logger and not flujo:
+                self.logger.debug(f"Extracción URL: Descargados {len(respuesta.content)} bytes - {entrada}")
+            return respuesta
+
+        except requests.exceptions.Timeout:
+            if self.logger:
+                self.logger.warning(f"Extracción URL: Timeout ({self.timeout}s) - {entrada}")
+        
+        except requests.exceptions.ConnectionError:
+            if self.logger:
+                self.logger.error(f"Extracción URL: Error de conexión - {entrada}")
+        
+        except requests.exceptions.RequestException as e:
+            if self.logger:
+                self.logger.error(f"Extracción URL: Error de requests - {e}")
+        
+        return None
+
 class EstrategiaExtraccionURL(ABC):
     @abstractmethod
-    def extraer(self, entrada) -> Optional[str]:
+    def extraer(self, entrada, respuesta=None) -> Optional[str]:
+        """
+        Args:
+            entrada: URL a extraer
+            respuesta: Respuesta ya descargada de la URL; si es None, la estrategia la descarga
+        """
         pass
 
 class ExtraccionURLNewspaper(EstrategiaExtraccionURL):
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, descargador=None):
         self.logger = logger
+        self.descargador = descargador or DescargadorHTTP(logger)
 
-    def extraer(self, entrada):
+    def extraer(self, entrada, respuesta=None):
         try:
-            articulo = Article(entrada)
-            articulo.download()
+            if respuesta is None:
+                respuesta = self.descargador.descargar(entrada)
+            if respuesta is None:
+                return None
+            articulo = newspaper.Article(entrada)
+            # Se analiza el HTML ya descargado, sin otra petición. Sin charset en Content-Type, requests
+            # decodificaría como ISO-8859-1: se pasan los bytes para que newspaper detecte la codificación
+            html_descargado = respuesta.text if codificacion_declarada(respuesta) else respuesta.content
+            articulo.download(input_html=html_descargado)
             articulo.parse()
 
             if articulo.text:
@@ -184,45 +644,31 @@ class ExtraccionURLNewspaper(EstrategiaExtraccionURL):
         return None
     
 class ExtraccionURLRequests(EstrategiaExtraccionURL):
-    def __init__(self, logger=None, parser='lxml', timeout=time_request_limit):
+    def __init__(self, logger=None, parser='lxml', timeout=time_request_limit, descargador=None):
         self.logger = logger
         self.parser = parser
         self.timeout = timeout
-    def extraer(self, entrada):
-        try:
-            respuesta = requests.get(entrada, timeout=self.timeout) # Realizar una solicitud GET a la URL con un timeout definido
-
-            if respuesta.status_code != 200:
-                if self.logger:
-                    self.logger.warning(f"Extracción de URL: Código de estado HTTP no válido: {respuesta.status_code}.")
-                return None
-            
-            if self.parser == 'lxml':
-                texto = self._extraer_lxml(respuesta)
+        self.descargador = descargador or DescargadorHTTP(logger, timeout=timeout)
+    def extraer(self, entrada, respuesta=None):
+        if respuesta is None:
+            respuesta = self.descargador.descargar(entrada)
+        if respuesta is None:
+            return None
 
-            
-            else:
-                texto = self._extraer_bs(respuesta)
+        if self.parser == 'lxml':
+            texto = self._extraer_lxml(respuesta)
 
-            if texto:
-                if self.logger:
-                    self.logger.info(f"Extracción de URL ({self.parser}): Exitosa")
-                return texto
-            else:
-                if self.logger:
-                    self.logger.warning(f"Extracción URL ({self.parser}): Sin contenido - {entrada}")
         
-        except requests.exceptions.Timeout:
-            if self.logger:
-                self.logger.warning(f"Extracción URL: Timeout ({self.timeout}s) - {entrada}")
-        
-        except requests.exceptions.ConnectionError:
+        else:
+            texto = self._extraer_bs(respuesta)
+
+        if texto:
             if self.logger:
-                self.logger.error(f"Extracción URL: Error de conexión - {entrada}")
-        
-        except requests.exceptions.RequestException as e:
+                self.logger.info(f"Extracción de URL ({self.parser}): Exitosa")
+            return texto
+        else:
             if self.logger:
-                self.logger.error(f"Extracción URL: Error de requests - {e}")
+                self.logger.warning(f"Extracción URL ({self.parser}): Sin contenido - {entrada}")
         
         return None
         
@@ -241,7 +687,7 @@ class ExtraccionURLRequests(EstrategiaExtraccionURL):
     
     def _extraer_bs(self, respuesta):
         try:
-            soup = bs(respuesta.content, 'html.parser')
+            soup = bs4.BeautifulSoup(respuesta.content, 'html.parser')
             texto_encabezados = ' '.join(h.get_text() for h in soup.find_all(['h1', 'h2', 'h3']))
             texto_parrafos = ' '.join(p.get_text() for p in soup.find_all('p'))
             texto = (texto_encabezados + " " + texto_parrafos).strip()
@@ -251,27 +697,322 @@ class ExtraccionURLRequests(EstrategiaExtraccionURL):
                 self.logger.error(f"Extracción de URL (BeautifulSoup): Error al extraer el contenido - {str(e)}")
             return None
     
+class RespuestaLeida:
+    """
+    Cuerpo de una respuesta descargada en flujo (hasta el límite de bytes), con la interfaz
+    de requests.Response que usan las estrategias (content, text, headers, status_code).
+    """
+    def __init__(self, respuesta, contenido: bytes):
+        self.status_code = respuesta.status_code
+        self.headers = respuesta.headers
+        self.url = respuesta.url
+        self.encoding = respuesta.encoding
+        self.content = contenido
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+class ExtraccionURLIncremental(EstrategiaExtraccionURL):
+    """
+    Extrae el texto de h1-h3 y p en una sola pasada con el parser HTML incremental de lxml.
+
+    El HTML se entrega al parser por bloques y el texto de cada elemento sale en cuanto se cierra,
+    en orden de documento; los elementos ya procesados se liberan, así que la memoria no crece
+    con el tamaño de la página. Como mucho se leen max_bytes del cuerpo.
+    """
+    ETIQUETAS = ('h1', 'h2', 'h3', 'p')
+
+    def __init__(self, logger=None, descargador=None, max_bytes=8 * 1024 * 1024, tamano_bloque=64 * 1024):
+        """
+        Args:
+            logger: Logger opcional para registrar eventos
+            descargador: DescargadorHTTP a usar si no se recibe la respuesta
+            max_bytes: Bytes máximos del cuerpo que se analizan
+            tamano_bloque: Bytes que se entregan al parser en cada paso
+        """
+        self.logger = logger
+        self.descargador = descargador or DescargadorHTTP(logger)
+        self.max_bytes = max_bytes
+        self.tamano_bloque = tamano_bloque
+
+    def extraer(self, entrada, respuesta=None):
+        if respuesta is None:
+            respuesta = self.descargador.descargar(entrada)
+        if respuesta is None:
+            return None
+        contenido = respuesta.content[:self.max_bytes]
+        bloques = (contenido[inicio:inicio + self.tamano_bloque] for inicio in range(0, len(contenido), self.tamano_bloque))
+        texto = " ".join(self.textos(bloques, codificacion_declarada(respuesta))).strip()
+        if texto:
+            if self.logger:
+                self.logger.info("Extracción de URL (incremental): Exitosa")
+            return texto
+        if self.logger:
+            self.logger.warning(f"Extracción URL (incremental): Sin contenido - {entrada}")
+        return None
+
+    def textos(self, bloques: Iterable[bytes], codificacion: Optional[str] = None) -> Iterator[str]:
+        """
+        Analiza el HTML bloque a bloque.
+        Args:
+            bloques: Cuerpo de la respuesta en bloques de bytes
+            codificacion: Codificación declarada en las cabeceras (None = la detecta lxml)
+        Yields: Nodos de texto de los encabezados y párrafos, en orden de documento
+        """
+        parser = etree.HTMLPullParser(events=('end',), encoding=codificacion)
+        try:
+            for bloque in bloques:
+                parser.feed(bloque)
+                yield from self._recoger(parser)
+            parser.close()
+        except etree.LxmlError as e:
+            if self.logger:
+                self.logger.warning(f"Extracción de URL (incremental): HTML no analizable - {e}")
+        yield from self._recoger(parser)
+
+    def _recoger(self, parser) -> Iterator[str]:
+        """
+        Devuelve el texto de los elementos ya cerrados y libera los que no se necesitan.
+        """
+        for _, elemento in parser.read_events():
+            if self._es_objetivo(elemento):
+                # Mismos nodos que //p/text(): el texto propio y la cola de cada hijo
+                for nodo in [elemento.text] + [hijo.tail for hijo in elemento]:
+                    if nodo and nodo.strip():
+                        yield nodo
+            padre = elemento.getparent()
+            # Dentro de un encabezado o párrafo las colas de los hijos aún hacen falta
+            if padre is None or self._es_objetivo(padre):
+                continue
+            elemento.clear(keep_tail=True)
+            while elemento.getprevious() is not None:
+                del padre[0]
+
+    def _es_objetivo(self, elemento) -> bool:
+        return isinstance(elemento.tag, str) and elemento.tag.lower() in self.ETIQUETAS
+
+def codificacion_declarada(respuesta) -> Optional[str]:
+    """
+    Charset indicado explícitamente en Content-Type (requests supone ISO-8859-1 si falta).
+    """
+    tipo = respuesta.headers.get('Content-Type', '')
+    return respuesta.encoding if 'charset=' in tipo.lower() else None
+
 class ExtraccionURL(IExtraccion):
-    def __init__(self, logger=None, timeout=time_request_limit):
+    """
+    Extractor de URLs: descarga la página una vez y la analiza con varias estrategias.
+
+    En modo 'secuencial' cada estrategia empieza cuando la anterior ha fallado.
+    En modo 'carrera' las estrategias analizan la misma descarga en paralelo (todas a la vez,
+    o escalonadas cada retardo_cobertura segundos) y gana el primer resultado que alcance
+    longitud_minima; las que no han empezado se cancelan y las que siguen en curso se ignoran.
+
+    Con html_incremental el cuerpo se descarga en flujo y se entrega por bloques al parser
+    incremental (ExtraccionURLIncremental), que produce texto antes de terminar la descarga y lee
+    como mucho max_bytes; si no encuentra texto, las estrategias anteriores analizan lo ya leído.
+    """
+    tipo_entrada = "URL"
+
+    def __init__(self, logger=None, timeout=time_request_limit, modo='secuencial', retardo_cobertura=None,
+                 longitud_minima=1, cache=None, html_incremental=False, max_bytes=8 * 1024 * 1024):
+        """
+        Args:
+            logger: Logger opcional para registrar eventos
+            timeout: Timeout de la descarga en segundos
+            modo: 'secuencial' o 'carrera'
+            retardo_cobertura: En modo carrera, segundos que se espera a una estrategia antes de lanzar
+                la siguiente (None = todas a la vez). Si una estrategia falla, la siguiente empieza enseguida.
+            longitud_minima: Caracteres mínimos para aceptar el resultado de una estrategia
+            cache: Caché de extracción (ICacheExtraccion); las URLs ya extraídas se revalidan con un GET
+                condicional y, si no han cambiado, se devuelve el texto guardado sin descargar el cuerpo
+            html_incremental: Si se descarga en flujo y se analiza con el parser incremental
+            max_bytes: Bytes máximos del cuerpo que se leen en modo incremental
+        """
+        if modo not in ('secuencial', 'carrera'):
+            raise ValueError(f"Modo de extracción URL no válido: {modo}")
         self.logger = logger
-        self.estrategias = [ExtraccionURLNewspaper(logger), ExtraccionURLRequests(parser='lxml', timeout=timeout, logger=logger),
-            ExtraccionURLRequests(parser='beautifulsoup', timeout=timeout, logger=logger)]
+        self.cache = cache
+        self.modo = modo
+        self.retardo_cobertura = retardo_cobertura
+        self.longitud_minima = longitud_minima
+        self.descargador = DescargadorHTTP(logger, timeout=timeout)
+        self.estrategias = [ExtraccionURLNewspaper(logger, descargador=self.descargador),
+            ExtraccionURLRequests(parser='lxml', timeout=timeout, logger=logger, descargador=self.descargador),
+            ExtraccionURLRequests(parser='beautifulsoup', timeout=timeout, logger=logger, descargador=self.descargador)]
+        self.incremental = ExtraccionURLIncremental(logger, descargador=self.descargador,
+                                                    max_bytes=max_bytes) if html_incremental else None
         
     def extraer(self, entrada):
-        #bloque try-except para capturar errores inesperados
-        for estrategia in self.estrategias:
-            nombre_estrategia = estrategia.__class__.__name__
-            if self.logger:
-                self.logger.debug(f"Intentando extracción con: {nombre_estrategia}")
-            texto = estrategia.extraer(entrada)
-            if texto:
-                return texto
+        if self.incremental:
+            return "".join(self.extraer_partes(entrada)).strip() or None
+
+        # La página se descarga una sola vez y se reparte entre las estrategias de análisis
+        respuesta, clave, guardada = self._descargar(entrada)
+        if respuesta is None:
+            return None
+        if respuesta.status_code == 304:
+            return guardada['texto']
+
+        texto = self._analizar(entrada, respuesta)
+        if texto:
+            if self.cache:
+                self.cache.guardar(clave, texto, etag=respuesta.headers.get('ETag'),
+                                   last_modified=respuesta.headers.get('Last-Modified'))
+            return texto
         
         # Todas las estrategias fallaron
         if self.logger:
             self.logger.warning(f"Extracción URL: Todas las estrategias fallaron - {entrada}")
         
         return None
+
+    def extraer_partes(self, entrada) -> Iterator[str]:
+        """
+        Versión en streaming de extraer(). En modo incremental produce trozos alineados a oraciones
+        mientras la página se descarga; si no, un único trozo con el resultado de extraer().
+        """
+        if not self.incremental:
+            texto = self.extraer(entrada)
+            if texto:
+                yield texto
+            return
+
+        respuesta, clave, guardada = self._descargar(entrada, flujo=True)
+        if respuesta is None:
+            return
+        if respuesta.status_code == 304:
+            respuesta.close()
+            yield guardada['texto']
+            return
+
+        # Bloques leídos, por si no sale texto y hay que recurrir a las otras estrategias;
+        # en cuanto se produce el primer trozo dejan de hacer falta
+        leidos = []
+        producidas = []
+        acumulado = 0
+        textos = self.incremental.textos(self._bloques(entrada, respuesta, leidos), codificacion_declarada(respuesta))
+        for parte in alinear_oraciones(texto + " " for texto in textos):
+            leidos.clear()
+            acumulado += len(parte)
+            if producidas is not None:
+                producidas.append(parte)
+                # Los textos muy grandes no se guardan en caché, para no acumularlos en memoria
+                if not self.cache or acumulado > LIMITE_CACHE_PARTES:
+                    producidas = None
+            yield parte
+
+        if acumulado:
+            if not producidas:
+                return
+            texto = "".join(producidas).strip()
+        else:
+            texto = self._analizar(entrada, RespuestaLeida(respuesta, b"".join(leidos)))
+            if not texto:
+                if self.logger:
+                    self.logger.warning(f"Extracción URL: Todas las estrategias fallaron - {entrada}")
+                return
+            yield texto
+        if self.cache:
+            self.cache.guardar(clave, texto, etag=respuesta.headers.get('ETag'),
+                               last_modified=respuesta.headers.get('Last-Modified'))
+
+    def _descargar(self, entrada, flujo=False):
+        """
+        Descarga la URL (condicionalmente si está en caché).
+        Returns: Tupla (respuesta o None, clave de caché, entrada de caché guardada)
+        """
+        clave = guardada = None
+        if self.cache:
+            clave = self.cache.clave_url(entrada)
+            guardada = self.cache.obtener(clave)
+
+        respuesta = self.descargador.descargar(entrada, cabeceras=self.cache.validadores(guardada) if guardada else None,
+                                               flujo=flujo)
+        if respuesta is None:
+            if self.logger:
+                self.logger.warning(f"Extracción URL: No se pudo descargar - {entrada}")
+        elif respuesta.status_code == 304 and self.logger:
+            self.logger.info(f"Extracción URL: Sin cambios, se usa el texto en caché - {entrada}")
+        return respuesta, clave, guardada
+
+    def _bloques(self, entrada, respuesta, leidos) -> Iterator[bytes]:
+        """
+        Recorre el cuerpo de una respuesta en flujo hasta max_bytes, guardando lo leído en leidos.
+        """
+        limite = self.incremental.max_bytes
+        total = 0
+        try:
+            for bloque in respuesta.iter_content(chunk_size=self.incremental.tamano_bloque):
+                bloque = bloque[:limite - total]
+                total += len(bloque)
+                leidos.append(bloque)
+                yield bloque
+                if total >= limite:
+                    if self.logger:
+                        self.logger.warning(f"Extracción URL: Página truncada a {limite} bytes - {entrada}")
+                    break
+        except requests.exceptions.RequestException as e:
+            if self.logger:
+                self.logger.error(f"Extracción URL: Error durante la descarga - {entrada} - {e}")
+        finally:
+            respuesta.close()
+
+    def _analizar(self, entrada, respuesta) -> Optional[str]:
+        """
+        Aplica las estrategias de análisis a la respuesta descargada, según el modo.
+        """
+        if self.modo == 'carrera':
+            return self._extraer_carrera(entrada, respuesta)
+        for estrategia in self.estrategias:
+            nombre_estrategia = estrategia.__class__.__name__
+            if self.logger:
+                self.logger.debug(f"Intentando extracción con: {nombre_estrategia}")
+            texto = estrategia.extraer(entrada, respuesta)
+            if self._aceptable(texto):
+                return texto
+        return None
+
+    def _aceptable(self, texto) -> bool:
+        return bool(texto) and len(texto) >= self.longitud_minima
+
+    def _extraer_carrera(self, entrada, respuesta) -> Optional[str]:
+        """
+        Lanza las estrategias en paralelo sobre la misma respuesta y devuelve el primer resultado aceptable.
+        """
+        hilos = ThreadPoolExecutor(max_workers=len(self.estrategias))
+        por_lanzar = list(self.estrategias)
+        en_curso = {}
+        try:
+            while por_lanzar or en_curso:
+                # Todas a la vez sin retardo; con retardo, una más cada vez que vence la espera o falla alguna
+                while por_lanzar and (self.retardo_cobertura is None or not en_curso):
+                    self._lanzar(hilos, por_lanzar.pop(0), entrada, respuesta, en_curso)
+
+                espera = self.retardo_cobertura if por_lanzar else None
+                hechos, _ = wait(en_curso, timeout=espera, return_when=FIRST_COMPLETED)
+                if not hechos:
+                    self._lanzar(hilos, por_lanzar.pop(0), entrada, respuesta, en_curso)
+                    continue
+                for futuro in hechos:
+                    nombre_estrategia = en_curso.pop(futuro)
+                    texto = futuro.result()
+                    if self._aceptable(texto):
+                        if self.logger:
+                            self.logger.debug(f"Extracción URL: {nombre_estrategia} gana la carrera")
+                        return texto
+                if por_lanzar:
+                    self._lanzar(hilos, por_lanzar.pop(0), entrada, respuesta, en_curso)
+            return None
+        finally:
+            # No se espera a las estrategias que siguen analizando: su resultado ya no se usa
+            hilos.shutdown(wait=False, cancel_futures=True)
+
+    def _lanzar(self, hilos, estrategia, entrada, respuesta, en_curso):
+        nombre_estrategia = estrategia.__class__.__name__
+        if self.logger:
+            self.logger.debug(f"Intentando extracción con: {nombre_estrategia}")
+        en_curso[hilos.submit(estrategia.extraer, entrada, respuesta)] = nombre_estrategia
     
     def puede_extraer(self, entrada: str) -> bool:
         """Verifica si es una URL válida."""
@@ -291,25 +1032,37 @@ class GestorExtractores:
     - Manejo unificado de errores
     """
     
-    def __init__(self, logger=None, timeout_http=time_request_limit):
+    def __init__(self, logger=None, timeout_http=time_request_limit, procesos_pdf=1, modo_url='secuencial',
+                 retardo_cobertura=None, cache=None, selector_json=None, html_incremental=False,
+                 max_bytes_html=8 * 1024 * 1024):
         """
         Inicializa el gestor con extractores predeterminados.
         
         Args:
             logger: Logger opcional para todos los extractores
             timeout_http: Timeout para peticiones HTTP (solo URLs)
+            procesos_pdf: Procesos para extraer PDFs grandes en paralelo (1 = en serie, None = uno por núcleo)
+            modo_url: 'secuencial' o 'carrera' para las estrategias de URL (ver ExtraccionURL)
+            retardo_cobertura: En modo carrera, segundos antes de lanzar la siguiente estrategia
+            cache: Caché de extracción (ICacheExtraccion) para archivos y URLs ya extraídos
+            selector_json: Rutas de los archivos JSON cuyo texto se extrae (ver ExtraccionJSON)
+            html_incremental: Si las URLs se descargan en flujo y se analizan con el parser incremental
+            max_bytes_html: Bytes máximos que se leen de cada página en modo incremental
         """
         self.logger = logger
+        self.cache = cache
         
         # Extractores en orden de prioridad
         # El orden importa: se prueba de arriba a abajo hasta encontrar uno compatible
-        self.extractores = [ExtraccionURL(logger, timeout=timeout_http), ExtraccionPDF(logger), ExtraccionJSON(logger),                       
-            ExtraccionTXT(logger), ExtraccionTextoPlano(logger)]
+        self.extractores = [ExtraccionURL(logger, timeout=timeout_http, modo=modo_url, retardo_cobertura=retardo_cobertura,
+                                          cache=cache, html_incremental=html_incremental, max_bytes=max_bytes_html),
+            ExtraccionPDF(logger, procesos=procesos_pdf),
+            ExtraccionJSON(logger, selector=selector_json), ExtraccionTXT(logger), ExtraccionTextoPlano(logger)]
         
         if self.logger:
             self.logger.info(f"GestorExtractores inicializado con {len(self.extractores)} extractores")
     
-    def extraer(self, entrada: str) -> Optional[str]:
+    def extraer(self, entrada: str, paginas=None) -> Optional[str]:
         """
         Extrae texto usando el extractor apropiado.
         Método principal del gestor (Facade Pattern).
@@ -320,21 +1073,37 @@ class GestorExtractores:
         3. Usa el primer extractor compatible
         4. Retorna texto extraído o None si todos fallan
         
-        Args: entrada: Texto, archivo o URL a procesar
+        Args:
+            entrada: Texto, archivo o URL a procesar, o su DescriptorEntrada ya clasificado
+                (en ese caso el extractor se elige por tipo y extensión, sin volver a comprobar la entrada)
+            paginas: Selección de páginas (números desde 1 o predicado); solo la usan los
+                extractores que la admiten (PDF) y el resto la ignora
         Returns: Texto extraído o None si falla
         """
-        for extractor in self.extractores:
+        descriptor = entrada if isinstance(entrada, DescriptorEntrada) else None
+        entrada, extractores = self._candidatos(entrada)
+        clave = self._clave_archivo(entrada, extractores, descriptor, paginas)
+        if clave:
+            guardada = self.cache.obtener(clave)
+            if guardada:
+                if self.logger:
+                    self.logger.info(f"Extracción desde caché: {entrada}")
+                return guardada['texto']
+
+        for extractor in extractores:
             # Verificar si este extractor puede extraer la entrada
-            if extractor.puede_extraer(entrada):
+            if descriptor or extractor.puede_extraer(entrada):
                 nombre_extractor = extractor.__class__.__name__
                 
                 if self.logger:
                     self.logger.debug(f"Usando extractor: {nombre_extractor} para '{entrada}'")
                 
                 # Intentar extracción
-                texto = extractor.extraer(entrada)
+                texto = extractor.extraer(entrada, **self._opciones(extractor, paginas, descriptor))
                 
                 if texto:
+                    if clave:
+                        self.cache.guardar(clave, texto)
                     return texto
                 else:
                     if self.logger:
@@ -346,8 +1115,105 @@ class GestorExtractores:
                                "(ningún extractor compatible o todos fallaron)")
         return None
 
+    def extraer_partes(self, entrada: str, paginas=None) -> Iterator[str]:
+        """
+        Variante en streaming de extraer(): devuelve el texto en trozos a medida que se extrae.
+        Los extractores con extraer_partes() (p.ej. PDF) producen varios trozos; el resto, uno solo.
+        
+        Args:
+            entrada: Texto, archivo o URL a procesar, o su DescriptorEntrada, como en extraer()
+            paginas: Selección de páginas, como en extraer()
+        Yields: Trozos de texto extraído, en orden
+        Raises:
+            ValueError: Si el extractor descubre a mitad de la lectura que la entrada no es válida
+                (p.ej. un JSON truncado); en ese caso no se guarda nada en caché
+        """
+        descriptor = entrada if isinstance(entrada, DescriptorEntrada) else None
+        entrada, extractores = self._candidatos(entrada)
+        clave = self._clave_archivo(entrada, extractores, descriptor, paginas)
+        if clave:
+            guardada = self.cache.obtener(clave)
+            if guardada:
+                if self.logger:
+                    self.logger.info(f"Extracción desde caché: {entrada}")
+                texto = guardada['texto']
+                yield from alinear_oraciones(texto[inicio:inicio + 2000] for inicio in range(0, len(texto), 2000))
+                return
+
+        for extractor in extractores:
+            if not descriptor and not extractor.puede_extraer(entrada):
+                continue
+            nombre_extractor = extractor.__class__.__name__
+            if self.logger:
+                self.logger.debug(f"Usando extractor: {nombre_extractor} para '{entrada}' (por partes)")
 
+            opciones = self._opciones(extractor, paginas, descriptor)
+            if hasattr(extractor, 'extraer_partes'):
+                partes = extractor.extraer_partes(entrada, **opciones)
+            else:
+                texto = extractor.extraer(entrada, **opciones)
+                partes = [texto] if texto else []
 
+            producidas = [] if clave else None
+            acumulado = 0
+            for parte in partes:
+                if parte:
+                    acumulado += len(parte)
+                    if producidas is not None:
+                        producidas.append(parte)
+                        # Los textos muy grandes no se guardan en caché, para no acumularlos en memoria
+                        if acumulado > LIMITE_CACHE_PARTES:
+                            producidas = None
+                    yield parte
+            if acumulado:
+                if producidas:
+                    self.cache.guardar(clave, "".join(producidas))
+                return
+            if self.logger:
+                self.logger.warning(f"Extractor {nombre_extractor} compatible pero falló la extracción")
+
+        if self.logger:
+            self.logger.error(f"No se pudo extraer texto de: {entrada[:100]}... "
+                               "(ningún extractor compatible o todos fallaron)")
 
+    def _opciones(self, extractor, paginas, descriptor=None) -> dict:
+        """
+        Argumentos opcionales que admite el extractor para esta extracción.
+        """
+        opciones = {}
+        if descriptor is not None and descriptor.mapa is not None and extractor.admite_mapa:
+            opciones['mapa'] = descriptor.mapa
+        if paginas is None:
+            return opciones
+        if extractor.admite_paginas:
+            opciones['paginas'] = paginas
+        elif self.logger:
+            self.logger.warning(f"{extractor.__class__.__name__} no admite selección de páginas; se extrae todo")
+        return opciones
 
+    def _candidatos(self, entrada):
+        """
+        Devuelve el valor a extraer y los extractores a probar.
+        Con un DescriptorEntrada solo se prueban los extractores que admiten su tipo y extensión,
+        sin repetir las comprobaciones de puede_extraer() sobre la entrada.
+        """
+        if isinstance(entrada, DescriptorEntrada):
+            return entrada.valor, [extractor for extractor in self.extractores if extractor.admite(entrada)]
+        return entrada, self.extractores
 
+    def _clave_archivo(self, entrada, extractores, descriptor, paginas) -> Optional[str]:
+        """
+        Clave de caché de una entrada de archivo, o None si no hay caché, no es un archivo
+        o la selección de páginas es un predicado (no se puede identificar).
+        """
+        if self.cache is None or callable(paginas):
+            return None
+        if descriptor is not None:
+            if not any(extractor.tipo_entrada == "Archivo" for extractor in extractores):
+                return None
+        elif not os.path.isfile(entrada):
+            return None
+        variante = None if paginas is None else sorted(set(paginas))
+        if descriptor is not None and descriptor.mapa is not None:
+            return self.cache.clave_archivo(entrada, variante=variante, estado=descriptor.estado, datos=descriptor.mapa)
+        return self.cache.clave_archivo(entrada, variante=variante)
@@ -0,0 +1,93 @@
+"Extraccion concurrente de muchas URLs en un pool de hilos, con límites global y por host"
+
+# Librerías estándar de Python
+import asyncio     # Concurrencia de las descargas
+from concurrent.futures import ThreadPoolExecutor  # Hilos para las descargas bloqueantes
+from typing import AsyncIterator, Iterable
+from urllib.parse import urlsplit
+
+from extraccion_validacion.extraccion_datos import ExtraccionURL, time_request_limit
+
+class ExtractorURLsLotes:
+    """
+    Extrae el texto de muchas URLs a la vez en un pool de hilos.
+
+    Las descargas son las bloqueantes de siempre: cada URL pasa por ExtraccionURL (sesión HTTP
+    compartida y las estrategias de análisis habituales) en un hilo del pool. asyncio solo reparte
+    los turnos con dos semáforos, uno global de peticiones simultáneas y otro por host para no
+    saturar un mismo servidor, y permite consumir los resultados con async for según terminan.
+    Cada petición respeta el timeout de ExtraccionURL (time_request_limit por defecto).
+
+    Es una API independiente para quien tenga una lista de URLs: el pipeline (GestorExtractores,
+    main.py) procesa una sola entrada y no la usa.
+    """
+    def __init__(self, logger=None, limite_global=16, limite_por_host=4, timeout=time_request_limit,
+                 extractor=None):
+        """
+        Args:
+            logger: Logger opcional para registrar eventos
+            limite_global: Máximo de URLs extrayéndose a la vez
+            limite_por_host: Máximo de URLs del mismo host extrayéndose a la vez
+            timeout: Timeout de cada petición HTTP en segundos
+            extractor: Extractor de una URL (por defecto, ExtraccionURL con ese timeout)
+        """
+        self.logger = logger
+        self.limite_global = limite_global
+        self.limite_por_host = limite_por_host
+        self.extractor = extractor or ExtraccionURL(logger, timeout=timeout)
+
+    async def extraer(self, urls: Iterable[str]) -> AsyncIterator[tuple]:
+        """
+        Extrae todas las URLs de forma concurrente.
+        Args: urls: URLs a extraer
+        Yields: Tuplas (url, texto) en orden de finalización; texto es None si la extracción falla
+        """
+        bucle = asyncio.get_running_loop()
+        hilos = ThreadPoolExecutor(max_workers=self.limite_global)
+        global_ = asyncio.Semaphore(self.limite_global)
+        por_host = {}
+
+        async def extraer_url(url):
+            host = urlsplit(url).netloc.lower()
+            semaforo_host = por_host.setdefault(host, asyncio.Semaphore(self.limite_por_host))
+            # Primero el hueco del host y después el global: una URL que espera turno en un host
+            # saturado no debe retener un hueco global que podría usar otro host
+            async with semaforo_host:
+                async with global_:
+                    try:
+                        return url, await bucle.run_in_executor(hilos, self.extractor.extraer, url)
+                    except Exception as e:
+                        if self.logger:
+                            self.logger.error(f"Extracción URL en lote: Error inesperado - {url} - {e}")
+                        return url, None
+
+        tareas = []
+        try:
+            for url in urls:
+                if self.extractor.puede_extraer(url):
+                    tareas.append(asyncio.ensure_future(extraer_url(url)))
+                else:
+                    if self.logger:
+                        self.logger.warning(f"Extracción URL en lote: URL no válida - {url}")
+                    yield url, None
+
+            if self.logger:
+                self.logger.info(f"Extracción URL en lote: {len(tareas)} URLs "
+                                 f"(límite global {self.limite_global}, por host {self.limite_por_host})")
+            for siguiente in asyncio.as_completed(tareas):
+                yield await siguiente
+        finally:
+            # Si el consumidor deja de iterar, las URLs que aún no han empezado no se descargan
+            for tarea in tareas:
+                tarea.cancel()
+            hilos.shutdown(wait=False, cancel_futures=True)
+
+    def extraer_todas(self, urls: Iterable[str]) -> dict:
+        """
+        Versión síncrona de extraer(): espera a todas las URLs.
+        Args: urls: URLs a extraer
+        Returns: Diccionario url -> texto (None si la extracción falla)
+        """
+        async def recoger():
+            return {url: texto async for url, texto in self.extraer(urls)}
+        return asyncio.run(recoger())
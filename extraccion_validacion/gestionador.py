@@ -2,6 +2,7 @@
 from extraccion_validacion.tipo_datos import ClasificadorTipoEntrada
 from extraccion_validacion.extraccion_datos import GestorExtractores
 from extraccion_validacion.validacion_datos import GestorValidadores
+from extraccion_validacion.cache_extraccion import CacheExtraccion
 
 class Gestionador:
     """
@@ -9,41 +10,53 @@ class Gestionador:
 
     Encapsula todo el proceso de extracción y validación de texto, utilizando un logger personalizado para registrar eventos importantes y errores.
     """
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, procesos_pdf=1, modo_url='secuencial', retardo_cobertura=None,
+                 directorio_cache=None, limite_cache=256 * 1024 * 1024, html_incremental=False):
         """
         Inicializa el gestionador para la fase 1.
         
         Args:
             logger (object, optional): Logger para auditoría y debugging.
+            procesos_pdf (int, optional): Procesos para extraer PDFs grandes en paralelo
+                (1 = en serie, None = uno por núcleo).
+            modo_url (str): 'secuencial' o 'carrera' para las estrategias de extracción de URLs.
+            retardo_cobertura (float, optional): En modo carrera, segundos antes de lanzar la siguiente estrategia.
+            directorio_cache (str, optional): Directorio de la caché persistente de texto extraído.
+            limite_cache (int): Tamaño máximo en bytes de la caché de extracción.
+            html_incremental (bool): Si las páginas web se descargan en flujo y se analizan de forma incremental.
         """
         self.logger = logger
+        self.cache = CacheExtraccion(directorio_cache, limite_cache, logger) if directorio_cache else None
         self.clarificador = ClasificadorTipoEntrada(logger=logger)
-        self.extractor = GestorExtractores(logger=logger)
+        self.extractor = GestorExtractores(logger=logger, procesos_pdf=procesos_pdf, modo_url=modo_url,
+                                          retardo_cobertura=retardo_cobertura, cache=self.cache,
+                                          html_incremental=html_incremental)
         self.validador = GestorValidadores(logger=logger)
 
 #funcion que combina la extraccion y validacion de texto, utilizando el logger para registrar eventos importantes y errores.
-    def extraccion_y_validacion(self, texto):
+    def extraccion_y_validacion(self, texto, paginas=None):
 
         
+        descriptor = None
         try: #bucle try-except para manejar errores al determinar el tipo de entrada
 
             #Determinar tipo de entrada
-            tipo, entrada = self.clarificador.determinar_tipo(texto) #determina el tipo de entrada (texto plano, archivo o URL) y su valor asociado
+            descriptor = self.clarificador.describir(texto) #clasifica la entrada (texto plano, archivo o URL) en una sola pasada
 
-            if tipo is None:
-                self.logger.error("No se pudo determinar el tipo de entrada: %s", texto[:50])
+            if descriptor.tipo is None:
+                self.logger.error("No se pudo determinar el tipo de entrada: %s", str(texto)[:50])
                 return None
             
-            self.logger.info("Tipo de entrada detectado: %s", tipo)
+            self.logger.info("Tipo de entrada detectado: %s", descriptor.tipo)
             
-            # 2. Validar entrada según tipo
-            if not self.validador.validar_por_tipo(entrada, tipo):
-                self.logger.warning("Validación fallida para %s: %s", tipo, entrada[:50])
+            # 2. Validar entrada según tipo (reutiliza el stat y el MIME del descriptor)
+            if not self.validador.validar_descriptor(descriptor):
+                self.logger.warning("Validación fallida para %s: %s", descriptor.tipo, descriptor.valor[:50])
                 return None
             self.logger.info("Entrada validada exitosamente")
 
             # 3. Extraer contenido
-            contenido = self.extractor.extraer(entrada)
+            contenido = self.extractor.extraer(descriptor, paginas=paginas)
             
             if contenido:
                 self.logger.info("Extracción exitosa, contenido obtenido: %d caracteres", len(contenido))
@@ -54,4 +67,52 @@ class Gestionador:
             
         except Exception as e:
             self.logger.error("Error en extracción y validación: %s", e, exc_info=True)
-            return None
\ No newline at end of file
+            return None
+
+        finally:
+            # Libera el mapeo en memoria del archivo, compartido por validación y extracción
+            if descriptor is not None:
+                descriptor.cerrar()
+
+#funcion equivalente a extraccion_y_validacion, pero que devuelve el contenido en trozos a medida que se extrae.
+    def extraccion_y_validacion_por_partes(self, texto, paginas=None):
+        """
+        Versión en streaming de extraccion_y_validacion(): valida la entrada y va devolviendo
+        el contenido extraído en trozos alineados a oraciones (p.ej. un PDF se lee página a página).
+
+        Args:
+            texto: Texto, ruta de archivo o URL introducido por el usuario
+            paginas: Selección de páginas para entradas PDF (números desde 1 o predicado); None = todas
+        Yields: Trozos de contenido en orden; no produce nada si la entrada no es procesable
+        """
+        descriptor = None
+        try:
+            descriptor = self.clarificador.describir(texto)
+
+            if descriptor.tipo is None:
+                self.logger.error("No se pudo determinar el tipo de entrada: %s", str(texto)[:50])
+                return
+
+            self.logger.info("Tipo de entrada detectado: %s", descriptor.tipo)
+
+            if not self.validador.validar_descriptor(descriptor):
+                self.logger.warning("Validación fallida para %s: %s", descriptor.tipo, descriptor.valor[:50])
+                return
+            self.logger.info("Entrada validada exitosamente")
+
+            total = 0
+            for parte in self.extractor.extraer_partes(descriptor, paginas=paginas):
+                total += len(parte)
+                yield parte
+
+            if total:
+                self.logger.info("Extracción exitosa, contenido obtenido: %d caracteres", total)
+            else:
+                self.logger.error("Extracción falló, no se obtuvo contenido")
+
+        except Exception as e:
+            self.logger.error("Error en extracción y validación: %s", e, exc_info=True)
+
+        finally:
+            if descriptor is not None:
+                descriptor.cerrar()
@@ -0,0 +1,137 @@
+"""
+Lectura incremental de documentos JSON: recorre el texto como un flujo de tokens y devuelve
+las cadenas (hojas de texto) a medida que aparecen, sin construir el árbol de objetos.
+"""
+
+# Librerías estándar de Python
+import json        # Decodificación de cadenas JSON (escapes)
+import re          # Tokenización
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
+
+# Espacio en blanco seguido de un token: cadena completa, símbolo estructural o literal (número, true, ...)
+TOKEN = re.compile(r'[ \t\r\n]*(?:(?P<cadena>"[^"\\]*(?:\\.[^"\\]*)*")|(?P<simbolo>[{}\[\]:,])|(?P<literal>[^ \t\r\n{}\[\]:,"]+))',
+                   re.S)
+ESPACIOS = re.compile(r'[ \t\r\n]*')
+LITERAL = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null')
+
+# Qué admite a continuación cada nivel abierto (o la raíz del documento)
+VALOR = 0           # un valor (tras ':' o tras ',' en una lista)
+VALOR_O_CIERRE = 1  # un valor o ']' (lista recién abierta)
+CLAVE = 2           # una clave (tras ',' en un objeto)
+CLAVE_O_CIERRE = 3  # una clave o '}' (objeto recién abierto)
+DOS_PUNTOS = 4      # ':' tras una clave
+COMA_O_CIERRE = 5   # ',' o el cierre del nivel, tras un valor
+FIN = 6             # solo espacio en blanco (la raíz ya tiene su valor)
+
+Selector = Union[None, str, Callable[[tuple], bool]]
+
+def compilar_selector(selector: Selector) -> Optional[Callable[[tuple], bool]]:
+    """
+    Convierte un selector de rutas en un predicado sobre la ruta de cada cadena.
+    Args:
+        selector: None (todas las cadenas), un predicado ruta -> bool, o una ruta de claves separadas
+            por puntos donde '*' vale por cualquier clave o índice (p.ej. "articulos.*.cuerpo").
+            Una ruta selecciona también todo lo que cuelga de ella.
+    Returns:
+        Predicado, o None si se seleccionan todas las cadenas.
+    """
+    if selector is None or callable(selector):
+        return selector
+    segmentos = [segmento for segmento in selector.split(".") if segmento]
+
+    def coincide(ruta: tuple) -> bool:
+        if len(ruta) < len(segmentos):
+            return False
+        return all(segmento == "*" or segmento == str(elemento) for segmento, elemento in zip(segmentos, ruta))
+    return coincide
+
+def iterar_cadenas(fragmentos: Iterable[str], selector: Selector = None) -> Iterator[Tuple[tuple, str]]:
+    """
+    Recorre un documento JSON que llega en fragmentos de texto y devuelve sus cadenas de valor.
+    Las claves de los objetos no se devuelven; números, booleanos y null se ignoran.
+
+    Args:
+        fragmentos: Texto del documento en trozos consecutivos (de cualquier tamaño).
+        selector: Filtro de rutas, ver compilar_selector().
+    Yields:
+        tuple: (ruta, texto), donde ruta es la tupla de claves e índices desde la raíz.
+    Raises:
+        ValueError: Si el documento no es JSON válido.
+    """
+    seleccionar = compilar_selector(selector)
+    # Cada nivel abierto: [es_objeto, clave o índice actual, qué admite a continuación]
+    pila = []
+    raiz = VALOR
+    pendiente = ""
+    fin_datos = False
+    iterador = iter(fragmentos)
+
+    while True:
+        posicion = 0
+        while True:
+            token = TOKEN.match(pendiente, posicion)
+            # Un token que llega al final del texto puede continuar en el siguiente fragmento
+            if token is None or (token.end() == len(pendiente) and not fin_datos and not token.group("simbolo")):
+                break
+            posicion = token.end()
+            estado = pila[-1][2] if pila else raiz
+            completo = False  # Si el token termina un valor
+
+            simbolo = token.group("simbolo")
+            if simbolo in ("{", "["):
+                if estado not in (VALOR, VALOR_O_CIERRE):
+                    raise ValueError(f"JSON no válido: '{simbolo}' inesperado")
+                pila.append([True, None, CLAVE_O_CIERRE] if simbolo == "{" else [False, 0, VALOR_O_CIERRE])
+            elif simbolo in ("}", "]"):
+                cierre = CLAVE_O_CIERRE if simbolo == "}" else VALOR_O_CIERRE
+                if not pila or pila[-1][0] != (simbolo == "}") or estado not in (cierre, COMA_O_CIERRE):
+                    raise ValueError(f"JSON no válido: '{simbolo}' inesperado")
+                pila.pop()
+                completo = True
+            elif simbolo == ":":
+                if estado != DOS_PUNTOS:
+                    raise ValueError("JSON no válido: ':' inesperado")
+                pila[-1][2] = VALOR
+            elif simbolo == ",":
+                if estado != COMA_O_CIERRE:
+                    raise ValueError("JSON no válido: ',' inesperada")
+                if pila[-1][0]:
+                    pila[-1][2] = CLAVE
+                else:
+                    pila[-1][1] += 1
+                    pila[-1][2] = VALOR
+            elif token.group("cadena"):
+                cadena = json.loads(token.group("cadena"))
+                if estado in (CLAVE, CLAVE_O_CIERRE):
+                    pila[-1][1] = cadena
+                    pila[-1][2] = DOS_PUNTOS
+                    continue
+                if estado not in (VALOR, VALOR_O_CIERRE):
+                    raise ValueError(f"JSON no válido: cadena inesperada {token.group('cadena')[:40]}")
+                ruta = tuple(nivel[1] for nivel in pila)
+                if seleccionar is None or seleccionar(ruta):
+                    yield ruta, cadena
+                completo = True
+            else:
+                literal = token.group("literal")
+                if estado not in (VALOR, VALOR_O_CIERRE) or LITERAL.fullmatch(literal) is None:
+                    raise ValueError(f"JSON no válido: '{literal[:40]}' inesperado")
+                completo = True
+
+            if completo:
+                if pila:
+                    pila[-1][2] = COMA_O_CIERRE
+                else:
+                    raiz = FIN
+
+        pendiente = pendiente[posicion:]
+        if fin_datos:
+            break
+        fragmento = next(iterador, None)
+        if fragmento is None:
+            fin_datos = True
+        else:
+            pendiente += fragmento
+
+    if pila or raiz != FIN or ESPACIOS.fullmatch(pendiente) is None:
+        raise ValueError("JSON no válido: documento incompleto")
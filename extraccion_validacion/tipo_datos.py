@@ -2,12 +2,75 @@
 
 # Librerías estándar de Python
 import os          # Manejo de archivos y directorios
+import mmap        # Lectura única de archivos mapeados en memoria
+import stat        # Interpretación del resultado de os.stat
+import threading   # Acceso seguro al detector MIME compartido
 from abc import ABC, abstractmethod # Clases abstractas para definir interfaces
 from typing import Optional, Tuple, Sequence # Tipos para anotaciones
 # Librerías externas (instaladas con pip)
-import validators  # Validación de URLs
+from carga_perezosa import ModuloPerezoso
+validators = ModuloPerezoso("validators")  # Validación de URLs
+magic = ModuloPerezoso("magic")  # Detección de tipos MIME de archivos
 
 PREFIJOS_URL_DEFAULT = ('http://', 'https://', 'ftp://') # Prefijos de URL predeterminados
+LONGITUD_MAXIMA_RUTA = 4096 # Entradas más largas no pueden ser rutas de archivo
+LONGITUD_MAXIMA_URL = 2048  # Entradas más largas no se tratan como URL
+
+BYTES_MIME_DEFAULT = 1024 * 1024 # Bytes que examina libmagic si no se puede consultar (valor de libmagic < 5.40)
+
+# Manejador de libmagic compartido: la base de datos se carga una sola vez por proceso
+_detector_mime = None
+_bytes_mime = BYTES_MIME_DEFAULT
+_lock_mime = threading.Lock()
+
+def _detector():
+    # Se llama con _lock_mime tomado
+    global _detector_mime, _bytes_mime
+    if _detector_mime is None:
+        _detector_mime = magic.Magic(mime=True)
+        try:
+            _bytes_mime = _detector_mime.getparam(magic.MAGIC_PARAM_BYTES_MAX)
+        except Exception:
+            pass  # python-magic o libmagic sin getparam
+    return _detector_mime
+
+def detectar_mime(datos: bytes) -> Optional[str]:
+    """
+    Detecta el tipo MIME de un bloque de bytes en memoria con el manejador compartido.
+    Args: datos: Contenido a analizar
+    Returns: Tipo MIME (p.ej. "application/pdf")
+    """
+    with _lock_mime:
+        return _detector().from_buffer(datos)
+
+def detectar_mime_mapa(mapa) -> Optional[str]:
+    """
+    Detecta el tipo MIME de un archivo ya mapeado en memoria, sin volver a leerlo. Se examinan
+    los mismos bytes iniciales que lee magic.from_file(ruta) (MAGIC_PARAM_BYTES_MAX, 7 MiB en
+    libmagic >= 5.40), así que el resultado coincide: un JSON de varios MiB se reconoce como
+    application/json aunque su primer MiB no baste para distinguirlo de texto plano.
+    Args: mapa: Contenido del archivo (mmap o bytes)
+    """
+    with _lock_mime:
+        detector = _detector()
+        return detector.from_buffer(mapa[:_bytes_mime])
+
+def detectar_mime_descriptor(descriptor: int) -> Optional[str]:
+    """
+    Detecta el tipo MIME de un archivo abierto con el manejador compartido. libmagic lee del
+    descriptor lo que necesita, igual que magic.from_file(ruta): un JSON grande se reconoce como
+    application/json aunque sus primeros bytes no bastan para distinguirlo de texto plano.
+    Args: descriptor: Descriptor de archivo (fileno()) posicionado al inicio
+    """
+    with _lock_mime:
+        return _detector().from_descriptor(descriptor)
+
+def detectar_mime_archivo(ruta: str) -> Optional[str]:
+    """
+    Detecta el tipo MIME de un archivo con el manejador compartido.
+    """
+    with open(ruta, 'rb') as archivo:
+        return detectar_mime_descriptor(archivo.fileno())
 
 #Primera clase: tipo de entrada a la funcion
 def construir_prefijos(esquemas: Optional[Sequence[str]] = None) -> Tuple[str, ...]:
@@ -25,8 +88,52 @@ def construir_prefijos(esquemas: Optional[Sequence[str]] = None) -> Tuple[str, .
     if not all(isinstance(e, str) and e for e in esquemas):
         return PREFIJOS_URL_DEFAULT
     
-    return tuple(f"{esquema}://" for esquema in esquemas)
+    # Se admiten tanto esquemas ('http') como prefijos ya construidos ('http://')
+    return tuple(esquema if esquema.endswith("://") else f"{esquema}://" for esquema in esquemas)
     
+class DescriptorEntrada:
+    """
+    Resultado de clasificar una entrada una sola vez: validación y extracción lo consumen
+    sin repetir os.path.isfile, validators.url ni la detección del tipo MIME.
+    """
+    def __init__(self, tipo: Optional[str], valor, original=None, estado: Optional[os.stat_result] = None,
+                 extension: str = "", mime: Optional[str] = None, mapa: Optional[mmap.mmap] = None):
+        """
+        Args:
+            tipo: "Archivo", "URL", "Textoplano" o None si no se pudo determinar
+            valor: Entrada normalizada (ruta, URL con esquema o texto)
+            original: Entrada tal como llegó
+            estado: Resultado de os.stat (solo archivos)
+            extension: Extensión en minúsculas (solo archivos)
+            mime: Tipo MIME detectado por contenido (solo archivos)
+            mapa: Contenido del archivo mapeado en memoria (solo archivos no vacíos); la detección MIME
+                y los extractores leen de él, así que el archivo se lee una sola vez
+        """
+        self.tipo = tipo
+        self.valor = valor
+        self.original = valor if original is None else original
+        self.estado = estado
+        self.extension = extension
+        self.mime = mime
+        self.mapa = mapa
+
+    def cerrar(self):
+        """
+        Libera el mapeo del archivo, si lo hay.
+        """
+        if self.mapa is not None:
+            self.mapa.close()
+            self.mapa = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_excepcion, excepcion, traza):
+        self.cerrar()
+
+    def __repr__(self):
+        return f"DescriptorEntrada(tipo={self.tipo!r}, valor={str(self.valor)[:50]!r}, mime={self.mime!r})"
+
 class IDetectorTipo(ABC):
     """Interfaz para detectores de tipo de entrada."""
     
@@ -99,6 +206,67 @@ class ClasificadorTipoEntrada:
         # Detectores en orden de prioridad
         self.detectores = [self.detector_archivo, self.detector_url, self.detector_texto]
     
+    def describir(self, entrada: str) -> DescriptorEntrada:
+        """
+        Clasifica la entrada en una sola pasada y devuelve su descriptor.
+
+        Comprobaciones baratas primero: un texto con saltos de línea o demasiado largo es texto plano
+        sin llamar a os.stat ni a validators.url; un texto con espacios no puede ser URL.
+        Para archivos, una única llamada a os.stat aporta existencia y tamaño; el archivo se mapea
+        en memoria y el tipo MIME se detecta sobre ese mapeo, sin otra lectura del archivo. Quien use el
+        descriptor debe liberar el mapeo con cerrar() (o usarlo como context manager).
+
+        Args:
+            entrada: Texto, archivo o URL a clasificar
+        Returns:
+            DescriptorEntrada (tipo None si la entrada no es una cadena)
+        """
+        if not isinstance(entrada, str):
+            if self.logger:
+                self.logger.warning(f"Tipo de entrada desconocido: {type(entrada)}")
+            return DescriptorEntrada(None, entrada)
+
+        if "\n" in entrada or len(entrada) > LONGITUD_MAXIMA_RUTA:
+            descriptor = DescriptorEntrada(self.detector_texto.obtener_tipo(), entrada)
+        else:
+            descriptor = self._describir_archivo(entrada) or self._describir_url(entrada) or \
+                DescriptorEntrada(self.detector_texto.obtener_tipo(), entrada)
+
+        if self.logger:
+            self.logger.info(f"Tipo de entrada detectado: {descriptor.tipo}")
+        return descriptor
+
+    def _describir_archivo(self, entrada: str) -> Optional[DescriptorEntrada]:
+        try:
+            estado = os.stat(entrada)
+        except (OSError, ValueError):
+            return None
+        if not stat.S_ISREG(estado.st_mode):
+            return None
+        extension = os.path.splitext(entrada)[1].lower()
+        mime = mapa = None
+        if estado.st_size:
+            try:
+                with open(entrada, 'rb') as archivo:
+                    mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+                mime = detectar_mime_mapa(mapa)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"No se pudo detectar el tipo MIME de {entrada}: {e}")
+        return DescriptorEntrada(self.detector_archivo.obtener_tipo(), entrada, estado=estado,
+                                 extension=extension, mime=mime, mapa=mapa)
+
+    def _describir_url(self, entrada: str) -> Optional[DescriptorEntrada]:
+        candidata = entrada.strip()
+        if not candidata or len(candidata) > LONGITUD_MAXIMA_URL or any(c.isspace() for c in candidata):
+            return None
+        if not self.detector_url.detectar(candidata):
+            return None
+        url = self.detector_url.normalizar_entrada(candidata)
+        if self.logger:
+            self.logger.info(f"URL detectada y normalizada: {url}")
+        return DescriptorEntrada(self.detector_url.obtener_tipo(), url, original=entrada)
+
     def determinar_tipo(self, entrada: str) -> Tuple[Optional[str], str]:
         """
         Determina el tipo de entrada y la normaliza si es necesario.
@@ -110,26 +278,8 @@ class ClasificadorTipoEntrada:
             Tupla (tipo, entrada_normalizada)
             donde tipo puede ser: "Archivo", "URL", "Textoplano", None
         """
-        for detector in self.detectores:
-            if detector.detectar(entrada):
-                tipo = detector.obtener_tipo()
-                
-                # Normalizar si es URL
-                if isinstance(detector, DetectorURL):
-                    entrada = detector.normalizar_entrada(entrada)
-                    if self.logger:
-                        self.logger.info(f"URL detectada y normalizada: {entrada}")
-                
-                if self.logger:
-                    self.logger.info(f"Tipo de entrada detectado: {tipo}")
-                
-                return tipo, entrada
-        
-        # No se pudo determinar
-        if self.logger:
-            self.logger.warning(f"Tipo de entrada desconocido: {entrada}")
-        
-        return None, entrada
+        descriptor = self.describir(entrada)
+        return descriptor.tipo, descriptor.valor
     
     def es_archivo(self, entrada: str) -> bool:
         """Verifica rápidamente si es archivo."""
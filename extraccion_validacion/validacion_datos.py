@@ -5,10 +5,11 @@ import os          # Manejo de archivos y directorios
 import re          # Manejo de expresiones regulares
 
 # Librerías externas (instaladas con pip)
-import validators  # Validación de URLs
-import magic       # Detección de tipos MIME de archivos
+from carga_perezosa import ModuloPerezoso
+validators = ModuloPerezoso("validators")  # Validación de URLs
 from abc import ABC, abstractmethod # Clases abstractas para definir interfaces
 from typing import Optional, Dict # Tipos para anotaciones
+from extraccion_validacion.tipo_datos import DescriptorEntrada, detectar_mime_archivo
 MIMES_SOPORTADOS: Dict[str, str] = {'.txt': 'text/plain', '.json': 'application/json',
                                      '.pdf': 'application/pdf'}
 
@@ -76,6 +77,35 @@ class ValidarArchivo(IValidador):
                 self.logger.error(f"Validación de archivo: Error inesperado - {e}")
             return False
     
+    def validar_descriptor(self, descriptor: DescriptorEntrada, mime_esperado: Optional[str] = None) -> bool:
+        """
+        Valida un archivo ya clasificado, reutilizando el os.stat y el tipo MIME del descriptor.
+        Args:
+            descriptor: Descriptor de tipo "Archivo"
+            mime_esperado: Tipo MIME esperado (por defecto, el del validador)
+        """
+        ruta = descriptor.valor
+        mime_esperado = mime_esperado or self.mime_esperado
+        if descriptor.estado is None:
+            if self.logger:
+                self.logger.warning("Archivo no encontrado: %s", ruta)
+            return False
+        if descriptor.estado.st_size == 0:
+            if self.logger:
+                self.logger.warning("Archivo vacío: %s", ruta)
+            return False
+        if not descriptor.mime:
+            if self.logger:
+                self.logger.warning("No se pudo determinar el tipo MIME del archivo: %s", ruta)
+            return False
+        if mime_esperado and descriptor.mime != mime_esperado:
+            if self.logger:
+                self.logger.warning("Tipo MIME no coincide (esperado: %s, encontrado: %s): %s", mime_esperado, descriptor.mime, ruta)
+            return False
+        if self.logger:
+            self.logger.info("Archivo validado: %s", ruta)
+        return True
+
     def _validar_existencia(self, ruta: str) -> bool:
         if not os.path.isfile(ruta):
             if self.logger:
@@ -91,7 +121,7 @@ class ValidarArchivo(IValidador):
         return True
     
     def _validar_tipo_mime(self, ruta: str, mime_esperado: Optional[str]) -> bool:
-        tipo_archivo = magic.from_file(ruta, mime=True)
+        tipo_archivo = detectar_mime_archivo(ruta)
         if not tipo_archivo:
             if self.logger:
                 self.logger.warning("No se pudo determinar el tipo MIME del archivo: %s", ruta)
@@ -126,6 +156,18 @@ class ValidarURL(IValidador):
                 self.logger.error(f"Validación de URL: Error inesperado - {e}")
             return False # Retornar False en caso de error
         
+    def validar_descriptor(self, descriptor: DescriptorEntrada) -> bool:
+        """
+        Valida una URL ya clasificada: el formato se comprobó al clasificar, solo queda el dominio.
+        """
+        if not self._validar_dominio(descriptor.valor):
+            if self.logger:
+                self.logger.warning("Dominio no válido: %s", descriptor.valor)
+            return False
+        if self.logger:
+            self.logger.info("URL validada: %s", descriptor.valor)
+        return True
+
     def _validar_formato(self, url: str) -> bool:
         # Validar que la URL tenga un formato correcto usando validators
         return validators.url(url) is True
@@ -172,6 +214,24 @@ class GestorValidadores:
         """Valida URL."""
         return self.validadores["url"].validar(entrada)
     
+    def validar_descriptor(self, descriptor: DescriptorEntrada) -> bool:
+        """
+        Valida una entrada ya clasificada por ClasificadorTipoEntrada.describir(),
+        sin repetir las comprobaciones que hizo la clasificación.
+        Args: descriptor: Descriptor de la entrada
+        Returns: True si es válida
+        """
+        if descriptor.tipo == "Archivo":
+            mime_esperado = MIMES_SOPORTADOS.get(descriptor.extension)
+            if mime_esperado is None and self.logger:
+                self.logger.warning(f"Extensión no soportada: {descriptor.extension}")
+            return self.validadores["archivo"].validar_descriptor(descriptor, mime_esperado)
+        if descriptor.tipo == "URL":
+            return self.validadores["url"].validar_descriptor(descriptor)
+        if descriptor.tipo is None:
+            return False
+        return self.validar_por_tipo(descriptor.valor, descriptor.tipo)
+
     def validar_por_tipo(self, entrada: str, tipo: str) -> bool:
         """
         Valida según el tipo especificado.
@@ -6,9 +6,12 @@ Archivo python donde se crea el codigo que combina las tres etapas del proyecto:
 
 Utiliza el logger personalizado para registrar eventos importantes durante el proceso.
 """
-from UI import (mostrar_intro, pedir_texto, mensaje_procesando, mostrar_progreso,
+from itertools import chain
+
+from UI import (mostrar_intro, pedir_texto, pedir_paginas, mensaje_procesando, mostrar_progreso,
                 resultado_final, mensaje_error, despedida)
 from extraccion_validacion.gestionador import Gestionador as GestionadorExtraccion
+from extraccion_validacion.extraccion_datos import parsear_rango_paginas
 from procesado_datos.gestionador import Gestionador as GestionadorProcesado
 from convertor_audio.gestionador import Gestionador as GestionadorAudio
 from Logger import Telemetriaindustrial, logger_modular
@@ -16,9 +19,12 @@ from Logger import Telemetriaindustrial, logger_modular
 # Configuracion del logger personalizado
 logger = Telemetriaindustrial("Main_Proceso_Texto_Voz").logger
 
-gestionador_extraccion = GestionadorExtraccion(logger=logger)
-gestionador_procesado = GestionadorProcesado(logger=logger)
-gestionador_audio = GestionadorAudio(logger=logger)
+gestionador_extraccion = GestionadorExtraccion(logger=logger, procesos_pdf=None, modo_url='carrera',
+                                               retardo_cobertura=1.0, directorio_cache=".cache_extraccion",
+                                               html_incremental=True)
+gestionador_procesado = GestionadorProcesado(logger=logger, motor_tokens='regex')
+gestionador_audio = GestionadorAudio(logger=logger, hilos=4, directorio_cache=".cache_fragmentos",
+                                     agrupar_fragmentos=True, decodificar_en_lote=True)
 
 #Funcion principal que combina las tres etapas del proyecto.
 @logger_modular(logger)
@@ -26,23 +32,36 @@ def main():
     mostrar_intro()
     texto = pedir_texto()
 
+    paginas = None
+    if texto.strip().lower().endswith(".pdf"):
+        try:
+            paginas = parsear_rango_paginas(pedir_paginas())
+        except ValueError as e:
+            mensaje_error(f"Selección de páginas no válida: {e}")
+            despedida()
+            return
+
     print("Extrayendo y validando texto...")
-    datos = gestionador_extraccion.extraccion_y_validacion(texto)
-    if not datos:
+    # Cada fase consume los trozos de la anterior a medida que llegan (un PDF se lee página a página)
+    partes = gestionador_extraccion.extraccion_y_validacion_por_partes(texto, paginas=paginas)
+    primera_parte = next(partes, None)
+    if not primera_parte:
         mensaje_error("Entrada no procesable. Revisa los logs para más detalles.")
         despedida()
         return
 
     mensaje_procesando()
-    procesado = gestionador_procesado.procesado_datos(datos)
-    if not procesado:
+    procesado = gestionador_procesado.procesado_por_partes(chain([primera_parte], partes))
+    primer_segmento = next(procesado, None)
+    if not primer_segmento:
         mensaje_error("Error en el procesado. Revisa los logs.")
         despedida()
         return
 
     # Muestra la barra de progreso sobre el iterable real: puedes adaptar esta parte
     print("Generando audio (esto puede tardar unos segundos)...")
-    salida = gestionador_audio.convertir(procesado, mostrar_progreso=True)
+    salida = gestionador_audio.convertir(chain([primer_segmento], procesado), mostrar_progreso=True,
+                                         streaming=True)
     if not salida:
         mensaje_error("No se generó ningún archivo de audio.")
         despedida()
@@ -1,24 +1,43 @@
 #Importacion de las librerias necesarias:
 from functools import lru_cache
 from typing import Tuple, Optional
-import langid
 from abc import ABC, abstractmethod
-from nltk.corpus import stopwords
-import nltk
+from carga_perezosa import ModuloPerezoso
 
-try:
-    español_stopwords = frozenset(stopwords.words('spanish'))
-except LookupError:
-    nltk.download('stopwords', quiet=True)
-    español_stopwords = frozenset(stopwords.words('spanish'))
-try:
-    ingles_stopwords = frozenset(stopwords.words('english'))
-except LookupError:
-    nltk.download('stopwords', quiet=True)
-    ingles_stopwords = frozenset(stopwords.words('english'))
+from procesado_datos.recursos_nlp import cargar_paquete
+from procesado_datos.tokens import Token
 
-# Configuración de langid para limitar a español e inglés, mejorando precisión en textos mixtos.
-langid.set_languages(['es', 'en'])
+# nltk y langid se importan en su primer uso: cargarlos (y las stopwords) cuesta cientos de milisegundos
+nltk = ModuloPerezoso("nltk")
+langid = ModuloPerezoso("langid")
+
+@lru_cache(maxsize=None)
+def cargar_stopwords(idioma: str) -> frozenset:
+    """
+    Stopwords de un idioma ('spanish', 'english'), cargadas una vez. Se toman del paquete de recursos
+    NLP si está construido; si no, de NLTK, descargándolas solo si faltan.
+    """
+    paquete = cargar_paquete()
+    if paquete is not None:
+        return paquete.stopwords(idioma)
+    try:
+        return frozenset(nltk.corpus.stopwords.words(idioma))
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+        return frozenset(nltk.corpus.stopwords.words(idioma))
+
+@lru_cache(maxsize=None)
+def clasificador_langid():
+    """
+    Identificador de langid limitado a español e inglés (con classify()); el modelo se carga en la primera llamada.
+    Con el paquete de recursos NLP se usa su modelo ya reducido, que se mapea en milisegundos.
+    """
+    paquete = cargar_paquete()
+    if paquete is not None:
+        return paquete.identificador_idioma()
+    # Configuración de langid para limitar a español e inglés, mejorando precisión en textos mixtos.
+    langid.set_languages(['es', 'en'])
+    return langid
 
 DIACRITICOS_ESPANOL = frozenset('ñáéíóúüÁÉÍÓÚÜ¿¡')
 MAPEO_IDIOMAS = {'es': 'español', 'en': 'ingles'}
@@ -49,7 +68,7 @@ class DetectarIdioma(IDetectarIdiomas):
     @lru_cache(maxsize=4096)
     def detectar_idioma_langid(texto: str) -> Tuple[Optional[str], float]:
         try: # Bucle try-except para manejar errores en la detección de idioma con langid, registrando cualquier excepción en el logger para diagnóstico.
-            codigo_idioma, probabilidad = langid.classify(texto) # Utiliza langid para clasificar el idioma del texto, obteniendo el código de idioma y la puntuación de confianza.
+            codigo_idioma, probabilidad = clasificador_langid().classify(texto) # Utiliza langid para clasificar el idioma del texto, obteniendo el código de idioma y la puntuación de confianza.
             if codigo_idioma in MAPEO_IDIOMAS:
                 idioma = MAPEO_IDIOMAS[codigo_idioma]
                 probabilidad_normalizada = DetectarIdioma.normalizacion_probabilidad(probabilidad) # Normaliza la puntuación de langid a una escala de probabilidad más interpretable utilizando el método definido anteriormente.
@@ -77,12 +96,12 @@ class DetectarIdioma(IDetectarIdiomas):
         if len(tokens) == 1:
             # Sólo para palabra suelta: usar heurística de stopwords
             token_lower = tokens[0].lower()
-            if token_lower in español_stopwords:
+            if token_lower in cargar_stopwords('spanish'):
                 if self.logger:
                     self.logger.debug(f"Token '{token_lower}' es stopword española")
                 return 'español', 1.0
         
-            elif token_lower in ingles_stopwords:
+            elif token_lower in cargar_stopwords('english'):
                 if self.logger:
                     self.logger.debug(f"Token '{token_lower}' es stopword inglesa")
                 return 'ingles', 1.0
@@ -177,9 +196,9 @@ class DetectarIdioma(IDetectarIdiomas):
             return "español", 1.0
 
         # Stopword (en contexto palabra suelta)
-        if token_lower in español_stopwords:
+        if token_lower in cargar_stopwords('spanish'):
             return 'español', 1.0
-        elif token_lower in ingles_stopwords:
+        elif token_lower in cargar_stopwords('english'):
             return 'ingles', 1.0
 
         # Por defecto: fallback a idioma de línea si existe (incluso con conf baja)
@@ -193,46 +212,42 @@ class DetectarIdioma(IDetectarIdiomas):
         resultado = []
         if isinstance(bloque, dict) and 'tokens' in bloque and bloque.get('protegido', False):
             # Es un bloque protegido
-            texto_bloque = ' '.join(token['token'] for token in bloque['tokens'])
+            texto_bloque = ' '.join(token.token for token in bloque['tokens'])
             # Detecta idioma del bloque completo
             idioma_bloque, conf_bloque = self.detectar_idioma(texto_bloque)
             # Si es una sola palabra, lógica de token suelto
-            if len(bloque['tokens']) == 1 and bloque['tokens'][0]['es_palabra']:
+            if len(bloque['tokens']) == 1 and bloque['tokens'][0].es_palabra:
+                token = bloque['tokens'][0]
                 idioma_token, conf_token = self.detectar_idioma_token(
-                    bloque['tokens'][0]['token'],
-                    es_palabra=bloque['tokens'][0]['es_palabra'],
-                    es_puntuacion=bloque['tokens'][0]['es_puntuacion'],
+                    token.token,
+                    es_palabra=token.es_palabra,
+                    es_puntuacion=token.es_puntuacion,
                     protegido=True,
-                    silencio=bloque['tokens'][0].get('es_silencio', False),
-                    tiempo_silencio=bloque['tokens'][0].get('tiempo_silencio', 0),
+                    silencio=token.get('es_silencio', False),
+                    tiempo_silencio=token.get('tiempo_silencio', 0),
                     idioma_linea=idioma_linea,
                     conf_linea=conf_linea
                 )
-                bloque['tokens'][0]['idioma_token'] = idioma_token
-                bloque['tokens'][0]['conf_token'] = conf_token
-                resultado.append(bloque['tokens'][0])
+                token.marcar_idioma(idioma_token, conf_token)
+                resultado.append(token)
             else:
                 # Es frase: asigna idioma del bloque a cada token interno
                 for token in bloque['tokens']:
-                    idioma_token = idioma_bloque
-                    conf_token = conf_bloque
-                    token['idioma_token'] = idioma_token
-                    token['conf_token'] = conf_token
+                    token.marcar_idioma(idioma_bloque, conf_bloque)
                     resultado.append(token)
-        elif isinstance(bloque, dict) and 'token' in bloque:
+        elif isinstance(bloque, Token):
             # Token simple
             idioma_token, conf_token = self.detectar_idioma_token(
-                bloque['token'],
-                es_palabra=bloque['es_palabra'],
-                es_puntuacion=bloque['es_puntuacion'],
+                bloque.token,
+                es_palabra=bloque.es_palabra,
+                es_puntuacion=bloque.es_puntuacion,
                 protegido=False,
                 silencio=bloque.get('es_silencio', False),
                 tiempo_silencio=bloque.get('tiempo_silencio', 0),
                 idioma_linea=idioma_linea,
                 conf_linea=conf_linea
             )
-            bloque['idioma_token'] = idioma_token
-            bloque['conf_token'] = conf_token
+            bloque.marcar_idioma(idioma_token, conf_token)
             resultado.append(bloque)
         return resultado
     
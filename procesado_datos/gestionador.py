@@ -8,15 +8,17 @@ class Gestionador:
 
     Encapsula todo el proceso de procesamiento de datos, utilizando un logger personalizado para registrar eventos importantes y errores.
     """
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, motor_tokens='nltk'):
         """
         Inicializa el gestionador para la fase 2.
         
         Args:
             logger (object, optional): Logger para auditoría y debugging.
+            motor_tokens (str, optional): Motor de tokenización de ObtenerTokens ('nltk' o 'regex').
         """
         self.logger = logger
-        self.tokenizer = ObtenerTokens(logger=logger)
+        self.motor_tokens = motor_tokens
+        self.tokenizer = ObtenerTokens(logger=logger, motor=motor_tokens)
         self.limpiador = LimpiarPalabras(logger=logger)
         self.marcador_silencios = MarcarSilencios(logger=logger)
         self.agrupador_protegidos = AgruparProtegidos(logger=logger)
@@ -25,25 +27,28 @@ class Gestionador:
     #Procesado de datos
     def procesado_datos(self, contenido):
         try:
+            # Cada etapa sustituye a la anterior en la misma variable, para que los resultados
+            # intermedios (p.ej. los tokens sin limpiar) se liberen en cuanto dejan de usarse
+
             # 1. Segmentar en oraciones y tokens
-            tokenizer = ObtenerTokens(logger=self.logger)
+            tokenizer = ObtenerTokens(logger=self.logger, motor=self.motor_tokens)
             segmentos = tokenizer.procesar(contenido)
 
             # 2. Limpiar tokens
             limpiador = LimpiarPalabras(logger=self.logger)
-            segmentos_limpios = limpiador.limpiar(segmentos)
+            segmentos = limpiador.limpiar(segmentos)
 
             # 3. Marcar silencios
             marcador_silencios = MarcarSilencios(logger=self.logger)
-            segmentos_silencio = marcador_silencios.procesar(segmentos_limpios)
+            segmentos = marcador_silencios.procesar(segmentos)
 
             #4. Agrupar protegidos
             agrupador_protegidos = AgruparProtegidos(logger=self.logger)
-            segmentos_agrupados = agrupador_protegidos.procesar(segmentos_silencio)
+            segmentos = agrupador_protegidos.procesar(segmentos)
 
             # 5. Detectar idioma
             detector = GestorDetectorIdioma(logger=self.logger)
-            resultado = detector.detectar(segmentos_agrupados)
+            resultado = detector.detectar(segmentos)
 
             self.logger.info("Datos procesados exitosamente. Total líneas: %d", len(resultado))
             return resultado
@@ -51,3 +56,16 @@ class Gestionador:
         except Exception as e:
             self.logger.error("Error procesando datos: %s", e, exc_info=True)
             return None
+
+    def procesado_por_partes(self, partes):
+        """
+        Procesa un flujo de trozos de texto (alineados a oraciones) uno a uno,
+        de modo que la fase 3 puede empezar con el primero mientras se extraen los siguientes.
+
+        Args: partes (iterable[str]): Trozos de contenido de la fase 1.
+        Yields: Segmentos procesados, en orden
+        """
+        for parte in partes:
+            resultado = self.procesado_datos(parte)
+            if resultado:
+                yield from resultado
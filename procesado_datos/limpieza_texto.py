@@ -1,8 +1,11 @@
 import re
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Dict
 from functools import lru_cache
 
+from procesado_datos.tokens import Token, ES_PALABRA, ES_PUNTUACION
+
 class LimpiezaTexto(ABC):
     @abstractmethod
     def limpiar(self, tokens: List[str]) -> List[Dict]:
@@ -22,25 +25,24 @@ class LimpiarPalabras(LimpiezaTexto):
             for token in tokens:
                 token_info = self.limpiar_token(token)
                 if self.logger:
-                    self.logger.debug(
-                        f"Token '{token}' - limpio: '{token_info['token']}', palabra: {token_info['es_palabra']}, puntuación: {token_info['es_puntuacion']}"
-                    )
+                    self.logger.debug("Token '%s' - limpio: '%s', palabra: %s, puntuación: %s",
+                                      token, token_info.token, token_info.es_palabra, token_info.es_puntuacion)
                 tokens_limpios.append(token_info)
             resultado.append({'linea': segmento['linea'], 'tokens_limpios': tokens_limpios})
         return resultado
     
+    @staticmethod
+    def limpiar_token(token: str) -> Token:
+        """Token nuevo (lo completan las etapas siguientes) con el texto limpio y su clasificación."""
+        return Token(*LimpiarPalabras.clasificar_token(token))
+
     @staticmethod
     @lru_cache(maxsize=10000)
-    def limpiar_token(token: str) -> dict:
+    def clasificar_token(token: str) -> tuple[str, int]:
+        """Texto limpio (internado) y banderas ES_PALABRA / ES_PUNTUACION del token."""
         token_limpio = token.strip().lower()
         patron_palabra = re.compile(r"^[A-Za-z0-9ÁÉÍÓÚÜÑáéíóúüñ_\+'\#\-]+$")
         patron_puntuacion = re.compile(r"^[.,:;!?\-]+$")
         es_palabra = bool(patron_palabra.match(token)) and not patron_puntuacion.match(token)
         es_puntuacion = bool(patron_puntuacion.match(token))
-        return {
-            'token': token_limpio,
-            'es_palabra': es_palabra,
-            'es_puntuacion': es_puntuacion
-        }
-    
-    
\ No newline at end of file
+        return sys.intern(token_limpio), (ES_PALABRA if es_palabra else 0) | (ES_PUNTUACION if es_puntuacion else 0)
@@ -0,0 +1,335 @@
+"""
+Motores de tokenización de la fase 2: dividen el texto en oraciones y cada oración en tokens.
+
+Los dos motores producen los mismos tokens que nltk.sent_tokenize + nltk.word_tokenize
+(comillas convertidas en `` y '', clíticos como 's o n't separados, puntuación aislada), que es
+lo que esperan LimpiarPalabras y MarcarSilencios:
+    - MotorNLTK: llama a NLTK (Punkt + NLTKWordTokenizer), como hasta ahora.
+    - MotorRegex: recorre el texto una sola vez con expresiones regulares precompiladas y guarda
+      además la posición de cada token en el texto.
+"""
+import re
+from array import array
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import chain
+
+from carga_perezosa import ModuloPerezoso
+from procesado_datos.recursos_nlp import cargar_paquete
+
+# El tokenizador de nltk se importa al procesar el primer texto
+tokenizador = ModuloPerezoso("nltk.tokenize")
+
+@lru_cache(maxsize=None)
+def segmentador_oraciones():
+    """
+    Segmentador Punkt inglés (el que usa nltk.sent_tokenize), del paquete de recursos NLP si está construido.
+    """
+    paquete = cargar_paquete()
+    if paquete is not None:
+        return paquete.segmentador_oraciones('english')
+    return tokenizador.punkt.PunktTokenizer('english')
+
+@lru_cache(maxsize=None)
+def tokenizador_palabras():
+    """
+    Tokenizador de palabras de nltk.word_tokenize (Treebank mejorado).
+    """
+    return tokenizador.NLTKWordTokenizer()
+
+def dividir_oraciones(texto: str) -> list[str]:
+    """
+    Equivalente a nltk.sent_tokenize(texto).
+    """
+    return segmentador_oraciones().tokenize(texto)
+
+def dividir_palabras(oracion: str) -> list[str]:
+    """
+    Equivalente a nltk.word_tokenize(oracion): segmenta en oraciones y aplica el tokenizador de Treebank.
+    """
+    palabras = tokenizador_palabras()
+    return [token for parte in dividir_oraciones(oracion) for token in palabras.tokenize(parte)]
+
+class MotorTokenizacion(ABC):
+    """
+    Interfaz de los motores de tokenización.
+    """
+    @abstractmethod
+    def tokenizar(self, texto: str) -> list[dict]:
+        """
+        Divide un texto en oraciones y tokens.
+        Args: texto: Texto sin saltos de línea
+        Returns: Lista de dicts {'linea': oración, 'tokens': [str]} (más claves propias de cada motor)
+        """
+        pass
+
+class MotorNLTK(MotorTokenizacion):
+    """
+    Tokenización con NLTK: sent_tokenize sobre el texto y word_tokenize sobre cada oración.
+    """
+    def tokenizar(self, texto: str) -> list[dict]:
+        return [{'linea': oracion, 'tokens': dividir_palabras(oracion)} for oracion in dividir_oraciones(texto)]
+
+# Posible final de oración seguido de puntuación o de espacio y otro token (PunktLanguageVars.period_context_re)
+CONTEXTO_FINAL = re.compile(r"""[.?!](?=(?P<after_tok>[)";}\]*:@'({\[!?]|\s+(?P<next_tok>\S+)))""")
+# Puntuación de cierre que Punkt devuelve a la oración anterior (PunktLanguageVars.re_boundary_realignment)
+REALINEACION = re.compile(r'["\')\]}]+?(?:\s+|(?=--)|$)', re.MULTILINE)
+BLANCOS = " \t\n\r\x0b\x0c"  # string.whitespace, lo que Punkt considera separador de palabras
+PALABRA_ALFABETICA = re.compile(r"[^\W\d_]{2,}")
+
+# Palabras (secuencias sin blancos) que ninguna regla de NLTKWordTokenizer modifica: sin comillas,
+# signos separables, '..' ni '--'. El grupo 'simples' captura una serie seguida de ellas, que se
+# devuelven tal cual; cualquier otra palabra se captura sola
+_SEPARABLES = r"""\s"'`«“‘„»”’,:;@#$%&?!*\[\](){}<>.\-"""
+_SIMPLE = rf"[^{_SEPARABLES}]++(?:[.\-](?![.\-])[^{_SEPARABLES}]*+)*+"
+PALABRAS = re.compile(rf"(?P<simples>{_SIMPLE}(?:\s+{_SIMPLE})*)(?!\S)|\S+")
+NO_BLANCOS = re.compile(r"\S+")
+CONTRACCIONES = re.compile(r"(?i)\b(?:cannot|gimme|gonna|gotta|lemme|wanna)\b")
+# Todas las contracciones tienen una consonante doble en la tercera letra: se buscan solo a partir de ella
+CONSONANTE_DOBLE = re.compile(r"(?i)nn|mm|tt")
+# Lo que puede seguir al punto final de la oración, que NLTKWordTokenizer separa (las demás
+# apariciones de '.' se quedan en la palabra): cierres y espacios, y después cualquier blanco
+CIERRES_PUNTO_FINAL = frozenset(']})>"\'»”’ ')
+COMILLAS_CONVERTIDAS = ("``", "''")
+LIMITE_DECISIONES = 65536
+
+def _ultimo_blanco(texto: str, inicio: int, fin: int) -> int:
+    """
+    Posición del último carácter de BLANCOS en texto[inicio:fin], o -1.
+    """
+    posicion = texto.rfind(' ', inicio, fin)
+    # Los demás blancos son caracteres de control: solo se buscan si aparecen tras el último espacio
+    if texto[max(posicion + 1, inicio):fin].isprintable():
+        return posicion
+    return max(texto.rfind(caracter, inicio, fin) for caracter in BLANCOS)
+
+def _punto_final(texto: str, inicio: int, fin: int) -> int:
+    """
+    Posición del punto final de la oración texto[inicio:fin] que separa NLTKWordTokenizer
+    (regla ([^\.])(\.)([\]\)}>"\'»”’ ]*)\s*$), o -1.
+    """
+    posicion = fin
+    while posicion > inicio and texto[posicion - 1].isspace():
+        posicion -= 1
+    while posicion > inicio and texto[posicion - 1] in CIERRES_PUNTO_FINAL:
+        posicion -= 1
+    if posicion - 2 >= inicio and texto[posicion - 1] == '.' and texto[posicion - 2] != '.':
+        return posicion - 1
+    return -1
+
+def _tiene_contracciones(texto: str, inicio: int, fin: int) -> bool:
+    """
+    Indica si texto[inicio:fin] contiene alguna de las contracciones que NLTKWordTokenizer separa.
+    """
+    for doble in CONSONANTE_DOBLE.finditer(texto, inicio, fin):
+        if doble.start() - 2 >= inicio and CONTRACCIONES.match(texto, doble.start() - 2, fin):
+            return True
+    return False
+
+@lru_cache(maxsize=None)
+def _reglas_palabra(con_punto_final: bool) -> tuple:
+    """
+    Sustituciones de NLTKWordTokenizer.tokenize en su orden, aplicables a un trozo de oración.
+    Sin con_punto_final se omiten las dos reglas del punto final (ancladas al final del texto).
+    """
+    clase = tokenizador.NLTKWordTokenizer
+    puntuacion = [regla for regla in clase.PUNCTUATION if con_punto_final or not regla[0].pattern.endswith(r"\s*$")]
+    reglas = list(clase.STARTING_QUOTES) + puntuacion + [clase.PARENS_BRACKETS, clase.DOUBLE_DASHES]
+    finales = list(clase.ENDING_QUOTES) + [(regla, r" \1 \2 ") for regla in clase.CONTRACTIONS2 + clase.CONTRACTIONS3]
+    return tuple(reglas), tuple(finales)
+
+@lru_cache(maxsize=65536)
+def _tokenizar_trozo(trozo: str, con_punto_final: bool) -> tuple:
+    """
+    Aplica las reglas de NLTKWordTokenizer a un trozo de oración (una palabra, o el final de la oración).
+    El trozo puede empezar con el carácter en blanco que lo precede, del que dependen las reglas de comillas.
+    Returns: (tokens, posiciones (inicio, fin) de cada token dentro del trozo)
+    """
+    reglas, finales = _reglas_palabra(con_punto_final)
+    resultado = trozo
+    for regla, sustitucion in reglas:
+        resultado = regla.sub(sustitucion, resultado)
+    resultado = " " + resultado + " "
+    for regla, sustitucion in finales:
+        resultado = regla.sub(sustitucion, resultado)
+    tokens = tuple(resultado.split())
+    return tokens, _alinear(tokens, trozo)
+
+def _alinear(tokens: tuple, trozo: str) -> tuple:
+    """
+    Posición (inicio, fin) en el trozo original de cada token.
+    Las comillas " y '' que NLTK convierte en `` o '' se alinean con el carácter original.
+    """
+    posiciones = []
+    cursor = 0
+    for token in tokens:
+        # Los tokens están separados por blancos en el trozo o pegados entre sí
+        while cursor < len(trozo) and trozo[cursor].isspace():
+            cursor += 1
+        if trozo.startswith(token, cursor):
+            longitud = len(token)
+        elif token in COMILLAS_CONVERTIDAS and trozo.startswith("''", cursor):
+            longitud = 2
+        elif token in COMILLAS_CONVERTIDAS and trozo.startswith('"', cursor):
+            longitud = 1
+        else:
+            encontrado = trozo.find(token, cursor)
+            cursor, longitud = (encontrado, len(token)) if encontrado >= 0 else (cursor, 0)
+        posiciones.append((cursor, cursor + longitud))
+        cursor += longitud
+    return tuple(posiciones)
+
+class MotorRegex(MotorTokenizacion):
+    """
+    Tokenización con expresiones regulares precompiladas, equivalente a MotorNLTK.
+
+    Las oraciones se delimitan con el mismo algoritmo que Punkt (posibles finales, contexto de la
+    palabra anterior y la siguiente, realineado de comillas y paréntesis de cierre), usando sus
+    parámetros: los casos habituales ("palabra. Siguiente", '?', '!') se resuelven directamente y
+    el resto (abreviaturas, iniciales, números, puntuación pegada) se consulta al propio Punkt.
+
+    Cada palabra (secuencia sin blancos) que no contiene ningún carácter que trate
+    NLTKWordTokenizer se devuelve como un token; el resto pasa por las mismas reglas de NLTK
+    aplicadas solo a esa palabra (con caché, porque se repiten mucho). El final de la oración,
+    donde NLTK separa el punto, se trata aparte.
+
+    Además de 'linea' y 'tokens', cada oración incluye 'posiciones': el inicio y el fin de cada
+    token en el texto recibido, alternados en un array de enteros (inicio0, fin0, inicio1, ...).
+    """
+    def __init__(self, segmentador=None):
+        """
+        Args:
+            segmentador: PunktSentenceTokenizer con los parámetros a usar (por defecto, el de sent_tokenize)
+        """
+        self._segmentador = None
+        # Decisiones de Punkt ya tomadas, por contexto (las abreviaturas se repiten mucho en un texto)
+        self._decisiones = {}
+        if segmentador is not None:
+            self._configurar(segmentador)
+
+    @property
+    def segmentador(self):
+        if self._segmentador is None:
+            self._configurar(segmentador_oraciones())
+        return self._segmentador
+
+    def _configurar(self, segmentador):
+        # Conjuntos de Punkt que deciden los casos rápidos
+        parametros = segmentador._params
+        self._abreviaturas = frozenset(parametros.abbrev_types)
+        self._colocaciones = frozenset(primera for primera, _ in parametros.collocations)
+        self._segmentador = segmentador
+        self._decisiones.clear()
+
+    def tokenizar(self, texto: str) -> list[dict]:
+        resultado = []
+        for inicio, fin in self.oraciones(texto):
+            posiciones = []
+            tokens = self.palabras(texto, inicio, fin, posiciones)
+            # Una tupla por token ocuparía más que el propio token: se guardan en una columna de enteros
+            resultado.append({'linea': texto[inicio:fin], 'tokens': tokens,
+                              'posiciones': array('l', chain.from_iterable(posiciones))})
+        return resultado
+
+    def oraciones(self, texto: str):
+        """
+        Posiciones (inicio, fin) de las oraciones del texto, como PunktSentenceTokenizer.span_tokenize.
+        """
+        realineado = 0
+        anterior = None
+        for siguiente in self._cortes(texto):
+            if anterior is not None:
+                inicio, fin = anterior[0] + realineado, anterior[1]
+                cierre = REALINEACION.match(texto, siguiente[0], siguiente[1])
+                if cierre:
+                    yield inicio, siguiente[0] + len(cierre.group(0).rstrip())
+                    realineado = cierre.end() - siguiente[0]
+                else:
+                    realineado = 0
+                    if inicio < fin:
+                        yield inicio, fin
+            anterior = siguiente
+        if anterior is not None and anterior[0] + realineado < anterior[1]:
+            yield anterior[0] + realineado, anterior[1]
+
+    def _cortes(self, texto: str):
+        """
+        Trozos entre finales de oración confirmados, antes del realineado (PunktSentenceTokenizer._slices_from_text).
+        """
+        segmentador = self.segmentador
+        abreviaturas, colocaciones = self._abreviaturas, self._colocaciones
+        ultimo_corte = 0
+        for final, inicio_palabra in self._finales_posibles(texto):
+            palabra = texto[inicio_palabra:final.start()]
+            if final.group() != '.':
+                # '?' y '!' son siempre final si les sigue algo
+                es_final = True
+            elif final.group('next_tok') and PALABRA_ALFABETICA.fullmatch(palabra) and \
+                    palabra.lower() not in abreviaturas and palabra.lower() not in colocaciones:
+                # Palabra normal seguida de otra: Punkt la marca como final sin más heurísticas
+                es_final = True
+            else:
+                contexto = palabra + final.group() + final.group('after_tok')
+                es_final = self._decisiones.get(contexto)
+                if es_final is None:
+                    if len(self._decisiones) >= LIMITE_DECISIONES:
+                        self._decisiones.clear()
+                    es_final = self._decisiones[contexto] = segmentador.text_contains_sentbreak(contexto)
+            if es_final:
+                yield ultimo_corte, final.end()
+                ultimo_corte = final.start('next_tok') if final.group('next_tok') else final.end()
+        yield ultimo_corte, len(texto.rstrip())
+
+    @staticmethod
+    def _finales_posibles(texto: str):
+        """
+        Posibles finales de oración con el inicio de la palabra que los precede, descartando los que
+        se solapan con el siguiente (PunktSentenceTokenizer._match_potential_end_contexts).
+        """
+        anterior = None
+        inicio_anterior = fin_anterior = 0
+        for final in CONTEXTO_FINAL.finditer(texto):
+            blanco = _ultimo_blanco(texto, fin_anterior, final.start())
+            inicio_palabra = blanco + 1 if blanco > fin_anterior else inicio_anterior
+            if anterior and fin_anterior <= inicio_palabra:
+                yield anterior, inicio_anterior
+            anterior, inicio_anterior, fin_anterior = final, inicio_palabra, final.start()
+        if anterior:
+            yield anterior, inicio_anterior
+
+    @staticmethod
+    def palabras(texto: str, inicio: int, fin: int, posiciones: list) -> list[str]:
+        """
+        Tokens de la oración texto[inicio:fin], como NLTKWordTokenizer.tokenize.
+        Añade a posiciones el (inicio, fin) de cada token en el texto.
+        """
+        # El trozo final (desde la palabra con el punto final hasta el fin de la oración) se trata entero
+        punto = _punto_final(texto, inicio, fin)
+        limite = max(_ultimo_blanco(texto, inicio, punto) + 1, inicio) if punto >= 0 else fin
+
+        tokens = []
+        # Las contracciones inglesas (gonna, cannot...) se separan aunque no lleven puntuación:
+        # en esas oraciones (raras) todas las palabras pasan por las reglas de NLTK
+        palabras = NO_BLANCOS if _tiene_contracciones(texto, inicio, limite) else PALABRAS
+        for palabra in palabras.finditer(texto, inicio, limite):
+            if palabra.lastgroup:
+                tokens += palabra.group().split()
+                posiciones += [simple.span() for simple in NO_BLANCOS.finditer(texto, *palabra.span())]
+                continue
+            # El carácter en blanco anterior cuenta para las reglas de comillas de apertura
+            desde = palabra.start() - 1 if palabra.start() > inicio else inicio
+            _extender(tokens, posiciones, texto[desde:palabra.end()], desde, False)
+        if punto >= 0:
+            desde = limite - 1 if limite > inicio else inicio
+            _extender(tokens, posiciones, texto[desde:fin], desde, True)
+        return tokens
+
+def _extender(tokens: list, posiciones: list, trozo: str, desplazamiento: int, con_punto_final: bool) -> None:
+    """
+    Añade los tokens de un trozo de oración y sus posiciones (desplazadas al texto completo).
+    """
+    tokens_trozo, posiciones_trozo = _tokenizar_trozo(trozo, con_punto_final)
+    tokens.extend(tokens_trozo)
+    posiciones += [(desplazamiento + inicio, desplazamiento + fin) for inicio, fin in posiciones_trozo]
+
+MOTORES = {'nltk': MotorNLTK, 'regex': MotorRegex}
@@ -1,9 +1,9 @@
 #Importacion de las librerias necesarias:
 
 #Librerias internas de python
-from nltk.tokenize import word_tokenize, sent_tokenize
 from abc import ABC, abstractmethod
 #Importacion de los modulos desarrollados en el proyecto
+from procesado_datos.motores_tokenizacion import MotorTokenizacion, MOTORES
 
 
 # Segunda clase: ProcesadoDatos
@@ -15,8 +15,14 @@ class ProcesadoDatos(ABC):
 
 class ObtenerTokens(ProcesadoDatos):
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, motor='nltk'):
+        """
+        Args:
+            logger: Logger opcional
+            motor: Motor de tokenización: 'nltk', 'regex' (ver motores_tokenizacion) o una instancia de MotorTokenizacion
+        """
         self.logger = logger
+        self.motor = motor if isinstance(motor, MotorTokenizacion) else MOTORES[motor]()
     # Método estático para procesar un texto completo, segmentándolo en líneas y clasificando cada token con su idioma, 
     # aplicando reglas especiales para tokens protegidos por comillas o paréntesis.
     def procesar(self, texto: str) -> list[dict]:
@@ -24,12 +30,7 @@ class ObtenerTokens(ProcesadoDatos):
         if not isinstance(texto, str) or not texto.strip():
             return []
         texto = texto.replace('\n', ' ')
-        oraciones = sent_tokenize(texto)
-        resultado = []
-        for oracion in oraciones:
-            tokens = word_tokenize(oracion)
-            resultado.append({'linea': oracion, 'tokens': tokens})
-        return resultado
+        return self.motor.tokenizar(texto)
     
 class MarcarSilencios(ProcesadoDatos):
     def __init__(self, signos_silencio=None, logger=None):
@@ -42,17 +43,13 @@ class MarcarSilencios(ProcesadoDatos):
         resultado = []
         for segmento in segmentos:
             tokens_limpios = segmento['tokens_limpios']
-            tokens_con_silencio = []
             for token_info in tokens_limpios:
-                token = token_info['token']
-                es_silencio = token in self.signos_silencio and token_info.get('es_puntuacion', True)
+                token = token_info.token
+                es_silencio = token in self.signos_silencio and token_info.es_puntuacion
                 tiempo_silencio = self.signos_silencio.get(token, 0) if es_silencio else 0
-                # Añadir campos de silencio en cada token
-                token_info_con_silencio = {**token_info, 
-                                           'silencio': es_silencio, 
-                                           'tiempo': tiempo_silencio}
-                tokens_con_silencio.append(token_info_con_silencio)
-            resultado.append({'linea': segmento['linea'], 'tokens_limpios': tokens_con_silencio})
+                # Añadir campos de silencio en cada token (en el propio token, sin copiarlo)
+                token_info.marcar_silencio(es_silencio, tiempo_silencio)
+            resultado.append({'linea': segmento['linea'], 'tokens_limpios': tokens_limpios})
         return resultado
     
 class AgruparProtegidos(ProcesadoDatos):
@@ -66,8 +63,8 @@ class AgruparProtegidos(ProcesadoDatos):
         delimitadores_abre = {'(', '[', '{', '"', "'"}
         delimitadores_cierra = {')':'(', ']':'[', '}':'{', '"':'"', "'":"'"}
         while i < len(tokens_limpios):
-            token = tokens_limpios[i]['token']
             token_info = tokens_limpios[i]
+            token = token_info.token
             if token in delimitadores_abre:
                 stack.append({'abre': token, 'cierra': {'(':')', '[':']', '{':'}', '"':'"', "'":"'"}[token], 'tokens': []})
                 i += 1
@@ -82,16 +79,18 @@ class AgruparProtegidos(ProcesadoDatos):
                         grupos.append(grupo)
                     i += 1
                 else:
+                    token_info.marcar_protegido(False)
                     if stack:
-                        stack[-1]['tokens'].append({**token_info, 'protegido': False})
+                        stack[-1]['tokens'].append(token_info)
                     else:
-                        grupos.append({**token_info, 'protegido': False})
+                        grupos.append(token_info)
                     i += 1
             else:
+                token_info.marcar_protegido(False)
                 if stack:
-                    stack[-1]['tokens'].append({**token_info, 'protegido': False})
+                    stack[-1]['tokens'].append(token_info)
                 else:
-                    grupos.append({**token_info, 'protegido': False})
+                    grupos.append(token_info)
                 i += 1
         while stack:
             bloque = stack.pop()
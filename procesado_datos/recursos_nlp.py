@@ -0,0 +1,197 @@
+"""
+Paquete precompilado de recursos de NLP para la fase 2.
+
+Reúne en un único archivo las stopwords de NLTK, los parámetros del segmentador de oraciones
+Punkt y el modelo de langid reducido a español e inglés, para que el procesado funcione sin
+red y arranque en milisegundos (el modelo completo de langid tarda segundos en descomprimirse).
+
+Formato del archivo:
+    FIRMA | longitud de la cabecera (uint32) | cabecera JSON | matrices alineadas a 8 bytes
+La cabecera contiene las stopwords, los parámetros de Punkt y la descripción (desplazamiento,
+tipo, forma) de cada matriz de langid. Al cargar, el archivo se mapea en memoria y las matrices
+se usan directamente sobre el mapa, sin copiarlas.
+
+Construcción (en una máquina con los datos de NLTK descargados):
+    python -m procesado_datos.recursos_nlp [ruta_salida]
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from functools import lru_cache
+from typing import Optional
+
+FIRMA = b"RNLP\x01"
+RUTA_PAQUETE_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recursos_nlp.bin")
+VARIABLE_RUTA = "RECURSOS_NLP"  # Variable de entorno para usar otro paquete
+IDIOMAS_STOPWORDS = ('spanish', 'english')
+IDIOMAS_PUNKT = ('english',)  # sent_tokenize usa el modelo inglés por defecto
+IDIOMAS_LANGID = ('es', 'en')
+ALINEACION = 8
+
+def construir_paquete(ruta=RUTA_PAQUETE_DEFAULT, idiomas_stopwords=IDIOMAS_STOPWORDS, idiomas_punkt=IDIOMAS_PUNKT,
+                      idiomas_langid=IDIOMAS_LANGID) -> int:
+    """
+    Genera el paquete a partir de los datos de NLTK instalados y del modelo incluido en langid.
+    Args:
+        ruta: Archivo de salida
+        idiomas_stopwords: Listas de stopwords de NLTK que se incluyen
+        idiomas_punkt: Modelos de Punkt (punkt_tab) que se incluyen
+        idiomas_langid: Idiomas a los que se reduce el modelo de langid
+    Returns: Tamaño del paquete en bytes
+    Raises: LookupError si faltan datos de NLTK (nltk.download('stopwords'), nltk.download('punkt_tab'))
+    """
+    import numpy as np
+    from nltk.corpus import stopwords
+    from nltk.tokenize.punkt import PunktTokenizer
+    from langid import langid
+
+    cabecera = {'stopwords': {idioma: sorted(stopwords.words(idioma)) for idioma in idiomas_stopwords},
+                'punkt': {}}
+    for idioma in idiomas_punkt:
+        parametros = PunktTokenizer(idioma)._params
+        cabecera['punkt'][idioma] = {
+            'abbrev_types': sorted(parametros.abbrev_types),
+            'collocations': sorted(parametros.collocations),
+            'sent_starters': sorted(parametros.sent_starters),
+            'ortho_context': dict(parametros.ortho_context)}
+
+    # Modelo de langid reducido a las columnas de los idiomas elegidos (igual que set_languages)
+    identificador = langid.LanguageIdentifier.from_modelstring(langid.model)
+    identificador.set_languages(list(idiomas_langid))
+    estados = sorted(identificador.tk_output)
+    inicios = np.zeros(len(estados) + 1, dtype=np.uint32)
+    indices = []
+    for posicion, estado in enumerate(estados):
+        indices.extend(identificador.tk_output[estado])
+        inicios[posicion + 1] = len(indices)
+    siguiente = np.asarray(identificador.tk_nextmove)
+    matrices = {
+        'nb_ptc': np.ascontiguousarray(identificador.nb_ptc),
+        'nb_pc': np.ascontiguousarray(identificador.nb_pc),
+        'tk_nextmove': siguiente.astype(np.uint16 if siguiente.max() < 2 ** 16 else np.uint32),
+        'tk_estados': np.asarray(estados, dtype=np.uint32),
+        'tk_inicios': inicios,
+        'tk_indices': np.asarray(indices, dtype=np.uint32)}
+    cabecera['langid'] = {'clases': list(identificador.nb_classes), 'nb_numfeats': identificador.nb_numfeats,
+                          'matrices': {}}
+
+    # Los desplazamientos dependen del tamaño de la cabecera, que a su vez los contiene:
+    # se reserva espacio suficiente y se rellena con espacios
+    datos_cabecera = b""
+    reserva = 0
+    while True:
+        desplazamiento = _alinear(len(FIRMA) + 4 + reserva)
+        for nombre, matriz in matrices.items():
+            cabecera['langid']['matrices'][nombre] = [desplazamiento, matriz.dtype.str, list(matriz.shape)]
+            desplazamiento = _alinear(desplazamiento + matriz.nbytes)
+        datos_cabecera = json.dumps(cabecera, ensure_ascii=False).encode("utf-8")
+        if len(datos_cabecera) <= reserva:
+            break
+        reserva = len(datos_cabecera) + 1024
+    datos_cabecera = datos_cabecera.ljust(reserva)
+
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as salida:
+        salida.write(FIRMA + struct.pack("<I", reserva) + datos_cabecera)
+        for nombre, matriz in matrices.items():
+            salida.write(b"\0" * (cabecera['langid']['matrices'][nombre][0] - salida.tell()))
+            salida.write(matriz.tobytes())
+        tamano = salida.tell()
+    os.replace(temporal, ruta)
+    return tamano
+
+def _alinear(posicion: int) -> int:
+    return (posicion + ALINEACION - 1) // ALINEACION * ALINEACION
+
+class PaqueteRecursosNLP:
+    """
+    Acceso a un paquete de recursos ya construido. Cada recurso se materializa la primera vez
+    que se pide y se reutiliza después.
+    """
+    def __init__(self, ruta=RUTA_PAQUETE_DEFAULT):
+        """
+        Args: ruta: Archivo generado con construir_paquete()
+        Raises: OSError si no se puede abrir, ValueError si no es un paquete válido
+        """
+        self.ruta = ruta
+        with open(ruta, "rb") as archivo:
+            # El mapa sigue siendo válido tras cerrar el archivo y lo comparten todas las matrices
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mapa[:len(FIRMA)] != FIRMA:
+            raise ValueError(f"{ruta} no es un paquete de recursos NLP")
+        inicio = len(FIRMA) + 4
+        longitud, = struct.unpack_from("<I", self._mapa, len(FIRMA))
+        self._cabecera = json.loads(self._mapa[inicio:inicio + longitud])
+        self._stopwords = {}
+        self._punkt = {}
+        self._langid = None
+
+    def stopwords(self, idioma: str) -> frozenset:
+        """
+        Stopwords de un idioma ('spanish', 'english').
+        Raises: LookupError si el idioma no está en el paquete
+        """
+        if idioma not in self._stopwords:
+            if idioma not in self._cabecera['stopwords']:
+                raise LookupError(f"Stopwords '{idioma}' no incluidas en {self.ruta}")
+            self._stopwords[idioma] = frozenset(self._cabecera['stopwords'][idioma])
+        return self._stopwords[idioma]
+
+    def segmentador_oraciones(self, idioma: str = 'english'):
+        """
+        Segmentador Punkt del idioma, equivalente al que usa nltk.sent_tokenize.
+        Raises: LookupError si el idioma no está en el paquete
+        """
+        if idioma not in self._punkt:
+            if idioma not in self._cabecera['punkt']:
+                raise LookupError(f"Modelo Punkt '{idioma}' no incluido en {self.ruta}")
+            from nltk.tokenize.punkt import PunktParameters, PunktSentenceTokenizer
+            datos = self._cabecera['punkt'][idioma]
+            parametros = PunktParameters()
+            parametros.abbrev_types = set(datos['abbrev_types'])
+            parametros.collocations = {tuple(par) for par in datos['collocations']}
+            parametros.sent_starters = set(datos['sent_starters'])
+            parametros.ortho_context.update(datos['ortho_context'])
+            self._punkt[idioma] = PunktSentenceTokenizer(parametros)
+        return self._punkt[idioma]
+
+    def identificador_idioma(self):
+        """
+        langid.LanguageIdentifier con el modelo reducido, construido sobre el mapa sin copiar las matrices.
+        Tiene la misma interfaz (classify, rank) que el identificador global de langid.
+        """
+        if self._langid is None:
+            import numpy as np
+            from langid.langid import LanguageIdentifier
+            datos = self._cabecera['langid']
+            matrices = {nombre: np.frombuffer(self._mapa, dtype=tipo, count=int(np.prod(forma)),
+                                              offset=desplazamiento).reshape(forma)
+                        for nombre, (desplazamiento, tipo, forma) in datos['matrices'].items()}
+            inicios = matrices['tk_inicios'].tolist()
+            indices = matrices['tk_indices'].tolist()
+            salidas = {estado: tuple(indices[inicios[posicion]:inicios[posicion + 1]])
+                       for posicion, estado in enumerate(matrices['tk_estados'].tolist())}
+            # memoryview indexa enteros más rápido que una matriz de numpy en el bucle por byte de langid
+            desplazamiento = datos['matrices']['tk_nextmove'][0]
+            siguiente = memoryview(self._mapa)[desplazamiento:desplazamiento + matrices['tk_nextmove'].nbytes]
+            siguiente = siguiente.cast(matrices['tk_nextmove'].dtype.char)
+            self._langid = LanguageIdentifier(matrices['nb_ptc'], matrices['nb_pc'], datos['nb_numfeats'],
+                                              datos['clases'], siguiente, salidas)
+        return self._langid
+
+@lru_cache(maxsize=None)
+def cargar_paquete(ruta: Optional[str] = None) -> Optional[PaqueteRecursosNLP]:
+    """
+    Paquete de recursos compartido del proceso, o None si no está construido.
+    Args: ruta: Archivo del paquete (por defecto, la variable de entorno RECURSOS_NLP o RUTA_PAQUETE_DEFAULT)
+    """
+    ruta = ruta or os.environ.get(VARIABLE_RUTA) or RUTA_PAQUETE_DEFAULT
+    if not os.path.exists(ruta):
+        return None
+    return PaqueteRecursosNLP(ruta)
+
+if __name__ == "__main__":
+    destino = sys.argv[1] if len(sys.argv) > 1 else RUTA_PAQUETE_DEFAULT
+    print(f"Paquete de recursos NLP: {destino} ({construir_paquete(destino) / 1024:.0f} KiB)")
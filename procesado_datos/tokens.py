@@ -0,0 +1,135 @@
+"""
+Representación compacta de los tokens de la fase 2.
+
+Cada token es un único objeto con __slots__ que las etapas (limpieza, silencios, agrupación de
+protegidos, idioma) completan en el sitio, en lugar de un dict nuevo por etapa. El texto del
+token se interna (todas las apariciones de "de" comparten la misma cadena) y los campos
+booleanos se guardan en un entero de banderas.
+
+Token es además un Mapping de solo lectura con las mismas claves que tenía el dict de cada
+etapa ('token', 'es_palabra', 'es_puntuacion', 'silencio', 'tiempo', 'protegido',
+'idioma_token', 'conf_token'), así que los consumidores que usan token['token'] o
+token.get('idioma_token') (ConvertidorTextoVoz, los logs) no cambian. La igualdad y el hash
+son por identidad, no los de Mapping: cada aparición es un token distinto aunque tenga el
+mismo texto, y los tokens pueden ir en conjuntos o ser claves de un dict.
+"""
+import sys
+from collections.abc import Mapping
+
+# Valores de los campos booleanos
+ES_PALABRA = 1
+ES_PUNTUACION = 2
+SILENCIO = 4
+PROTEGIDO = 8
+# Etapas por las que ha pasado el token (qué claves tiene su vista de dict)
+CON_SILENCIO = 16
+CON_PROTEGIDO = 32
+CON_IDIOMA = 64
+
+class Token(Mapping):
+    """
+    Token de la fase 2 con vista de dict.
+    """
+    __slots__ = ('token', 'banderas', 'tiempo', 'idioma_token', 'conf_token')
+
+    def __init__(self, token: str, banderas: int = 0):
+        """
+        Args:
+            token: Texto limpio del token (se interna)
+            banderas: Combinación de ES_PALABRA y ES_PUNTUACION
+        """
+        self.token = sys.intern(token)
+        self.banderas = banderas
+        self.tiempo = 0
+        self.idioma_token = None
+        self.conf_token = 0.0
+
+    @property
+    def es_palabra(self) -> bool:
+        return bool(self.banderas & ES_PALABRA)
+
+    @property
+    def es_puntuacion(self) -> bool:
+        return bool(self.banderas & ES_PUNTUACION)
+
+    @property
+    def silencio(self) -> bool:
+        return bool(self.banderas & SILENCIO)
+
+    @property
+    def protegido(self) -> bool:
+        return bool(self.banderas & PROTEGIDO)
+
+    def marcar_silencio(self, es_silencio: bool, tiempo: int) -> None:
+        """
+        Etapa de MarcarSilencios: si el token es una pausa y su duración en ms.
+        """
+        self.banderas = (self.banderas & ~SILENCIO) | CON_SILENCIO | (SILENCIO if es_silencio else 0)
+        self.tiempo = tiempo
+
+    def marcar_protegido(self, protegido: bool) -> None:
+        """
+        Etapa de AgruparProtegidos.
+        """
+        self.banderas = (self.banderas & ~PROTEGIDO) | CON_PROTEGIDO | (PROTEGIDO if protegido else 0)
+
+    def marcar_idioma(self, idioma: str, confianza: float) -> None:
+        """
+        Etapa de detección de idioma.
+        """
+        self.banderas |= CON_IDIOMA
+        self.idioma_token = idioma
+        self.conf_token = confianza
+
+    # Vista de dict
+    def _claves(self):
+        yield 'token'
+        yield 'es_palabra'
+        yield 'es_puntuacion'
+        if self.banderas & CON_SILENCIO:
+            yield 'silencio'
+            yield 'tiempo'
+        if self.banderas & CON_PROTEGIDO:
+            yield 'protegido'
+        if self.banderas & CON_IDIOMA:
+            yield 'idioma_token'
+            yield 'conf_token'
+
+    def __getitem__(self, clave):
+        if clave in CLAVES and (CLAVES[clave] == 0 or self.banderas & CLAVES[clave]):
+            return getattr(self, clave)
+        raise KeyError(clave)
+
+    def __setitem__(self, clave, valor):
+        # Compatibilidad con el código que completaba el dict: token['idioma_token'] = ...
+        if clave == 'silencio':
+            self.marcar_silencio(valor, self.tiempo)
+        elif clave == 'tiempo':
+            self.marcar_silencio(self.silencio, valor)
+        elif clave == 'protegido':
+            self.marcar_protegido(valor)
+        elif clave == 'idioma_token':
+            self.marcar_idioma(valor, self.conf_token)
+        elif clave == 'conf_token':
+            self.marcar_idioma(self.idioma_token, valor)
+        else:
+            raise KeyError(clave)
+
+    def __iter__(self):
+        return self._claves()
+
+    def __len__(self):
+        return sum(1 for _ in self._claves())
+
+    # Mapping compara por valor y anula el hash; un token es un objeto con identidad propia
+    def __eq__(self, otro):
+        return self is otro
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return f"Token({dict(self)!r})"
+
+# Clave de la vista de dict -> bandera de la etapa que la añade (0: siempre presente)
+CLAVES = {'token': 0, 'es_palabra': 0, 'es_puntuacion': 0, 'silencio': CON_SILENCIO, 'tiempo': CON_SILENCIO,
+          'protegido': CON_PROTEGIDO, 'idioma_token': CON_IDIOMA, 'conf_token': CON_IDIOMA}